@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any, Dict, Sequence
+
 import numpy as np
 from sklearn.base import BaseEstimator
 
@@ -9,19 +11,80 @@ from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_EPSILONS = (0.05, 0.1, 0.2)
+REFERENCE_EPSILON = 0.1
+DEFAULT_DRAWS = 8
+MAX_STACKED_ROWS = 1_000_000
+
 
 class AdversarialTester:
-    """Simulate adversarial perturbations and score robustness."""
+    """Simulate adversarial perturbations and score robustness.
 
-    def score(self, model: BaseEstimator, X: np.ndarray, y_true: np.ndarray) -> float:
-        """Estimate robustness by adding noise and comparing predictions to ground truth."""
+    Every epsilon reuses the same ``draws`` seeded Gaussian noise tensors, so results
+    are reproducible and comparable across epsilons. All perturbed copies are stacked
+    and scored with a single ``predict`` call; rows are subsampled when the stack
+    would exceed ``MAX_STACKED_ROWS``.
+    """
+
+    def __init__(
+        self,
+        epsilons: Sequence[float] = DEFAULT_EPSILONS,
+        draws: int = DEFAULT_DRAWS,
+        seed: int = 42,
+    ) -> None:
+        self.epsilons = tuple(epsilons)
+        self.draws = draws
+        self.seed = seed
+
+    def evaluate(
+        self,
+        model: BaseEstimator,
+        X: np.ndarray,
+        y_true: np.ndarray,
+        epsilons: Sequence[float] = (),
+    ) -> Dict[str, Any]:
+        """Return mean and minimum accuracy over the noise draws for each epsilon."""
+
+        epsilons = np.asarray(epsilons or self.epsilons, dtype=float)
+        rng = np.random.default_rng(self.seed)
+        X = np.asarray(X, dtype=float)
+        y_true = np.asarray(y_true)
+        max_rows = max(1, MAX_STACKED_ROWS // (len(epsilons) * self.draws))
+        if len(X) > max_rows:
+            keep = np.sort(rng.choice(len(X), size=max_rows, replace=False))
+            X, y_true = X[keep], y_true[keep]
 
-        noise = np.random.normal(0, 0.1, size=X.shape)
-        perturbed = X + noise
+        noise = rng.standard_normal((self.draws, *X.shape))
+        stacked = X + epsilons[:, None, None, None] * noise
         try:
-            preds = model.predict(perturbed)
-            robustness = float((preds == y_true).mean())
+            preds = model.predict(stacked.reshape(-1, X.shape[1]))
+            correct = preds.reshape(len(epsilons), self.draws, len(X)) == y_true
+            accuracy = correct.mean(axis=2)
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.error("Adversarial test failed: %s", exc)
-            robustness = 0.0
-        return robustness
+            accuracy = np.zeros((len(epsilons), self.draws))
+        return {
+            "draws": self.draws,
+            "seed": self.seed,
+            "rows": len(X),
+            "per_epsilon": {
+                str(float(eps)): {"mean": float(row.mean()), "min": float(row.min())}
+                for eps, row in zip(epsilons, accuracy)
+            },
+        }
+
+    @staticmethod
+    def summary_score(report: Dict[str, Any]) -> float:
+        """Collapse a report to the mean at ``REFERENCE_EPSILON`` (worst mean if absent)."""
+
+        per_epsilon = report["per_epsilon"]
+        reference = per_epsilon.get(str(REFERENCE_EPSILON))
+        if reference is not None:
+            return reference["mean"]
+        return min(stats["mean"] for stats in per_epsilon.values())
+
+    def score(self, model: BaseEstimator, X: np.ndarray, y_true: np.ndarray) -> float:
+        """Estimate robustness as mean accuracy under noise of scale ``REFERENCE_EPSILON``."""
+
+        report = self.evaluate(model, X, y_true, epsilons=(REFERENCE_EPSILON,))
+        return report["per_epsilon"][str(REFERENCE_EPSILON)]["mean"]
@@ -0,0 +1,179 @@
+"""Materialized dashboard snapshot served with ETags."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from backend.engines.drift_detector import DriftDetector
+from backend.engines.model_registry import ModelRegistry
+from backend.engines.registry_store import ModelRecord
+from backend.utils.logger import get_logger
+from backend.utils.metrics import timed
+
+logger = get_logger(__name__)
+
+DRIFT_SCORE_DECIMALS = 2
+DRIFT_REFRESH_SECONDS = float(os.getenv("MLOPS_DASHBOARD_DRIFT_REFRESH_SECONDS", "5"))
+ETAG_HEX_CHARS = 32
+RUN_DEPLOYED = "deployed"
+RUN_APPROVED = "approved"
+RUN_PENDING = "pending_approval"
+
+StateKey = Tuple[Hashable, int]
+PayloadRenderer = Callable[[Dict[str, Any]], bytes]
+
+
+def _render_json(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def run_summary(model: ModelRecord, deployed_run_id: Optional[str]) -> Dict[str, Any]:
+    """Project a registry record onto the fields the dashboard renders.
+
+    Baseline profiles, signatures and report blobs stay out of the payload, so the
+    poll body and its ETag digest grow by a few hundred bytes per run at most.
+    """
+
+    deployed = model.run_id == deployed_run_id
+    if deployed:
+        status = RUN_DEPLOYED
+    else:
+        status = RUN_APPROVED if model.approved else RUN_PENDING
+    trained_at = model.metadata.get("trained_at")
+    return {
+        "run_id": model.run_id,
+        "status": status,
+        "deployed": deployed,
+        "metrics": model.metrics,
+        "trained_at": float(trained_at) if trained_at else None,
+        "training_mode": model.metadata.get("training_mode"),
+        "parent_run_id": model.metadata.get("parent_run_id"),
+    }
+
+
+@dataclass
+class DashboardSnapshot:
+    state: StateKey
+    drift_score: float
+    body: bytes
+    etag: str
+    built_at: float
+    drift_checked_at: float
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an ``If-None-Match`` header against ``etag`` (weak comparison)."""
+
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class DashboardSnapshotCache:
+    """Rebuild the dashboard payload only when registry, deployment or drift state moves.
+
+    Registry changes (approvals, deployments) and drift baseline changes rebuild the
+    snapshot on the next poll. The drift window score moves with almost every
+    prediction, so it is re-read at most once per ``DRIFT_REFRESH_SECONDS`` and
+    compared at ``DRIFT_SCORE_DECIMALS`` decimals; an unchanged poll under prediction
+    traffic therefore costs one registry version check. The response body is
+    rendered once per build, and its ETag is a digest of that body.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        drift_detector: DriftDetector,
+        render: PayloadRenderer = _render_json,
+    ) -> None:
+        self.registry = registry
+        self.drift_detector = drift_detector
+        self.render = render
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.not_modified = 0
+
+    def _state(self) -> StateKey:
+        return (self.registry.version(), self.drift_detector.baseline_version)
+
+    def _drift_score(self) -> float:
+        return round(self.drift_detector.window_score(), DRIFT_SCORE_DECIMALS)
+
+    def _fresh(self, snapshot: Optional[DashboardSnapshot], state: StateKey) -> bool:
+        """Return whether ``snapshot`` still describes ``state`` and the drift window."""
+
+        if snapshot is None or snapshot.state != state:
+            return False
+        now = time.monotonic()
+        if now - snapshot.drift_checked_at < DRIFT_REFRESH_SECONDS:
+            return True
+        if self._drift_score() != snapshot.drift_score:
+            return False
+        snapshot.drift_checked_at = now
+        return True
+
+    def _build(self, state: StateKey) -> DashboardSnapshot:
+        drift_score = self._drift_score()
+        models = self.registry.list_models()
+        deployed = self.registry.deployed_model()
+        deployed_run_id = deployed.run_id if deployed else None
+        payload: Dict[str, Any] = {
+            "registry": [run_summary(model, deployed_run_id) for model in models],
+            "latest_metrics": (
+                json.loads(deployed.metadata.get("metrics", "{}")) if deployed else {}
+            ),
+            "drift_score": drift_score,
+            "approvals": [model.run_id for model in models if model.approved],
+            "deployed_run_id": deployed_run_id,
+        }
+        body = self.render(payload)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:ETAG_HEX_CHARS]}"'
+        return DashboardSnapshot(
+            state=state,
+            drift_score=drift_score,
+            body=body,
+            etag=etag,
+            built_at=time.time(),
+            drift_checked_at=time.monotonic(),
+        )
+
+    def current(self) -> DashboardSnapshot:
+        """Return the snapshot for the current state, rebuilding it if that state moved."""
+
+        state = self._state()
+        snapshot = self._snapshot
+        if self._fresh(snapshot, state):
+            self.hits += 1
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if self._fresh(snapshot, state):
+                self.hits += 1
+            else:
+                with timed("dashboard", "build"):
+                    snapshot = self._build(state)
+                self._snapshot = snapshot
+                self.builds += 1
+        return snapshot
+
+    def record_not_modified(self) -> None:
+        self.not_modified += 1
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "builds": self.builds,
+            "hits": self.hits,
+            "not_modified": self.not_modified,
+            "etag": snapshot.etag if snapshot else None,
+            "built_at": snapshot.built_at if snapshot else None,
+        }
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel, validator
 
-from backend.utils.hash_utils import fingerprint_dataset
+from backend.engines.pii_scanner import PIIReport, PIIScanner
+from backend.utils.dataset_io import DEFAULT_CHUNK_ROWS, iter_dataset_chunks
+from backend.utils.hash_utils import FINGERPRINT_SCHEME, DatasetFingerprinter
 from backend.utils.logger import audit_event, get_logger
+from backend.utils.metrics import StageTimer
 
 ANOMALY_Z_THRESHOLD = 3
+MAX_REPORTED_ROWS = 5
+LABEL_VALUES = (0, 1)
 
 logger = get_logger(__name__)
 
@@ -27,11 +33,133 @@ class InputRecord(BaseModel):
 
     @validator("label")
     def validate_label(cls, value: int) -> int:
-        if value not in (0, 1):
+        if value not in LABEL_VALUES:
             raise ValueError("label must be 0 or 1")
         return value
 
 
+@dataclass
+class SchemaReport:
+    """Columnar schema check outcome that can be merged across dataset chunks."""
+
+    missing_columns: List[str] = field(default_factory=list)
+    violation_counts: Dict[str, int] = field(default_factory=dict)
+    violation_rows: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, problem: str, mask: np.ndarray, row_offset: int) -> None:
+        """Record rows flagged by ``mask`` under ``problem``, keeping the first few indices."""
+
+        count = int(mask.sum())
+        if not count:
+            return
+        self.violation_counts[problem] = self.violation_counts.get(problem, 0) + count
+        rows = self.violation_rows.setdefault(problem, [])
+        if len(rows) < MAX_REPORTED_ROWS:
+            offending = np.flatnonzero(mask)[: MAX_REPORTED_ROWS - len(rows)] + row_offset
+            rows.extend(int(row) for row in offending)
+
+    def merge(self, other: "SchemaReport") -> None:
+        """Fold another chunk's report into this one."""
+
+        for column in other.missing_columns:
+            if column not in self.missing_columns:
+                self.missing_columns.append(column)
+        for problem, count in other.violation_counts.items():
+            self.violation_counts[problem] = self.violation_counts.get(problem, 0) + count
+            rows = self.violation_rows.setdefault(problem, [])
+            rows.extend(other.violation_rows[problem][: MAX_REPORTED_ROWS - len(rows)])
+
+    def issues(self) -> List[str]:
+        """Render the report as ``ValidationResult.issues`` entries."""
+
+        issues = []
+        if self.missing_columns:
+            issues.append(
+                f"Schema validation failed: missing required columns {self.missing_columns}"
+            )
+        for problem, count in self.violation_counts.items():
+            rows = self.violation_rows[problem]
+            issues.append(
+                f"Schema validation failed: {problem} in {count} rows (first rows {rows})"
+            )
+        return issues
+
+
+def check_schema(df: pd.DataFrame, row_offset: int = 0) -> SchemaReport:
+    """Validate ``df`` against ``InputRecord`` with whole-column operations."""
+
+    report = SchemaReport()
+    for name, model_field in InputRecord.__fields__.items():
+        if name not in df.columns:
+            report.missing_columns.append(name)
+            continue
+        series = df[name]
+        present = series.notna().to_numpy()
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            non_numeric = np.zeros(len(series), dtype=bool)
+        else:
+            coerced = pd.to_numeric(series, errors="coerce")
+            values = coerced.to_numpy(dtype=float, na_value=np.nan)
+            non_numeric = np.isnan(values) & present
+            report.add(f"column '{name}' has non-numeric values", non_numeric, row_offset)
+        finite = np.isfinite(values)
+        report.add(
+            f"column '{name}' has missing or non-finite values", ~finite & ~non_numeric, row_offset
+        )
+        if model_field.type_ is int:
+            integral = finite & (np.floor(values) == values)
+            report.add(f"column '{name}' has non-integer values", finite & ~integral, row_offset)
+            if name == "label":
+                allowed = np.isin(values, LABEL_VALUES)
+                report.add("label must be 0 or 1", integral & ~allowed, row_offset)
+    return report
+
+
+class RunningMoments:
+    """Per-column mean and population variance merged chunk by chunk (Welford/Chan)."""
+
+    def __init__(self, columns: List[str]) -> None:
+        self.columns = columns
+        self.count = np.zeros(len(columns))
+        self.mean = np.zeros(len(columns))
+        self.m2 = np.zeros(len(columns))
+
+    def _values(self, chunk: pd.DataFrame) -> np.ndarray:
+        frame = chunk.reindex(columns=self.columns).apply(pd.to_numeric, errors="coerce")
+        return frame.to_numpy(dtype=float)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Merge the statistics of ``chunk`` into the running totals, ignoring NaNs."""
+
+        values = self._values(chunk)
+        # inf cells give inf/nan moments rather than warnings; the schema check reports them.
+        with np.errstate(invalid="ignore", over="ignore"):
+            valid = ~np.isnan(values)
+            count = valid.sum(axis=0)
+            safe_count = np.maximum(count, 1)
+            mean = np.where(valid, values, 0.0).sum(axis=0) / safe_count
+            m2 = np.where(valid, (values - mean) ** 2, 0.0).sum(axis=0)
+            total = self.count + count
+            safe_total = np.maximum(total, 1)
+            delta = mean - self.mean
+            self.m2 = self.m2 + m2 + delta**2 * self.count * count / safe_total
+            self.mean = self.mean + delta * count / safe_total
+            self.count = total
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.m2 / np.maximum(self.count, 1))
+
+    def count_outliers(self, chunk: pd.DataFrame, threshold: float) -> int:
+        """Count values in ``chunk`` whose z-score against the running moments exceeds threshold."""
+
+        std = np.where(self.std == 0, 1e-6, self.std)
+        with np.errstate(invalid="ignore"):
+            z_scores = np.abs((self._values(chunk) - self.mean) / std)
+            return int((z_scores > threshold).sum())
+
+
 @dataclass
 class ValidationResult:
     is_valid: bool
@@ -40,35 +168,72 @@ class ValidationResult:
     risk_score: float
     recommended_actions: List[str]
     dataset_fingerprint: str
+    fingerprint_scheme: str = FINGERPRINT_SCHEME
+    pii_report: Dict[str, Any] = field(default_factory=dict)
 
 
 class DataValidator:
     """Perform schema checks, PII detection, anomaly detection and quality scoring."""
 
+    def __init__(self, pii_scanner: Optional[PIIScanner] = None) -> None:
+        self.pii_scanner = pii_scanner or PIIScanner()
+
     def validate(self, df: pd.DataFrame) -> ValidationResult:
         """Run schema checks, PII detection, anomaly detection, and quality scoring."""
 
+        return self._validate_chunks(lambda: iter([df]))
+
+    def validate_path(self, path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> ValidationResult:
+        """Validate an on-disk CSV/Parquet dataset with memory bounded by ``chunk_rows``.
+
+        The file is read twice: once for schema, PII, fingerprint and running moments,
+        and once more to count z-score anomalies against the final mean and deviation.
+        A PII sampling budget applies per chunk.
+        """
+
+        return self._validate_chunks(lambda: iter_dataset_chunks(path, chunk_rows))
+
+    def _validate_chunks(self, chunks: Callable[[], Iterable[pd.DataFrame]]) -> ValidationResult:
+        """Validate a dataset supplied as a re-iterable sequence of DataFrame chunks."""
+
         issues: List[str] = []
         recommended: List[str] = []
+        schema_report = SchemaReport()
+        pii_report = PIIReport()
+        fingerprinter = DatasetFingerprinter()
+        moments: Optional[RunningMoments] = None
+        timer = StageTimer("data_validator")
+        row_offset = 0
+        for chunk in chunks():
+            with timer.stage("schema"):
+                schema_report.merge(check_schema(chunk, row_offset))
+            with timer.stage("pii"):
+                pii_report.merge(self.pii_scanner.scan(chunk))
+            with timer.stage("fingerprint"):
+                fingerprinter.update(chunk)
+            with timer.stage("moments"):
+                if moments is None:
+                    numeric = chunk.select_dtypes(include=[np.number]).columns
+                    moments = RunningMoments(list(numeric))
+                moments.update(chunk)
+            row_offset += len(chunk)
 
         # Schema validation
-        try:
-            for record in df.to_dict(orient="records"):
-                InputRecord(**record)
-        except ValidationError as exc:  # pragma: no cover - Pydantic own tests
-            issues.append(f"Schema validation failed: {exc}")
-
-        # PII detection (synthetic: look for email-like patterns)
-        pii_columns = [col for col in df.columns if df[col].astype(str).str.contains("@").any()]
+        issues.extend(schema_report.issues())
+
+        # PII detection over text-like columns only
+        pii_columns = pii_report.flagged_columns
         if pii_columns:
             issues.append(f"Possible PII detected in columns: {pii_columns}")
             recommended.append("Remove or hash PII columns before training")
 
-        # Anomaly detection using z-score threshold
-        numeric_df = df.select_dtypes(include=[np.number])
-        std = numeric_df.std(ddof=0).replace(0, 1e-6)
-        z_scores = np.abs((numeric_df - numeric_df.mean()) / std)
-        anomalies = (z_scores > ANOMALY_Z_THRESHOLD).sum().sum()
+        # Anomaly detection using z-score threshold in a second pass
+        anomalies = 0
+        if moments is not None and moments.columns:
+            with timer.stage("anomalies"):
+                anomalies = sum(
+                    moments.count_outliers(chunk, ANOMALY_Z_THRESHOLD) for chunk in chunks()
+                )
         if anomalies > 0:
             issues.append(f"Detected {anomalies} potential anomalies via z-score > 3")
             recommended.append("Inspect outliers and consider clipping or normalization")
@@ -80,12 +245,17 @@ class DataValidator:
         # Risk score combines PII and anomalies
         risk_score = min(1.0, 0.2 * len(pii_columns) + anomalies * 0.005)
 
-        fingerprint = fingerprint_dataset(df.to_csv(index=False).encode())
+        with timer.stage("fingerprint"):
+            fingerprint = fingerprinter.hexdigest()
+        timer.record()
 
         audit_event(
             category="data_validation",
             action="completed",
-            details=f"issues={len(issues)} quality={data_quality_score:.2f} risk={risk_score:.2f}",
+            details=(
+                f"rows={row_offset} issues={len(issues)} "
+                f"quality={data_quality_score:.2f} risk={risk_score:.2f}"
+            ),
         )
         return ValidationResult(
             is_valid=len(issues) == 0,
@@ -94,4 +264,5 @@ class DataValidator:
             risk_score=round(risk_score, 3),
             recommended_actions=recommended or ["Proceed to training"],
             dataset_fingerprint=fingerprint,
+            pii_report=pii_report.to_dict(),
         )
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Sequence
+
 import numpy as np
 
 from backend.utils.logger import audit_event, get_logger
+from backend.utils.metrics import instrument
 
 logger = get_logger(__name__)
 
+DEFAULT_BINS = 10
+DEFAULT_WINDOW_SIZE = 1000
+PSI_SMOOTHING = 1e-6
+
 
 def population_stability_index(expected: np.ndarray, actual: np.ndarray, bins: int = 10) -> float:
     """Compute PSI between expected and actual distributions."""
@@ -24,30 +33,251 @@ def population_stability_index(expected: np.ndarray, actual: np.ndarray, bins: i
     return float(psi)
 
 
+def _as_matrix(data: np.ndarray) -> np.ndarray:
+    """Return observations as a (rows, features) float matrix; 1-D input is one feature."""
+
+    matrix = np.asarray(data, dtype=float)
+    if matrix.ndim == 1:
+        return matrix.reshape(-1, 1)
+    return matrix
+
+
+def bin_indices(matrix: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Map each value to its bin for all features at once; outer bins are open-ended."""
+
+    inner_edges = edges[:, 1:-1]
+    return (inner_edges[np.newaxis, :, :] <= matrix[:, :, np.newaxis]).sum(axis=2)
+
+
+def bin_histogram(indices: np.ndarray, bins: int) -> np.ndarray:
+    """Count bin indices per feature into a (features, bins) array in one pass."""
+
+    features = indices.shape[1]
+    offsets = np.arange(features) * bins
+    flat = (indices.astype(np.int64) + offsets).ravel()
+    return np.bincount(flat, minlength=features * bins).reshape(features, bins)
+
+
+def psi_from_counts(expected: np.ndarray, actual: np.ndarray) -> np.ndarray:
+    """Compute per-feature PSI from (features, bins) expected and actual histograms."""
+
+    expected = expected + PSI_SMOOTHING
+    actual = actual + PSI_SMOOTHING
+    expected = expected / expected.sum(axis=1, keepdims=True)
+    actual = actual / actual.sum(axis=1, keepdims=True)
+    return np.sum((expected - actual) * np.log(expected / actual), axis=1)
+
+
+@dataclass
+class BaselineProfile:
+    """Compact per-feature training distribution persisted with each registry entry.
+
+    ``counts`` over the frozen quantile ``edges`` together with the running moments
+    (``count``, ``mean``, ``m2``, ``minimum``, ``maximum``) form a mergeable sketch:
+    further batches can be folded in without access to the original training rows.
+    """
+
+    features: List[str]
+    edges: List[List[float]]
+    counts: List[List[int]]
+    count: int
+    mean: List[float]
+    m2: List[float]
+    minimum: List[float]
+    maximum: List[float]
+
+    @property
+    def proportions(self) -> np.ndarray:
+        counts = np.asarray(self.counts, dtype=float)
+        return counts / counts.sum(axis=1, keepdims=True)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(np.asarray(self.m2) / max(self.count, 1))
+
+    @classmethod
+    def from_matrix(
+        cls, data: np.ndarray, features: Sequence[str] | None = None, bins: int = DEFAULT_BINS
+    ) -> "BaselineProfile":
+        """Build a profile with quantile bin edges from a (rows, features) matrix."""
+
+        matrix = _as_matrix(data)
+        bin_count = max(2, min(bins, len(matrix)))
+        edges = np.quantile(matrix, np.linspace(0, 1, bin_count + 1), axis=0).T
+        counts = bin_histogram(bin_indices(matrix, edges), bin_count)
+        mean = matrix.mean(axis=0)
+        return cls(
+            features=list(features or [f"feature{i + 1}" for i in range(matrix.shape[1])]),
+            edges=edges.tolist(),
+            counts=counts.tolist(),
+            count=len(matrix),
+            mean=mean.tolist(),
+            m2=((matrix - mean) ** 2).sum(axis=0).tolist(),
+            minimum=matrix.min(axis=0).tolist(),
+            maximum=matrix.max(axis=0).tolist(),
+        )
+
+    def merge_matrix(self, data: np.ndarray) -> "BaselineProfile":
+        """Return a new profile with ``data`` folded into the counts and moments."""
+
+        matrix = _as_matrix(data)
+        edges = np.asarray(self.edges)
+        counts = np.asarray(self.counts) + bin_histogram(
+            bin_indices(matrix, edges), edges.shape[1] - 1
+        )
+        batch_count = len(matrix)
+        total = self.count + batch_count
+        batch_mean = matrix.mean(axis=0)
+        delta = batch_mean - np.asarray(self.mean)
+        m2 = (
+            np.asarray(self.m2)
+            + ((matrix - batch_mean) ** 2).sum(axis=0)
+            + delta**2 * self.count * batch_count / total
+        )
+        return BaselineProfile(
+            features=list(self.features),
+            edges=self.edges,
+            counts=counts.tolist(),
+            count=total,
+            mean=(np.asarray(self.mean) + delta * batch_count / total).tolist(),
+            m2=m2.tolist(),
+            minimum=np.minimum(self.minimum, matrix.min(axis=0)).tolist(),
+            maximum=np.maximum(self.maximum, matrix.max(axis=0)).tolist(),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "BaselineProfile":
+        return cls(**payload)
+
+
 class DriftDetector:
-    """Detects distribution drift using PSI."""
+    """Detects distribution drift using PSI over a sliding window of recent observations.
+
+    Baseline bin edges and proportions are frozen once in ``load_profile``. Incoming
+    values are binned against those edges and counted into a fixed-size ring buffer,
+    so each observation costs O(1) and the window PSI is computed from bin counts only.
+    ``baseline_version`` changes whenever the baseline is loaded or cleared.
+    """
 
-    def __init__(self, threshold: float = 0.2) -> None:
+    def __init__(
+        self,
+        threshold: float = 0.2,
+        bins: int = DEFAULT_BINS,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+    ) -> None:
         self.threshold = threshold
-        self.baseline: np.ndarray | None = None
+        self.bins = bins
+        self.window_size = window_size
+        self.baseline_edges: np.ndarray | None = None
+        self.baseline_counts: np.ndarray | None = None
+        self.baseline_version = 0
+        self._lock = threading.Lock()
+        self._reset_window(0, 0)
+
+    @property
+    def has_baseline(self) -> bool:
+        return self.baseline_edges is not None
+
+    @property
+    def window_observations(self) -> int:
+        return self._filled
+
+    def _reset_window(self, features: int, bins: int) -> None:
+        """Clear the ring buffer and its running bin counts."""
+
+        self._window = np.zeros((self.window_size, features), dtype=np.int16)
+        self._counts = np.zeros((features, bins), dtype=np.int64)
+        self._position = 0
+        self._filled = 0
+
+    def _histogram(self, indices: np.ndarray) -> np.ndarray:
+        return bin_histogram(indices, self._counts.shape[1])
+
+    def load_profile(self, profile: BaselineProfile) -> None:
+        """Adopt a persisted baseline profile and start a fresh window."""
+
+        edges = np.asarray(profile.edges, dtype=float)
+        with self._lock:
+            self.baseline_edges = edges
+            self.baseline_counts = np.asarray(profile.counts, dtype=np.int64)
+            self._reset_window(edges.shape[0], edges.shape[1] - 1)
+            self.baseline_version += 1
+        logger.info("Drift baseline loaded for features %s", profile.features)
 
     def set_baseline(self, data: np.ndarray) -> None:
-        """Store baseline distribution for future drift comparisons."""
+        """Freeze baseline bin edges and proportions computed from raw data."""
+
+        self.load_profile(BaselineProfile.from_matrix(data, bins=self.bins))
+
+    def clear_baseline(self) -> None:
+        """Forget the baseline so scoring reports no drift until a profile is loaded."""
+
+        with self._lock:
+            self.baseline_edges = None
+            self.baseline_counts = None
+            self._reset_window(0, 0)
+            self.baseline_version += 1
+
+    def observe(self, new_data: np.ndarray) -> None:
+        """Add observations to the sliding window, evicting the oldest ones."""
+
+        matrix = _as_matrix(new_data)
+        with self._lock:
+            # Edges and window are read under one lock hold, so a concurrent baseline
+            # swap can never pair new edges with the old window.
+            edges = self.baseline_edges
+            if edges is None:
+                return
+            if matrix.shape[1] != edges.shape[0]:
+                raise ValueError(f"expected {edges.shape[0]} features, got {matrix.shape[1]}")
+            indices = bin_indices(matrix, edges)
+            if len(indices) >= self.window_size:
+                self._window[:] = indices[-self.window_size :]
+                self._counts = self._histogram(self._window)
+                self._position = 0
+                self._filled = self.window_size
+                return
+            positions = (self._position + np.arange(len(indices))) % self.window_size
+            occupied = positions[positions < self._filled]
+            if len(occupied):
+                self._counts -= self._histogram(self._window[occupied])
+            self._window[positions] = indices
+            self._counts += self._histogram(indices)
+            self._position = int((self._position + len(indices)) % self.window_size)
+            self._filled = min(self.window_size, self._filled + len(indices))
+
+    def feature_scores(self) -> np.ndarray:
+        """Return per-feature PSI for the current window."""
+
+        with self._lock:
+            if self.baseline_edges is None or self._filled == 0:
+                features = 0 if self.baseline_edges is None else self.baseline_edges.shape[0]
+                return np.zeros(features)
+            expected = self.baseline_counts.astype(float)
+            actual = self._counts.astype(float)
+        return psi_from_counts(expected, actual)
+
+    def window_score(self) -> float:
+        """Return the PSI of the current window, taking the worst feature."""
 
-        self.baseline = data
+        scores = self.feature_scores()
+        return float(scores.max()) if len(scores) else 0.0
 
+    @instrument("drift_detector", "score")
     def score(self, new_data: np.ndarray) -> float:
-        """Calculate PSI against the baseline, defaulting to no drift when unset."""
+        """Record observations and return the window PSI, or 0.0 without a baseline."""
 
-        if self.baseline is None:
-            self.baseline = new_data
+        if not self.has_baseline:
             return 0.0
-        psi = population_stability_index(self.baseline, new_data)
-        audit_event("drift", "computed", f"psi={psi:.3f}")
+        self.observe(new_data)
+        psi = self.window_score()
+        audit_event("drift", "computed", f"psi={psi:.3f} window={self._filled}")
         return psi
 
-    def is_drifted(self, new_data: np.ndarray) -> bool:
-        """Determine whether the PSI exceeds the configured threshold."""
+    def is_drifted(self) -> bool:
+        """Determine whether the current window PSI exceeds the configured threshold."""
 
-        psi = self.score(new_data)
-        return psi > self.threshold
+        return self.window_score() > self.threshold
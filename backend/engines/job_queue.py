@@ -0,0 +1,254 @@
+"""Asynchronous training jobs executed on a bounded process pool."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from backend.utils.logger import audit_event, get_logger
+from backend.utils.metrics import record_stage_timings
+from backend.utils.profiling import capture_process
+
+logger = get_logger(__name__)
+
+TRAINING_WORKERS = int(os.getenv("MLOPS_TRAINING_WORKERS", "2"))
+MAX_PENDING_JOBS = int(os.getenv("MLOPS_MAX_PENDING_JOBS", "32"))
+MAX_FINISHED_JOBS = 256
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = {JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED}
+
+
+class JobCancelledError(RuntimeError):
+    """Raised inside a worker when its job was cancelled at a stage boundary."""
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when too many training jobs are already pending."""
+
+
+@dataclass
+class TrainingJob:
+    job_id: str
+    run_id: str
+    status: str = JOB_QUEUED
+    stage: str = JOB_QUEUED
+    progress: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_worker_trainer = None
+
+
+def _get_worker_trainer():
+    """Build the trainer once per worker process with its own registry handle."""
+
+    global _worker_trainer  # noqa: PLW0603 - per-process singleton
+    if _worker_trainer is None:
+        from backend.engines.model_registry import ModelRegistry  # noqa: PLC0415
+        from backend.engines.trainer import Trainer  # noqa: PLC0415
+
+        _worker_trainer = Trainer(ModelRegistry())
+    return _worker_trainer
+
+
+def _run_training_job(
+    job_id: str,
+    df: pd.DataFrame,
+    run_id: str,
+    options: Dict[str, Any],
+    state: Any,
+    cancellations: Any,
+) -> Dict[str, Any]:
+    """Worker-process entry point: train and publish stage progress to the manager."""
+
+    timings: Dict[str, float] = {}
+    started_at = time.time()
+    current = {"stage": None, "started": time.perf_counter()}
+    state[job_id] = {"stage": JOB_RUNNING, "progress": 0.0, "timings": {}, "started_at": started_at}
+
+    def progress(stage: str, fraction: float) -> None:
+        now = time.perf_counter()
+        if current["stage"] is not None:
+            timings[current["stage"]] = round(now - current["started"], 6)
+        current.update(stage=stage, started=now)
+        state[job_id] = {
+            "stage": stage,
+            "progress": fraction,
+            "timings": dict(timings),
+            "started_at": started_at,
+        }
+        if stage != "done" and cancellations.get(job_id):
+            raise JobCancelledError(f"job {job_id} cancelled during {stage}")
+
+    trainer = _get_worker_trainer()
+    options = dict(options)
+    train = trainer.train_incremental if options.pop("incremental", False) else trainer.train
+    profile_id = options.pop("profile_id", None)
+    with capture_process(profile_id) if profile_id else nullcontext():
+        output = train(df, run_id, progress=progress, **options)
+    return {
+        "run_id": run_id,
+        "started_at": started_at,
+        "model_path": str(output.model_path),
+        "metrics": output.metrics,
+        "signature": output.signature,
+        "timings": timings,
+        "stage_timings": json.loads(output.metadata["stage_timings"]),
+    }
+
+
+class TrainingJobQueue:
+    """Run ``Trainer.train`` in a bounded pool of worker processes.
+
+    Training holds the GIL for long stretches, so it runs outside the API process.
+    Stage progress and cancellation flags travel through a ``multiprocessing``
+    manager. The pool and manager start lazily on the first submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TRAINING_WORKERS,
+        max_pending: int = MAX_PENDING_JOBS,
+        on_complete: Optional[Callable[[TrainingJob], None]] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.on_complete = on_complete
+        self._jobs: Dict[str, TrainingJob] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._state = None
+        self._cancellations = None
+
+    def _ensure_started(self) -> None:
+        if self._executor is not None:
+            return
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._state = self._manager.dict()
+        self._cancellations = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        logger.info("Training job pool started with %s workers", self.max_workers)
+
+    def submit(
+        self, df: pd.DataFrame, run_id: str, options: Optional[Dict[str, Any]] = None
+    ) -> TrainingJob:
+        """Queue a training run and return its job handle immediately.
+
+        ``options`` are passed to ``Trainer.train``; ``{"incremental": True}`` selects
+        ``Trainer.train_incremental`` and may carry ``parent_run_id``; ``profile_id``
+        profiles the job in its worker process.
+        """
+
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+            if pending >= self.max_pending:
+                raise JobQueueFullError(f"{pending} training jobs already pending")
+            self._ensure_started()
+            job = TrainingJob(job_id=uuid.uuid4().hex, run_id=run_id)
+            self._jobs[job.job_id] = job
+            future = self._executor.submit(
+                _run_training_job,
+                job.job_id,
+                df,
+                run_id,
+                options or {},
+                self._state,
+                self._cancellations,
+            )
+            self._futures[job.job_id] = future
+        future.add_done_callback(lambda done, job_id=job.job_id: self._finish(job_id, done))
+        audit_event("training", "queued", f"job_id={job.job_id} run_id={run_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[TrainingJob]:
+        """Return the job with its latest stage, progress and timings."""
+
+        job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return job
+        snapshot = self._state.get(job_id) if self._state is not None else None
+        if snapshot:
+            job.started_at = snapshot["started_at"]
+            job.status = JOB_RUNNING
+            job.stage = snapshot["stage"]
+            job.progress = snapshot["progress"]
+            job.timings = snapshot["timings"]
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or flag a running one to stop at its next stage."""
+
+        job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+        if self._futures[job_id].cancel():
+            return True
+        self._cancellations[job_id] = True
+        audit_event("training", "cancel_requested", f"job_id={job_id}")
+        return True
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        """Record the outcome of a finished future and prune old jobs."""
+
+        job = self.get(job_id)
+        job.finished_at = time.time()
+        try:
+            job.result = future.result()
+            job.started_at = job.result["started_at"]
+            job.status = job.stage = JOB_SUCCEEDED
+            job.progress = 1.0
+            job.timings = job.result["timings"]
+            # The worker's own metrics die with its process; replay its stage timings here.
+            record_stage_timings("trainer", job.result["stage_timings"])
+        except (CancelledError, JobCancelledError):
+            job.status = job.stage = JOB_CANCELLED
+        except Exception as exc:
+            job.status = JOB_FAILED
+            job.error = str(exc)
+            logger.error("Training job %s failed: %s", job_id, exc)
+        audit_event("training", f"job_{job.status}", f"job_id={job_id} run_id={job.run_id}")
+        with self._lock:
+            self._futures.pop(job_id, None)
+            if self._state is not None:
+                self._state.pop(job_id, None)
+                self._cancellations.pop(job_id, None)
+            finished = [j for j in self._jobs.values() if j.status in FINISHED_STATES]
+            for stale in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                self._jobs.pop(stale.job_id, None)
+        if self.on_complete is not None and job.status == JOB_SUCCEEDED:
+            self.on_complete(job)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and the progress manager."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = self._manager = None
+            self._state = self._cancellations = None
@@ -0,0 +1,201 @@
+"""Asyncio micro-batching in front of single-row model scoring."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BATCH_ROWS = int(os.getenv("MLOPS_MICROBATCH_MAX_ROWS", "256"))
+MAX_WAIT_SECONDS = float(os.getenv("MLOPS_MICROBATCH_MAX_WAIT_MS", "2")) / 1000
+MAX_QUEUE_DEPTH = int(os.getenv("MLOPS_MICROBATCH_MAX_QUEUE", "4096"))
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+QUEUE_MS_BUCKETS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 50.0, 100.0)
+
+BatchHandler = Callable[[np.ndarray], Sequence[Any]]
+
+
+class MicroBatcherOverloadedError(RuntimeError):
+    """Raised when the pending queue is at ``max_queue_depth``."""
+
+
+@dataclass
+class _PendingRow:
+    row: np.ndarray
+    future: asyncio.Future
+    enqueued_at: float
+
+
+def _bucket(value: float, bounds: Sequence[float]) -> str:
+    for bound in bounds:
+        if value <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row requests into one vectorized handler call.
+
+    Requests wait at most ``max_wait_seconds`` for company and a batch never exceeds
+    ``max_batch_rows``. The window is adaptive: when the previous batch held a single
+    row and nothing else is queued, the request is dispatched after one event-loop tick
+    instead of waiting, so an idle service pays no batching latency. The handler runs
+    in a worker thread; rows arriving meanwhile form the next batch.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_rows: int = MAX_BATCH_ROWS,
+        max_wait_seconds: float = MAX_WAIT_SECONDS,
+        max_queue_depth: int = MAX_QUEUE_DEPTH,
+    ) -> None:
+        self.handler = handler
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue_depth = max_queue_depth
+        self._pending: Deque[_PendingRow] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._last_batch_rows = 0
+        self.requests = 0
+        self.batches = 0
+        self.rejected = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.batch_sizes: Dict[str, int] = dict.fromkeys([*map(str, BATCH_SIZE_BUCKETS), "+Inf"], 0)
+        self.queue_ms: Dict[str, int] = dict.fromkeys([*map(str, QUEUE_MS_BUCKETS), "+Inf"], 0)
+
+    def _ensure_worker(self) -> None:
+        """Start the dispatch task on the running loop (restarting if the loop changed)."""
+
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        if self._loop is not loop:
+            # Rows queued on a previous loop can never be resolved from this one.
+            self._pending = deque()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._start_worker()
+
+    def _start_worker(self) -> None:
+        self._worker = self._loop.create_task(self._run())
+        self._worker.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, task: asyncio.Task) -> None:
+        """Log a dispatcher that died and restart it so queued rows are still served."""
+
+        if task.cancelled() or task is not self._worker:
+            return
+        exc = task.exception()
+        logger.error("Micro-batch dispatcher stopped (%r); restarting", exc)
+        if not self._loop.is_closed():
+            self._start_worker()
+
+    async def submit(self, row: np.ndarray) -> Any:
+        """Queue one feature row and return the handler's result for it."""
+
+        self._ensure_worker()
+        if len(self._pending) >= self.max_queue_depth:
+            self.rejected += 1
+            raise MicroBatcherOverloadedError(f"{len(self._pending)} predictions already queued")
+        future = self._loop.create_future()
+        self._pending.append(_PendingRow(np.asarray(row, dtype=float), future, time.perf_counter()))
+        self.requests += 1
+        self._wakeup.set()
+        return await future
+
+    async def _collect(self) -> List[_PendingRow]:
+        """Wait for the batching window to close and pop up to ``max_batch_rows`` rows."""
+
+        while not self._pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        if self._last_batch_rows > 1 or len(self._pending) > 1:
+            deadline = self._pending[0].enqueued_at + self.max_wait_seconds
+            while len(self._pending) < self.max_batch_rows:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        else:
+            await asyncio.sleep(0)
+        count = min(len(self._pending), self.max_batch_rows)
+        return [self._pending.popleft() for _ in range(count)]
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            started = time.perf_counter()
+            self._record(batch, started)
+            live = [item for item in batch if not item.future.done()]
+            if live:
+                await self._dispatch(live)
+
+    async def _dispatch(self, live: List[_PendingRow]) -> None:
+        """Score ``live`` rows and resolve every one of their futures, whatever happens."""
+
+        try:
+            results = await asyncio.to_thread(self.handler, np.vstack([item.row for item in live]))
+            if len(results) != len(live):
+                raise RuntimeError(
+                    f"batch handler returned {len(results)} results for {len(live)} rows"
+                )
+            for item, result in zip(live, results):
+                if not item.future.done():
+                    item.future.set_result(result)
+        except Exception as exc:
+            for item in live:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+        finally:
+            # A BaseException (e.g. cancellation) must not leave callers waiting forever.
+            for item in live:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError("micro-batch dispatch aborted"))
+
+    def _record(self, batch: List[_PendingRow], started: float) -> None:
+        self.batches += 1
+        self._last_batch_rows = len(batch)
+        self.batch_sizes[_bucket(len(batch), BATCH_SIZE_BUCKETS)] += 1
+        for item in batch:
+            waited = started - item.enqueued_at
+            self.queue_seconds_total += waited
+            self.queue_seconds_max = max(self.queue_seconds_max, waited)
+            self.queue_ms[_bucket(waited * 1000, QUEUE_MS_BUCKETS)] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batch-size and queue-time distributions for observability."""
+
+        dispatched = sum(self.queue_ms.values())
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "rejected": self.rejected,
+            "queue_depth": len(self._pending),
+            "max_batch_rows": self.max_batch_rows,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+            "max_queue_depth": self.max_queue_depth,
+            "mean_batch_rows": round(dispatched / self.batches, 3) if self.batches else 0.0,
+            "batch_size_histogram": dict(self.batch_sizes),
+            "queue_ms_histogram": dict(self.queue_ms),
+            "queue_seconds_mean": (
+                round(self.queue_seconds_total / dispatched, 6) if dispatched else 0.0
+            ),
+            "queue_seconds_max": round(self.queue_seconds_max, 6),
+        }
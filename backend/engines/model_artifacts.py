@@ -0,0 +1,134 @@
+"""Memory-mappable artifact format for linear models.
+
+A ``linear-npy-v1`` artifact is a directory holding ``manifest.json`` plus one raw
+``.npy`` file per fitted array (``coef_``, ``intercept_``, ``classes_``). Loading with
+``mmap_mode="r"`` maps the arrays straight from the OS page cache, so every serving
+process shares one physical copy and cold loads do no unpickling.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ARTIFACT_FORMAT = os.getenv("MLOPS_ARTIFACT_FORMAT", "joblib").lower()
+ARTIFACT_FORMATS = ("joblib", "npy")
+LINEAR_FORMAT = "linear-npy-v1"
+MANIFEST_NAME = "manifest.json"
+LINEAR_ARRAYS = ("coef_", "intercept_", "classes_")
+LINEAR_ESTIMATORS = {cls.__name__: cls for cls in (LogisticRegression, SGDClassifier)}
+SCALAR_STATE = ("t_",)
+# Params whose dict values are keyed by class label; JSON object keys are always
+# strings, so these are stored as ``[label, value]`` pairs to keep int labels intact.
+LABEL_KEYED_PARAMS = ("class_weight",)
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = dict(params)
+    for name in LABEL_KEYED_PARAMS:
+        value = encoded.get(name)
+        if isinstance(value, dict):
+            encoded[name] = [
+                [label.item() if isinstance(label, np.generic) else label, weight]
+                for label, weight in value.items()
+            ]
+    return encoded
+
+
+def _decode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = dict(params)
+    for name in LABEL_KEYED_PARAMS:
+        value = decoded.get(name)
+        if isinstance(value, list):
+            decoded[name] = {label: weight for label, weight in value}
+    return decoded
+
+
+def supports_linear_artifact(model: Any) -> bool:
+    """Return whether ``model`` can be stored as a ``linear-npy-v1`` artifact."""
+
+    if type(model).__name__ not in LINEAR_ESTIMATORS:
+        return False
+    if not all(hasattr(model, name) for name in LINEAR_ARRAYS):
+        return False
+    return not np.asarray(model.classes_).dtype.hasobject
+
+
+def save_linear_artifact(model: Any, directory: Path) -> Path:
+    """Write ``model`` as a manifest plus raw arrays and return the artifact directory.
+
+    The artifact is assembled in a private sibling temp directory and renamed into
+    place, so readers never observe a partially written artifact. Artifacts are
+    immutable: an existing ``directory`` is never replaced and raises
+    ``FileExistsError``, because a directory cannot be swapped atomically.
+    """
+
+    if not supports_linear_artifact(model):
+        raise ValueError(f"{type(model).__name__} cannot be stored as {LINEAR_FORMAT}")
+    if directory.exists():
+        raise FileExistsError(f"Artifact already exists: {directory}")
+    tmp_dir = directory.with_name(f".{directory.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    tmp_dir.mkdir(parents=True)
+    arrays: Dict[str, Dict[str, Any]] = {}
+    for name in LINEAR_ARRAYS:
+        array = np.ascontiguousarray(getattr(model, name))
+        filename = f"{name.rstrip('_')}.npy"
+        np.save(tmp_dir / filename, array, allow_pickle=False)
+        arrays[name] = {"file": filename, "dtype": array.dtype.str, "shape": list(array.shape)}
+    manifest = {
+        "format": LINEAR_FORMAT,
+        "estimator": type(model).__name__,
+        "params": _encode_params(model.get_params()),
+        "n_features_in": int(model.n_features_in_),
+        "state": {
+            name: float(getattr(model, name)) for name in SCALAR_STATE if hasattr(model, name)
+        },
+        "arrays": arrays,
+    }
+    (tmp_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    try:
+        # rename() refuses a non-empty target, so a concurrent writer cannot be clobbered.
+        os.rename(tmp_dir, directory)
+    except OSError as exc:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise FileExistsError(f"Artifact already exists: {directory}") from exc
+    return directory
+
+
+def load_linear_artifact(directory: Path, mmap_mode: Optional[str] = "r") -> Any:
+    """Rebuild an estimator whose fitted arrays are memory-mapped from ``directory``.
+
+    With ``mmap_mode=None`` the arrays are read into private, writable memory instead,
+    which is what callers that continue training need.
+    """
+
+    manifest = json.loads((directory / MANIFEST_NAME).read_text())
+    if manifest.get("format") != LINEAR_FORMAT:
+        raise ValueError(f"Unsupported artifact format: {manifest.get('format')}")
+    estimator = LINEAR_ESTIMATORS.get(manifest["estimator"])
+    if estimator is None:
+        raise ValueError(f"Unsupported estimator: {manifest['estimator']}")
+    model = estimator(**_decode_params(manifest["params"]))
+    for name, spec in manifest["arrays"].items():
+        if name not in LINEAR_ARRAYS:
+            raise ValueError(f"Unexpected array in manifest: {name}")
+        array = np.load(directory / spec["file"], mmap_mode=mmap_mode, allow_pickle=False)
+        if list(array.shape) != spec["shape"] or array.dtype.str != spec["dtype"]:
+            raise ValueError(f"Array {name} does not match the manifest")
+        setattr(model, name, array)
+    model.n_features_in_ = manifest["n_features_in"]
+    for name, value in manifest.get("state", {}).items():
+        if name in SCALAR_STATE:
+            setattr(model, name, value)
+    return model
@@ -0,0 +1,142 @@
+"""Process-level cache for the deployed model artifact."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+
+from backend.engines.fast_predictor import LinearPredictor, compile_predictor
+from backend.utils.logger import get_logger
+from backend.utils.metrics import observe_stage
+
+logger = get_logger(__name__)
+
+FileStat = Tuple[str, int, int, int, int]
+ArtifactKey = Tuple[str, str, Tuple[FileStat, ...], str]
+
+
+@dataclass
+class CachedModel:
+    key: ArtifactKey
+    model: Any
+    loaded_at: float
+    load_seconds: float
+    predictor: Optional[LinearPredictor] = None
+
+    @property
+    def serving_model(self) -> Any:
+        """The verified fast predictor when one was built, otherwise the sklearn model."""
+
+        return self.predictor if self.predictor is not None else self.model
+
+
+def _file_stat(path: Path, name: str) -> FileStat:
+    stat = path.stat()
+    return (name, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+def artifact_key(run_id: str, path: Path, signature: str) -> ArtifactKey:
+    """Identify a deployed artifact by run, path, file identities and signed digest.
+
+    Directory artifacts contribute the inode, size, mtime and ctime of every file in
+    them, so rewriting any array in place (not just the manifest) changes the key.
+    """
+
+    if path.is_dir():
+        files = tuple(
+            _file_stat(file, file.name) for file in sorted(path.iterdir()) if file.is_file()
+        )
+    else:
+        files = (_file_stat(path, ""),)
+    return (run_id, str(path), files, signature)
+
+
+class DeployedModelCache:
+    """Keep the deployed model in memory and reload only when its identity changes."""
+
+    def __init__(self, loader: Callable[[Path], Any] = joblib.load) -> None:
+        self.loader = loader
+        self._entry: Optional[CachedModel] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_seconds_total = 0.0
+
+    def _load(self, key: ArtifactKey) -> CachedModel:
+        """Deserialize the artifact behind ``key`` and time the load."""
+
+        start = time.perf_counter()
+        model = self.loader(Path(key[1]))
+        predictor = compile_predictor(model)
+        elapsed = time.perf_counter() - start
+        observe_stage("model_cache", "load", elapsed)
+        self.loads += 1
+        self.load_seconds_total += elapsed
+        logger.info(
+            "Loaded model %s for run %s in %.4fs (fast path: %s)",
+            key[1],
+            key[0],
+            elapsed,
+            predictor is not None,
+        )
+        return CachedModel(
+            key=key, model=model, loaded_at=time.time(), load_seconds=elapsed, predictor=predictor
+        )
+
+    def get(self, run_id: str, path: Path, signature: str) -> Any:
+        """Return the cached model for the artifact, loading it on first use or change."""
+
+        return self.get_entry(run_id, path, signature).model
+
+    def get_entry(self, run_id: str, path: Path, signature: str) -> CachedModel:
+        """Return the cache entry (model plus optional fast predictor) for the artifact."""
+
+        key = artifact_key(run_id, path, signature)
+        entry = self._entry
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry.key == key:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = self._load(key)
+            self._entry = entry
+            return entry
+
+    def swap(self, run_id: str, path: Path, signature: str) -> Any:
+        """Eagerly load a newly deployed artifact and replace the cached entry atomically."""
+
+        key = artifact_key(run_id, path, signature)
+        with self._lock:
+            entry = self._load(key)
+            self._entry = entry
+        return entry.model
+
+    def invalidate(self) -> None:
+        """Drop the cached model so the next lookup reloads from disk."""
+
+        with self._lock:
+            self._entry = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss and load-time counters for observability."""
+
+        entry = self._entry
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "load_seconds_total": round(self.load_seconds_total, 6),
+            "last_load_seconds": round(entry.load_seconds, 6) if entry else None,
+            "cached_run_id": entry.key[0] if entry else None,
+            "fast_path": bool(entry and entry.predictor is not None),
+        }
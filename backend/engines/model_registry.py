@@ -1,68 +1,81 @@
-"""Simple file-based model registry with signatures, approvals, and deployment state."""
+"""Model registry with signatures, approvals, and deployment state over pluggable storage."""
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Sequence
 
 import joblib
 
+from backend.engines.model_artifacts import (
+    ARTIFACT_FORMAT,
+    ARTIFACT_FORMATS,
+    load_linear_artifact,
+    save_linear_artifact,
+    supports_linear_artifact,
+)
+from backend.engines.model_cache import CachedModel, DeployedModelCache
 from backend.engines.model_signer import ModelSigner
+from backend.engines.registry_store import (
+    REGISTRY_FILE,
+    ModelRecord,
+    RegistryStore,
+    create_registry_store,
+)
 from backend.utils.logger import audit_event, get_logger
+from backend.utils.metrics import instrument
 
 logger = get_logger(__name__)
 
-
-REGISTRY_FILE = Path("models/registry.json")
-REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-
-@dataclass
-class ModelRecord:
-    run_id: str
-    path: str
-    metrics: Dict[str, float]
-    signature: str
-    metadata: Dict[str, str]
-    approved: bool = False
+__all__ = ["REGISTRY_FILE", "ModelRecord", "ModelRegistry"]
 
 
 class ModelRegistry:
-    """Local registry storing model metadata and approval state."""
-
-    def __init__(self) -> None:
-        self.signer = ModelSigner()
-        self._ensure_registry()
-
-    def _ensure_registry(self) -> None:
-        """Create an empty registry file when missing."""
+    """Local registry storing model metadata and approval state.
 
-        if not REGISTRY_FILE.exists():
-            REGISTRY_FILE.write_text(json.dumps({"models": [], "deployed_run_id": None}, indent=2))
+    Persistence is delegated to a pluggable ``RegistryStore`` (JSON file by default,
+    SQLite WAL when ``MLOPS_REGISTRY_BACKEND=sqlite``). Records returned by the
+    accessors are shared with the store's read cache and must be treated as read-only.
+    """
 
-    def _load_registry(self) -> Dict:
-        """Load registry content from disk."""
-
-        registry = json.loads(REGISTRY_FILE.read_text())
-        # Older registries may not track deployed state; normalize here.
-        registry.setdefault("deployed_run_id", None)
-        registry.setdefault("models", [])
-        return registry
+    def __init__(
+        self, store: Optional[RegistryStore] = None, artifact_format: str = ARTIFACT_FORMAT
+    ) -> None:
+        if artifact_format not in ARTIFACT_FORMATS:
+            raise ValueError(f"artifact_format must be one of {ARTIFACT_FORMATS}")
+        self.signer = ModelSigner()
+        self.model_cache = DeployedModelCache(loader=self.load_model)
+        self.store = store or create_registry_store()
+        self.artifact_format = artifact_format
 
-    def _save_registry(self, registry: Dict) -> None:
-        """Persist registry content to disk."""
+    def version(self) -> Hashable:
+        """Return a token that changes whenever registry content changes."""
 
-        REGISTRY_FILE.write_text(json.dumps(registry, indent=2))
+        return self.store.version()
 
+    @instrument("registry", "save_model")
     def save_model(self, model, run_id: str) -> Path:
-        """Serialize a trained model to disk and return the path."""
+        """Serialize a trained model to disk and return the path.
 
+        With ``artifact_format="npy"`` linear models are written as a memory-mappable
+        ``models/model_<run_id>/`` directory; anything else falls back to joblib.
+        """
+
+        if self.artifact_format == "npy" and supports_linear_artifact(model):
+            return save_linear_artifact(model, Path(f"models/model_{run_id}"))
         path = Path(f"models/model_{run_id}.joblib")
         joblib.dump(model, path)
         return path
 
+    @staticmethod
+    def load_model(path: Path, mmap_mode: Optional[str] = "r") -> Any:
+        """Load an artifact written by ``save_model`` (directory artifacts are mmapped)."""
+
+        if path.is_dir():
+            return load_linear_artifact(path, mmap_mode=mmap_mode)
+        return joblib.load(path)
+
+    @instrument("registry", "register_model")
     def register_model(
         self,
         run_id: str,
@@ -70,11 +83,11 @@ class ModelRegistry:
         metrics: Dict[str, float],
         signature: str,
         metadata: Dict[str, str],
+        baseline_profile: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Add a new model entry to the registry with signature and metadata."""
 
-        registry = self._load_registry()
-        registry["models"].append(
+        self.store.append(
             ModelRecord(
                 run_id=run_id,
                 path=str(model_path),
@@ -82,45 +95,39 @@ class ModelRegistry:
                 signature=signature,
                 metadata=metadata,
                 approved=False,
-            ).__dict__
+                baseline_profile=baseline_profile or {},
+            )
         )
-        self._save_registry(registry)
         audit_event("registry", "model_registered", f"run_id={run_id}")
 
+    @instrument("registry", "list_models")
     def list_models(self) -> List[ModelRecord]:
         """Return all models stored in the registry."""
 
-        registry = self._load_registry()
-        return [ModelRecord(**item) for item in registry.get("models", [])]
+        return self.store.list_models()
 
+    @instrument("registry", "latest_model")
     def latest_model(self) -> Optional[ModelRecord]:
         """Return the newest model if any exist."""
 
-        models = self.list_models()
-        return models[-1] if models else None
+        return self.store.latest_model()
 
+    @instrument("registry", "get_model")
     def get_model(self, run_id: str) -> Optional[ModelRecord]:
         """Lookup a specific model run by identifier."""
 
-        for model in self.list_models():
-            if model.run_id == run_id:
-                return model
-        return None
+        return self.store.get_model(run_id)
 
+    @instrument("registry", "approve")
     def approve(self, run_id: str) -> bool:
         """Mark the specified run_id as approved for deployment."""
 
-        registry = self._load_registry()
-        updated = False
-        for item in registry.get("models", []):
-            if item["run_id"] == run_id:
-                item["approved"] = True
-                updated = True
+        updated = self.store.approve(run_id)
         if updated:
-            self._save_registry(registry)
             audit_event("registry", "approved", f"run_id={run_id}")
         return updated
 
+    @instrument("registry", "verify_run")
     def verify_run(self, run_id: str) -> bool:
         """Validate the signature of a specific model run to guard against tampering."""
 
@@ -134,6 +141,16 @@ class ModelRegistry:
             return False
         return self.signer.verify_model(path, model.signature)
 
+    def verify_many(self, run_ids: Sequence[str]) -> Dict[str, bool]:
+        """Validate signatures for several runs at once, hashing artifacts concurrently."""
+
+        results = {run_id: False for run_id in run_ids}
+        records = [record for record in map(self.get_model, run_ids) if record is not None]
+        verified = self.signer.verify_many([(Path(r.path), r.signature) for r in records])
+        for record, valid in zip(records, verified):
+            results[record.run_id] = valid
+        return results
+
     def verify_latest(self) -> bool:
         """Validate the signature of the latest model to guard against tampering."""
 
@@ -142,31 +159,58 @@ class ModelRegistry:
             return False
         return self.verify_run(model.run_id)
 
+    @instrument("registry", "mark_deployed")
     def mark_deployed(self, run_id: str) -> bool:
         """Mark an approved run as the active deployed model."""
 
-        registry = self._load_registry()
-        selected = None
-        for item in registry.get("models", []):
-            if item.get("run_id") == run_id:
-                selected = item
-                break
+        selected = self.store.get_model(run_id)
         if not selected:
             logger.warning("Attempted to deploy unknown run_id=%s", run_id)
             return False
-        if not selected.get("approved"):
+        if not selected.approved or not self.store.set_deployed(run_id):
             logger.warning("Attempted to deploy unapproved run_id=%s", run_id)
             return False
-        registry["deployed_run_id"] = run_id
-        self._save_registry(registry)
+        self._swap_cached_model(selected)
         audit_event("registry", "deployed", f"run_id={run_id}")
         return True
 
+    def _swap_cached_model(self, record: ModelRecord) -> None:
+        """Preload the newly deployed artifact so serving never sees a cold cache."""
+
+        try:
+            self.model_cache.swap(record.run_id, Path(record.path), record.signature)
+        except Exception as exc:
+            logger.error("Failed to preload deployed model %s: %s", record.path, exc)
+            self.model_cache.invalidate()
+
+    @instrument("registry", "deployed_model")
     def deployed_model(self) -> Optional[ModelRecord]:
         """Return the currently deployed model if set."""
 
-        registry = self._load_registry()
-        deployed_id = registry.get("deployed_run_id")
-        if not deployed_id:
+        return self.store.deployed_model()
+
+    def load_run(self, run_id: str) -> Any:
+        """Load the artifact of a registered run after verifying its signature."""
+
+        record = self.get_model(run_id)
+        if not record:
+            raise ValueError(f"Unknown run_id: {run_id}")
+        if not self.verify_run(run_id):
+            raise ValueError(f"Signature verification failed for run_id: {run_id}")
+        return self.load_model(Path(record.path), mmap_mode=None)
+
+    def load_deployed(self) -> Optional[Any]:
+        """Return the deployed model object, served from the in-memory cache when warm."""
+
+        deployed = self.deployed_model()
+        if not deployed:
+            return None
+        return self.model_cache.get(deployed.run_id, Path(deployed.path), deployed.signature)
+
+    def load_deployed_entry(self) -> Optional[CachedModel]:
+        """Return the cached deployed model together with its verified fast predictor."""
+
+        deployed = self.deployed_model()
+        if not deployed:
             return None
-        return self.get_model(deployed_id)
+        return self.model_cache.get_entry(deployed.run_id, Path(deployed.path), deployed.signature)
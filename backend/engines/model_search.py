@@ -0,0 +1,208 @@
+"""Parallel hyperparameter search over logistic-regression candidates."""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import (
+    ParameterGrid,
+    ParameterSampler,
+    StratifiedKFold,
+    StratifiedShuffleSplit,
+)
+
+from backend.engines.job_queue import TRAINING_WORKERS
+from backend.utils.logger import audit_event, get_logger
+
+logger = get_logger(__name__)
+
+# Up to TRAINING_WORKERS searches run at once, so each one gets its share of the cores.
+SEARCH_WORKERS = int(
+    os.getenv("MLOPS_SEARCH_WORKERS", str(max(1, (os.cpu_count() or 1) // TRAINING_WORKERS)))
+)
+SEARCH_STRATEGIES = ("grid", "random")
+SEARCHABLE_PARAMS = {"C", "penalty", "class_weight", "solver", "max_iter", "l1_ratio"}
+DEFAULT_SEARCH_PARAMS: Dict[str, List[Any]] = {
+    "C": [0.01, 0.1, 1.0, 10.0],
+    "penalty": ["l2"],
+    "class_weight": [None, "balanced"],
+    "solver": ["lbfgs", "liblinear"],
+}
+BASE_PARAMS = {"max_iter": 200}
+SHARED_ARRAY_BYTES = "1M"
+MIN_CV_FOLDS = 2
+VALIDATION_FRACTION = 0.25
+
+
+@dataclass
+class SearchSpace:
+    """Candidate hyperparameters for ``LogisticRegression`` and how to score them.
+
+    ``cv_folds`` of 2 or more scores each candidate with stratified k-fold CV on the
+    training split; otherwise a single stratified validation split is carved out of it.
+    ``n_jobs`` follows joblib semantics (``-1`` uses every core) and defaults to this
+    job's share of the cores.
+    """
+
+    params: Dict[str, List[Any]] = field(default_factory=lambda: dict(DEFAULT_SEARCH_PARAMS))
+    strategy: str = "grid"
+    n_iter: int = 10
+    cv_folds: int = 0
+    n_jobs: int = SEARCH_WORKERS
+    random_state: int = 42
+
+    def __post_init__(self) -> None:
+        if self.strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"strategy must be one of {SEARCH_STRATEGIES}")
+        unknown = sorted(set(self.params) - SEARCHABLE_PARAMS)
+        if unknown:
+            raise ValueError(f"Unsupported search parameters: {unknown}")
+        if any(not values for values in self.params.values()):
+            raise ValueError("every search parameter needs at least one value")
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        """Expand the space into concrete parameter sets."""
+
+        if self.strategy == "grid":
+            return list(ParameterGrid(self.params))
+        return list(
+            ParameterSampler(self.params, n_iter=self.n_iter, random_state=self.random_state)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SearchResult:
+    best_params: Dict[str, Any]
+    best_score: float
+    leaderboard: List[Dict[str, Any]]
+    elapsed_seconds: float
+
+    def summary(self, space: SearchSpace) -> Dict[str, Any]:
+        """Return the JSON-serializable record stored in run metadata."""
+
+        return {
+            "strategy": space.strategy,
+            "cv_folds": space.cv_folds,
+            "n_jobs": space.n_jobs,
+            "candidates": len(self.leaderboard),
+            "best_params": self.best_params,
+            "best_score": self.best_score,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "leaderboard": self.leaderboard,
+        }
+
+
+def build_candidate(params: Dict[str, Any]) -> LogisticRegression:
+    """Return an unfitted ``LogisticRegression`` for a candidate parameter set."""
+
+    return LogisticRegression(**{**BASE_PARAMS, **params})
+
+
+def _score_fold(
+    index: int,
+    params: Dict[str, Any],
+    X: np.ndarray,
+    y: np.ndarray,
+    train_rows: np.ndarray,
+    val_rows: np.ndarray,
+) -> Tuple[int, Optional[float], float, Optional[str]]:
+    """Fit one candidate on one fold; runs in a joblib worker."""
+
+    start = time.perf_counter()
+    try:
+        model = build_candidate(params).fit(X[train_rows], y[train_rows])
+        score = float(accuracy_score(y[val_rows], model.predict(X[val_rows])))
+        error = None
+    except ValueError as exc:
+        score, error = None, str(exc)
+    return index, score, time.perf_counter() - start, error
+
+
+def _folds(space: SearchSpace, y: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    rows = np.arange(len(y))
+    if space.cv_folds >= MIN_CV_FOLDS:
+        splitter = StratifiedKFold(
+            n_splits=space.cv_folds, shuffle=True, random_state=space.random_state
+        )
+        return list(splitter.split(rows, y))
+    splitter = StratifiedShuffleSplit(
+        n_splits=1, test_size=VALIDATION_FRACTION, random_state=space.random_state
+    )
+    try:
+        train_rows, val_rows = next(splitter.split(rows, y))
+    except ValueError:
+        # Too few rows of some class to stratify; fall back to a plain shuffled split.
+        shuffled = np.random.default_rng(space.random_state).permutation(rows)
+        cut = max(1, int(len(rows) * VALIDATION_FRACTION))
+        train_rows, val_rows = shuffled[cut:], shuffled[:cut]
+    return [(np.sort(train_rows), np.sort(val_rows))]
+
+
+def run_search(space: SearchSpace, X: np.ndarray, y: np.ndarray) -> SearchResult:
+    """Score every candidate on every fold in parallel and rank them.
+
+    Tasks run on joblib's ``loky`` process pool. Arrays larger than
+    ``SHARED_ARRAY_BYTES`` are dumped once to a read-only memmap that every worker
+    maps, instead of being pickled into each task; folds travel as row indices.
+    """
+
+    start = time.perf_counter()
+    candidates = space.candidates()
+    folds = _folds(space, y)
+    tasks = [
+        delayed(_score_fold)(index, params, X, y, train_rows, val_rows)
+        for index, params in enumerate(candidates)
+        for train_rows, val_rows in folds
+    ]
+    outcomes = Parallel(
+        n_jobs=space.n_jobs, backend="loky", max_nbytes=SHARED_ARRAY_BYTES, mmap_mode="r"
+    )(tasks)
+
+    fold_scores: Dict[int, List[float]] = {index: [] for index in range(len(candidates))}
+    fit_seconds = dict.fromkeys(fold_scores, 0.0)
+    errors: Dict[int, str] = {}
+    for index, score, seconds, error in outcomes:
+        fit_seconds[index] += seconds
+        if error is not None:
+            errors[index] = error
+        else:
+            fold_scores[index].append(score)
+
+    leaderboard = []
+    for index, params in enumerate(candidates):
+        failed = index in errors
+        leaderboard.append(
+            {
+                "params": params,
+                "mean_score": None if failed else float(np.mean(fold_scores[index])),
+                "fold_scores": fold_scores[index],
+                "fit_seconds": round(fit_seconds[index], 6),
+                "error": errors.get(index),
+            }
+        )
+    leaderboard.sort(key=lambda row: (row["mean_score"] is None, -(row["mean_score"] or 0.0)))
+    if leaderboard[0]["mean_score"] is None:
+        raise ValueError(f"No search candidate could be fitted: {leaderboard[0]['error']}")
+
+    result = SearchResult(
+        best_params=leaderboard[0]["params"],
+        best_score=leaderboard[0]["mean_score"],
+        leaderboard=leaderboard,
+        elapsed_seconds=time.perf_counter() - start,
+    )
+    audit_event(
+        "training",
+        "search_completed",
+        f"candidates={len(candidates)} folds={len(folds)} best_score={result.best_score:.3f}",
+    )
+    return result
@@ -2,21 +2,197 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from backend.utils.hash_utils import sha256_file, sign_blob, verify_signature
+from backend.utils.hash_utils import (
+    SIGNING_KEY,
+    sha256_directory,
+    sha256_file,
+    sign_blob,
+    verify_signature,
+)
 from backend.utils.logger import get_logger
+from backend.utils.metrics import DIGEST_COUNTER, metrics, timed
+
+try:  # pragma: no cover - fcntl is unavailable on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 logger = get_logger(__name__)
 
+DIGEST_CACHE_FILE = Path(os.getenv("MLOPS_DIGEST_CACHE", "models/digest_cache.json"))
+DIGEST_CACHE_MAX_ENTRIES = 4096
+VERIFY_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class DigestCache:
+    """Persisted map from file identity to its SHA256 digest.
+
+    Entries are keyed by resolved path, inode, size, mtime_ns and ctime_ns. ctime cannot
+    be set from user space, so rewriting a file (even with a forged mtime) always misses.
+    The cache file sits under ``models/``, which is not trusted, so each persisted entry
+    carries an HMAC of its key and digest under the signing key; entries that fail the
+    check are dropped on load and the file is re-hashed.
+    Directory artifacts are digested from their per-file cached digests.
+
+    New entries are written once per ``digest`` call, not once per file. Several
+    processes share the file: each write holds an ``flock`` on a sidecar lock file,
+    merges this process's new entries into what is on disk and replaces the file from
+    a per-process temporary name.
+    """
+
+    def __init__(self, path: Optional[Path] = DIGEST_CACHE_FILE, key: str = SIGNING_KEY) -> None:
+        self.path = path
+        self._key = key.encode()
+        self._entries: OrderedDict[str, Tuple[str, str]] = OrderedDict()
+        self._unsaved: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self._entries.update(self._read())
+
+    def _tag(self, key: str, digest: str) -> str:
+        return hmac.new(self._key, f"{key}\0{digest}".encode(), hashlib.sha256).hexdigest()
+
+    def _read(self) -> Dict[str, Tuple[str, str]]:
+        """Return the on-disk entries whose integrity tag checks out."""
+
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            stored = json.loads(self.path.read_text())
+            if not isinstance(stored, dict):
+                raise ValueError("digest cache must be a JSON object")
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable digest cache %s: %s", self.path, exc)
+            return {}
+        entries: Dict[str, Tuple[str, str]] = {}
+        rejected = 0
+        for key, entry in stored.items():
+            try:
+                digest, tag = entry
+                valid = hmac.compare_digest(self._tag(key, digest), tag)
+            except (TypeError, ValueError):
+                valid = False
+            if valid:
+                entries[key] = (digest, tag)
+            else:
+                rejected += 1
+        if rejected:
+            self.rejected += rejected
+            logger.warning(
+                "Dropped %d digest cache entries that failed the integrity check", rejected
+            )
+        return entries
+
+    @staticmethod
+    def key(path: Path) -> str:
+        stat = path.stat()
+        return (
+            f"{path.resolve()}|{stat.st_ino}|{stat.st_size}|{stat.st_mtime_ns}|{stat.st_ctime_ns}"
+        )
+
+    def digest(self, path: Path) -> str:
+        """Return the artifact digest, hashing only files whose identity is not cached."""
+
+        if path.is_dir():
+            digest = sha256_directory(path, file_digest=self._file_digest)
+        else:
+            digest = self._file_digest(path)
+        self.flush()
+        return digest
+
+    def _file_digest(self, path: Path) -> str:
+        key = self.key(path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.increment(DIGEST_COUNTER, result="hit")
+                return cached[0]
+        metrics.increment(DIGEST_COUNTER, result="miss")
+        with timed("model_signer", "hash"):
+            digest = sha256_file(path)
+        entry = (digest, self._tag(key, digest))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = self._unsaved[key] = entry
+            while len(self._entries) > DIGEST_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        return digest
+
+    @contextmanager
+    def _file_locked(self) -> Iterator[None]:
+        with self.path.with_name(f"{self.path.name}.lock").open("a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def flush(self) -> None:
+        """Merge entries hashed since the last flush into the cache file atomically."""
+
+        if self.path is None:
+            return
+        with self._lock:
+            unsaved, self._unsaved = self._unsaved, {}
+        if not unsaved:
+            return
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        try:
+            with self._write_lock, self._file_locked():
+                merged = OrderedDict(self._read())
+                for key, entry in unsaved.items():
+                    merged.pop(key, None)
+                    merged[key] = entry
+                while len(merged) > DIGEST_CACHE_MAX_ENTRIES:
+                    merged.popitem(last=False)
+                tmp_path.write_text(json.dumps(merged))
+                os.replace(tmp_path, self.path)
+        except OSError as exc:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to persist digest cache %s: %s", self.path, exc)
+
+
+_shared_cache: Optional[DigestCache] = None
+
+
+def shared_digest_cache() -> DigestCache:
+    """Return the process-wide digest cache used by default signers."""
+
+    global _shared_cache  # noqa: PLW0603 - lazily created singleton
+    if _shared_cache is None:
+        _shared_cache = DigestCache()
+    return _shared_cache
+
 
 class ModelSigner:
     """Handle model hashing and signing."""
 
+    def __init__(self, digest_cache: Optional[DigestCache] = None) -> None:
+        self.digest_cache = digest_cache or shared_digest_cache()
+
     def sign_model(self, model_path: Path) -> str:
         """Return a simulated signature for the provided model file."""
 
-        digest = sha256_file(model_path)
+        digest = self.digest_cache.digest(model_path)
         signature = sign_blob(digest.encode())
         logger.info("Model %s signed with digest %s", model_path.name, digest)
         return signature
@@ -24,5 +200,22 @@ class ModelSigner:
     def verify_model(self, model_path: Path, signature: str) -> bool:
         """Check whether the provided signature matches the model digest."""
 
-        digest = sha256_file(model_path)
+        digest = self.digest_cache.digest(model_path)
         return verify_signature(digest.encode(), signature)
+
+    def verify_many(
+        self, items: Sequence[Tuple[Path, str]], max_workers: int = VERIFY_MAX_WORKERS
+    ) -> List[bool]:
+        """Verify several (path, signature) pairs concurrently, preserving input order."""
+
+        def _verify(item: Tuple[Path, str]) -> bool:
+            path, signature = item
+            if not path.exists():
+                logger.error("Model path missing: %s", path)
+                return False
+            return self.verify_model(path, signature)
+
+        if len(items) <= 1:
+            return [_verify(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(_verify, items))
@@ -0,0 +1,429 @@
+"""Storage backends for the model registry (JSON file and SQLite WAL)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from backend.utils.logger import audit_event, get_logger
+
+try:  # pragma: no cover - fcntl is unavailable on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = get_logger(__name__)
+
+REGISTRY_FILE = Path("models/registry.json")
+REGISTRY_DB = Path(os.getenv("MLOPS_REGISTRY_DB", "models/registry.db"))
+REGISTRY_BACKEND = os.getenv("MLOPS_REGISTRY_BACKEND", "json")
+REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+
+@dataclass
+class ModelRecord:
+    run_id: str
+    path: str
+    metrics: Dict[str, float]
+    signature: str
+    metadata: Dict[str, str]
+    approved: bool = False
+    baseline_profile: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RegistryView:
+    """Parsed registry snapshot with an O(1) ``run_id`` index and deployed pointer."""
+
+    models: List[ModelRecord]
+    index: Dict[str, ModelRecord]
+    deployed_run_id: Optional[str]
+    stamp: Hashable
+
+    @classmethod
+    def build(cls, registry: Dict, stamp: Hashable) -> "RegistryView":
+        models = [ModelRecord(**item) for item in registry.get("models", [])]
+        index: Dict[str, ModelRecord] = {}
+        for model in models:
+            index.setdefault(model.run_id, model)
+        return cls(models, index, registry.get("deployed_run_id"), stamp)
+
+
+class RegistryStore(ABC):
+    """Persistence interface behind ``ModelRegistry``.
+
+    Returned records are shared between callers and must be treated as read-only.
+    """
+
+    @abstractmethod
+    def list_models(self) -> List[ModelRecord]:
+        """Return all records in registration order."""
+
+    @abstractmethod
+    def latest_model(self) -> Optional[ModelRecord]:
+        """Return the most recently registered record."""
+
+    @abstractmethod
+    def get_model(self, run_id: str) -> Optional[ModelRecord]:
+        """Return the record for ``run_id`` if present."""
+
+    @abstractmethod
+    def deployed_model(self) -> Optional[ModelRecord]:
+        """Return the record the deployment pointer refers to."""
+
+    @abstractmethod
+    def append(self, record: ModelRecord) -> None:
+        """Persist a newly registered record."""
+
+    @abstractmethod
+    def approve(self, run_id: str) -> bool:
+        """Mark ``run_id`` approved; return False when the run is unknown."""
+
+    @abstractmethod
+    def set_deployed(self, run_id: str) -> bool:
+        """Point the deployment at ``run_id`` if it exists and is approved."""
+
+    @abstractmethod
+    def version(self) -> Hashable:
+        """Return a token that changes whenever registry content changes."""
+
+
+class JsonRegistryStore(RegistryStore):
+    """Registry persisted as a single JSON document.
+
+    Reads are served from an in-process ``RegistryView`` rebuilt only when the file's
+    inode/size/mtime stamp changes. Read-modify-write cycles hold an exclusive
+    ``flock`` on a sidecar lock file so concurrent workers do not lose updates.
+    """
+
+    def __init__(self, path: Path = REGISTRY_FILE) -> None:
+        self.path = path
+        self.lock_path = path.with_suffix(".json.lock")
+        self.generation = 0
+        self._view: Optional[RegistryView] = None
+        if not self.path.exists():
+            self.path.write_text(json.dumps({"models": [], "deployed_run_id": None}, indent=2))
+
+    def _file_stamp(self) -> Tuple[int, int, int]:
+        """Identify the on-disk registry version by inode, size and modification time."""
+
+        stat = self.path.stat()
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def load(self) -> Dict:
+        """Load registry content from disk."""
+
+        registry = json.loads(self.path.read_text())
+        # Older registries may not track deployed state; normalize here.
+        registry.setdefault("deployed_run_id", None)
+        registry.setdefault("models", [])
+        return registry
+
+    def _save(self, registry: Dict) -> None:
+        """Persist registry content atomically and refresh the cached view."""
+
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(registry, indent=2))
+        os.replace(tmp_path, self.path)
+        self._install_view(RegistryView.build(registry, self._file_stamp()))
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict]:
+        """Hold the registry write lock and yield freshly loaded content."""
+
+        with self.lock_path.open("a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield self.load()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _install_view(self, view: RegistryView) -> RegistryView:
+        """Publish a new registry view and bump the change generation."""
+
+        self._view = view
+        self.generation += 1
+        return view
+
+    def view(self) -> RegistryView:
+        """Return the cached view, re-parsing the registry only if the file changed."""
+
+        stamp = self._file_stamp()
+        view = self._view
+        if view is not None and view.stamp == stamp:
+            return view
+        return self._install_view(RegistryView.build(self.load(), stamp))
+
+    def list_models(self) -> List[ModelRecord]:
+        return list(self.view().models)
+
+    def latest_model(self) -> Optional[ModelRecord]:
+        models = self.view().models
+        return models[-1] if models else None
+
+    def get_model(self, run_id: str) -> Optional[ModelRecord]:
+        return self.view().index.get(run_id)
+
+    def deployed_model(self) -> Optional[ModelRecord]:
+        view = self.view()
+        if not view.deployed_run_id:
+            return None
+        return view.index.get(view.deployed_run_id)
+
+    def append(self, record: ModelRecord) -> None:
+        with self._locked() as registry:
+            registry["models"].append(record.__dict__)
+            self._save(registry)
+
+    def approve(self, run_id: str) -> bool:
+        with self._locked() as registry:
+            updated = False
+            for item in registry.get("models", []):
+                if item["run_id"] == run_id:
+                    item["approved"] = True
+                    updated = True
+            if updated:
+                self._save(registry)
+        return updated
+
+    def set_deployed(self, run_id: str) -> bool:
+        with self._locked() as registry:
+            for item in registry.get("models", []):
+                if item.get("run_id") == run_id:
+                    if not item.get("approved"):
+                        return False
+                    registry["deployed_run_id"] = run_id
+                    self._save(registry)
+                    return True
+        return False
+
+    def version(self) -> Hashable:
+        return self.view().stamp
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    baseline_profile TEXT NOT NULL DEFAULT '{}',
+    registered_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS approvals (
+    run_id TEXT PRIMARY KEY REFERENCES runs(run_id),
+    approved_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS deployment (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    deployed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+CREATE TRIGGER IF NOT EXISTS runs_bump AFTER INSERT ON runs
+BEGIN UPDATE meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS approvals_bump AFTER INSERT ON approvals
+BEGIN UPDATE meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS deployment_insert_bump AFTER INSERT ON deployment
+BEGIN UPDATE meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS deployment_update_bump AFTER UPDATE ON deployment
+BEGIN UPDATE meta SET value = value + 1 WHERE key = 'generation'; END;
+"""
+
+RECORD_QUERY = """
+SELECT r.run_id, r.path, r.metrics, r.signature, r.metadata,
+       a.run_id IS NOT NULL AS approved, r.baseline_profile
+FROM runs r LEFT JOIN approvals a ON a.run_id = r.run_id
+"""
+
+
+def _row_to_record(row: Tuple) -> ModelRecord:
+    run_id, path, metrics, signature, metadata, approved, baseline = row
+    return ModelRecord(
+        run_id=run_id,
+        path=path,
+        metrics=json.loads(metrics),
+        signature=signature,
+        metadata=json.loads(metadata),
+        approved=bool(approved),
+        baseline_profile=json.loads(baseline),
+    )
+
+
+class SqliteRegistryStore(RegistryStore):
+    """Registry persisted in SQLite (WAL mode) with indexed runs, approvals and pointer.
+
+    Every mutation is a single SQL statement, so it commits atomically and costs the
+    same regardless of history length. Triggers bump a ``generation`` counter that
+    serves as the change token. Connections are per thread and per process, which
+    makes the store safe to share between threadpool requests and uvicorn workers.
+    """
+
+    def __init__(self, path: Path = REGISTRY_DB, json_path: Optional[Path] = REGISTRY_FILE) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._list_cache: Tuple[int, List[ModelRecord]] = (-1, [])
+        with self._connection() as conn:
+            conn.executescript(SQLITE_SCHEMA)
+        if json_path is not None:
+            self.migrate_from_json(json_path)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection, reopening it after a fork."""
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        yield conn
+
+    def migrate_from_json(self, json_path: Path) -> int:
+        """Import runs, approvals and the deployed pointer from a JSON registry once."""
+
+        if not json_path.exists():
+            return 0
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone()
+                has_runs = conn.execute("SELECT 1 FROM runs LIMIT 1").fetchone()
+                if done or has_runs:
+                    conn.execute("COMMIT")
+                    return 0
+                registry = JsonRegistryStore(json_path).load()
+                now = time.time()
+                imported = 0
+                for item in registry.get("models", []):
+                    record = ModelRecord(**item)
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO runs (run_id, path, metrics, signature, metadata,"
+                        " baseline_profile, registered_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        self._record_params(record, now),
+                    )
+                    imported += cursor.rowcount
+                    if record.approved:
+                        conn.execute(
+                            "INSERT OR IGNORE INTO approvals (run_id, approved_at) VALUES (?, ?)",
+                            (record.run_id, now),
+                        )
+                deployed = registry.get("deployed_run_id")
+                if deployed:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO deployment (id, run_id, deployed_at)"
+                        " SELECT 1, run_id, ? FROM runs WHERE run_id = ?",
+                        (now, deployed),
+                    )
+                conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_json', 1)")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        if imported:
+            audit_event("registry", "migrated", f"runs={imported} from={json_path}")
+        return imported
+
+    @staticmethod
+    def _record_params(record: ModelRecord, registered_at: float) -> Tuple:
+        return (
+            record.run_id,
+            record.path,
+            json.dumps(record.metrics),
+            record.signature,
+            json.dumps(record.metadata),
+            json.dumps(record.baseline_profile),
+            registered_at,
+        )
+
+    def _query_one(self, sql: str, params: Tuple = ()) -> Optional[ModelRecord]:
+        with self._connection() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return _row_to_record(row) if row else None
+
+    def list_models(self) -> List[ModelRecord]:
+        generation = self.version()
+        cached_generation, records = self._list_cache
+        if cached_generation != generation:
+            with self._connection() as conn:
+                rows = conn.execute(RECORD_QUERY + " ORDER BY r.seq").fetchall()
+            records = [_row_to_record(row) for row in rows]
+            self._list_cache = (generation, records)
+        return list(records)
+
+    def latest_model(self) -> Optional[ModelRecord]:
+        return self._query_one(RECORD_QUERY + " ORDER BY r.seq DESC LIMIT 1")
+
+    def get_model(self, run_id: str) -> Optional[ModelRecord]:
+        return self._query_one(RECORD_QUERY + " WHERE r.run_id = ?", (run_id,))
+
+    def deployed_model(self) -> Optional[ModelRecord]:
+        return self._query_one(
+            RECORD_QUERY + " JOIN deployment d ON d.run_id = r.run_id WHERE d.id = 1"
+        )
+
+    def append(self, record: ModelRecord) -> None:
+        with self._connection() as conn:
+            try:
+                conn.execute(
+                    "INSERT INTO runs (run_id, path, metrics, signature, metadata,"
+                    " baseline_profile, registered_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._record_params(record, time.time()),
+                )
+            except sqlite3.IntegrityError as exc:
+                raise ValueError(f"run_id {record.run_id} is already registered") from exc
+
+    def approve(self, run_id: str) -> bool:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO approvals (run_id, approved_at)"
+                " SELECT run_id, ? FROM runs WHERE run_id = ?",
+                (time.time(), run_id),
+            )
+            row = conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row is not None
+
+    def set_deployed(self, run_id: str) -> bool:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO deployment (id, run_id, deployed_at)"
+                " SELECT 1, run_id, ? FROM approvals WHERE run_id = ?"
+                " ON CONFLICT (id) DO UPDATE SET"
+                " run_id = excluded.run_id, deployed_at = excluded.deployed_at",
+                (time.time(), run_id),
+            )
+        return cursor.rowcount > 0
+
+    def version(self) -> Hashable:
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return row[0]
+
+
+def create_registry_store(backend: str = REGISTRY_BACKEND) -> RegistryStore:
+    """Instantiate the configured registry backend (``json`` or ``sqlite``)."""
+
+    if backend == "sqlite":
+        return SqliteRegistryStore()
+    if backend == "json":
+        return JsonRegistryStore()
+    raise ValueError(f"Unknown registry backend: {backend}")
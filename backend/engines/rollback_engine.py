@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from backend.engines.model_registry import ModelRegistry
+from backend.engines.model_signer import VERIFY_MAX_WORKERS
 from backend.utils.logger import audit_event, get_logger
 
 logger = get_logger(__name__)
 
 MIN_HISTORY_LENGTH = 2
+VERIFY_BATCH_SIZE = VERIFY_MAX_WORKERS
 
 
 class RollbackEngine:
@@ -24,17 +26,22 @@ class RollbackEngine:
             logger.warning("No previous model to rollback to")
             return False
 
-        # Pick the most recent approved model before the latest entry.
+        # Pick the most recent approved model before the latest entry, verifying
+        # candidates in concurrent batches and stopping at the first valid batch.
+        candidates = [model for model in reversed(models[:-1]) if model.approved]
         previous_model = None
-        for model in reversed(models[:-1]):
-            if model.approved and self.registry.verify_run(model.run_id):
-                previous_model = model
+        for start in range(0, len(candidates), VERIFY_BATCH_SIZE):
+            batch = candidates[start : start + VERIFY_BATCH_SIZE]
+            verified = self.registry.verify_many([model.run_id for model in batch])
+            previous_model = next((m for m in batch if verified[m.run_id]), None)
+            if previous_model is not None:
                 break
 
         if previous_model is None:
             logger.warning("No approved historical model available for rollback")
             return False
 
+        # mark_deployed also swaps the in-memory serving cache to the rollback target.
         if not self.registry.mark_deployed(previous_model.run_id):
             logger.error("Failed to mark rollback target %s as deployed", previous_model.run_id)
             return False
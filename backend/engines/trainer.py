@@ -2,26 +2,79 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 from sklearn.model_selection import train_test_split
 
 from backend.engines.adversarial_tests import AdversarialTester
+from backend.engines.drift_detector import BaselineProfile
 from backend.engines.evaluator import Evaluator
 from backend.engines.fairness import FairnessAnalyzer
-from backend.engines.model_registry import ModelRegistry
+from backend.engines.model_registry import ModelRecord, ModelRegistry
+from backend.engines.model_search import SearchSpace, build_candidate, run_search
 from backend.engines.model_signer import ModelSigner
 from backend.utils.logger import audit_event, get_logger
+from backend.utils.metrics import record_stage_timings
+from backend.utils.profiling import profiled
 
 logger = get_logger(__name__)
 
 MIN_CLASSES = 2
+INCREMENTAL_EPOCHS = 5
+INCREMENTAL_ETA0 = 0.01
+WARM_START_CLASSES_ERROR = (
+    "Warm-starting from a logistic regression run needs both classes in the batch"
+)
+POST_FIT_WORKERS = 4
+FEATURE_COLUMNS = ["feature1", "feature2", "feature3"]
+
+ProgressCallback = Callable[[str, float], None]
+
+
+def new_run_id() -> str:
+    """Return a run identifier that stays unique under concurrent training."""
+
+    return f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+
+
+def _noop_progress(stage: str, fraction: float) -> None:
+    """Default progress callback used when training runs inline."""
+
+
+@contextmanager
+def _stage_timer(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    """Record the wall time of a training stage in ``timings``."""
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round(time.perf_counter() - start, 6)
+
+
+def _timed(timings: Dict[str, float], stage: str, func: Callable, *args: Any) -> Any:
+    # Post-fit stages run on pool threads, which a job profile only sees via ``profiled``.
+    with _stage_timer(timings, stage), profiled():
+        return func(*args)
+
+
+def _holdout_split(
+    X: np.ndarray, y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split off the evaluation holdout; raises ``ValueError`` when ``X`` is too small."""
+
+    return train_test_split(X, y, test_size=0.2, random_state=42)
 
 
 @dataclass
@@ -42,54 +95,257 @@ class Trainer:
         self.adversarial_tester = AdversarialTester()
         self.fairness_analyzer = FairnessAnalyzer()
 
-    def _prepare_data(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    def _prepare_data(
+        self, df: pd.DataFrame, min_classes: int = MIN_CLASSES
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Extract feature matrix and labels from the training DataFrame."""
 
-        required_columns = {"feature1", "feature2", "feature3", "label"}
+        required_columns = {*FEATURE_COLUMNS, "label"}
         missing = required_columns - set(df.columns)
         if missing:
             raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-        features = df[["feature1", "feature2", "feature3"]].values
+        features = df[FEATURE_COLUMNS].values
         labels = df["label"].values
-        if len(set(labels)) < MIN_CLASSES:
+        if len(set(labels)) < min_classes:
             raise ValueError("Training data must contain at least two classes for classification")
         return features, labels
 
-    def train(self, df: pd.DataFrame, run_id: str) -> TrainingOutput:
-        """Run the full training workflow including evaluation and registry updates."""
+    def precheck(
+        self, df: pd.DataFrame, incremental: bool = False, parent_run_id: Optional[str] = None
+    ) -> None:
+        """Raise ``ValueError`` early when ``df`` cannot be trained on.
 
-        X, y = self._prepare_data(df)
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        Incremental batches are split exactly as the job will split them, so a batch
+        too small for the holdout, or a training split with one class against a
+        logistic-regression parent, is rejected before a job is queued.
+        """
 
-        model = LogisticRegression(max_iter=200)
-        model.fit(X_train, y_train)
+        if not incremental:
+            _holdout_split(*self._prepare_data(df))
+            return
+        X, y = self._prepare_data(df, min_classes=1)
+        parent = self.resolve_parent(parent_run_id)
+        _, _, y_train, _ = _holdout_split(X, y)
+        if (
+            parent.metadata.get("training_mode") != "incremental"
+            and len(set(y_train)) < MIN_CLASSES
+        ):
+            raise ValueError(WARM_START_CLASSES_ERROR)
 
-        predictions = model.predict(X_test)
-        metrics = self.evaluator.evaluate(y_test, predictions)
+    def train(
+        self,
+        df: pd.DataFrame,
+        run_id: str,
+        progress: Optional[ProgressCallback] = None,
+        search: Optional[SearchSpace] = None,
+    ) -> TrainingOutput:
+        """Run the full training workflow including evaluation and registry updates.
 
-        adv_score = self.adversarial_tester.score(model, X_test, y_test)
-        fairness_report = self.fairness_analyzer.analyze(y_test, predictions)
+        ``progress`` is called with ``(stage, fraction)`` at each stage boundary; it may
+        raise to abort the run before the next stage starts. With ``search`` the
+        candidates are scored in parallel on the training split and only the winner is
+        refitted, evaluated and registered.
+        """
+
+        progress = progress or _noop_progress
+        timings: Dict[str, float] = {}
+        progress("prepare", 0.0)
+        with _stage_timer(timings, "prepare"):
+            X, y = self._prepare_data(df)
+            X_train, X_test, y_train, y_test = _holdout_split(X, y)
+
+        lineage = {"training_mode": "full"}
+        params: Dict[str, Any] = {}
+        if search is not None:
+            progress("search", 0.1)
+            result = _timed(timings, "search", run_search, search, X_train, y_train)
+            params = result.best_params
+            lineage["search"] = json.dumps(result.summary(search))
+
+        progress("fit", 0.4 if search is not None else 0.1)
+        with _stage_timer(timings, "fit"):
+            model = build_candidate(params)
+            model.fit(X_train, y_train)
+            baseline_profile = BaselineProfile.from_matrix(X, FEATURE_COLUMNS)
+        return self._finalize(
+            model, run_id, X_test, y_test, baseline_profile, lineage, progress, timings
+        )
+
+    def train_incremental(
+        self,
+        df: pd.DataFrame,
+        run_id: str,
+        parent_run_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> TrainingOutput:
+        """Continue training from a registered run using only the rows in ``df``.
+
+        The parent (the deployed run unless ``parent_run_id`` is given) is loaded after
+        signature verification. A logistic-regression parent seeds an ``SGDClassifier``
+        with its coefficients; an SGD parent is updated in place with ``partial_fit``.
+        The SGD step size decays from ``INCREMENTAL_ETA0`` and the L2 penalty matches
+        the parent's ``C`` over every row seen so far, so a small batch refines the
+        parent instead of overwriting it. Cost scales with the new batch rather than
+        the full history.
+        """
+
+        progress = progress or _noop_progress
+        timings: Dict[str, float] = {}
+        progress("prepare", 0.0)
+        with _stage_timer(timings, "prepare"):
+            parent = self.resolve_parent(parent_run_id)
+            parent_model = self.registry.load_run(parent.run_id)
+            X, y = self._prepare_data(df, min_classes=1)
+            unknown = set(y) - set(parent_model.classes_)
+            if unknown:
+                raise ValueError(
+                    f"Labels {sorted(unknown)} are unknown to parent run {parent.run_id}"
+                )
+            X_train, X_test, y_train, y_test = _holdout_split(X, y)
+
+        progress("fit", 0.1)
+        with _stage_timer(timings, "fit"):
+            rows_seen = (parent.baseline_profile or {}).get("count", 0) + len(X_train)
+            model = self._continue_fit(parent_model, X_train, y_train, rows_seen)
+            if parent.baseline_profile:
+                baseline_profile = BaselineProfile.from_dict(parent.baseline_profile).merge_matrix(
+                    X
+                )
+            else:
+                baseline_profile = BaselineProfile.from_matrix(X, FEATURE_COLUMNS)
+        lineage = {
+            "training_mode": "incremental",
+            "parent_run_id": parent.run_id,
+            "parent_model": type(parent_model).__name__,
+            "rows_trained": str(len(X_train)),
+        }
+        return self._finalize(
+            model, run_id, X_test, y_test, baseline_profile, lineage, progress, timings
+        )
+
+    @staticmethod
+    def _continue_fit(
+        parent_model: Any, X_train: np.ndarray, y_train: np.ndarray, rows_seen: int
+    ) -> Any:
+        """Return an SGD model that continues from ``parent_model`` on the new rows."""
+
+        if isinstance(parent_model, SGDClassifier):
+            model = copy.deepcopy(parent_model)
+            model.partial_fit(X_train, y_train)
+            return model
+        if len(set(y_train)) < MIN_CLASSES:
+            raise ValueError(WARM_START_CLASSES_ERROR)
+        # LogisticRegression minimises C * sum(loss) + ||w||^2 / 2; per row that is an
+        # SGD penalty of alpha = 1 / (C * n).
+        model = SGDClassifier(
+            loss="log_loss",
+            alpha=1.0 / (parent_model.C * max(rows_seen, 1)),
+            learning_rate="invscaling",
+            eta0=INCREMENTAL_ETA0,
+            max_iter=INCREMENTAL_EPOCHS,
+            tol=None,
+            random_state=42,
+        )
+        model.fit(
+            X_train,
+            y_train,
+            coef_init=parent_model.coef_,
+            intercept_init=parent_model.intercept_,
+        )
+        return model
+
+    def resolve_parent(self, parent_run_id: Optional[str]) -> ModelRecord:
+        """Return the registry record that incremental training continues from."""
+
+        if parent_run_id is None:
+            parent = self.registry.deployed_model()
+            if parent is None:
+                raise ValueError("No deployed model to continue training from")
+            return parent
+        parent = self.registry.get_model(parent_run_id)
+        if parent is None:
+            raise ValueError(f"Unknown parent run_id: {parent_run_id}")
+        return parent
+
+    def _finalize(
+        self,
+        model: Any,
+        run_id: str,
+        X_test: np.ndarray,
+        y_test: np.ndarray,
+        baseline_profile: BaselineProfile,
+        lineage: Dict[str, str],
+        progress: ProgressCallback,
+        timings: Dict[str, float],
+    ) -> TrainingOutput:
+        """Evaluate, save, sign and register a fitted model.
+
+        Evaluation, adversarial testing, fairness analysis and the save-then-sign chain
+        do not depend on each other, so they run concurrently on a small thread pool.
+        """
+
+        progress("post_fit", 0.5)
+        with _stage_timer(timings, "post_fit"):
+            predictions = _timed(timings, "predict", model.predict, X_test)
+            with ThreadPoolExecutor(max_workers=POST_FIT_WORKERS) as pool:
+                metrics_future = pool.submit(
+                    _timed, timings, "evaluate", self.evaluator.evaluate, y_test, predictions
+                )
+                adversarial_future = pool.submit(
+                    _timed,
+                    timings,
+                    "adversarial",
+                    self.adversarial_tester.evaluate,
+                    model,
+                    X_test,
+                    y_test,
+                )
+                fairness_future = pool.submit(
+                    _timed,
+                    timings,
+                    "fairness",
+                    self.fairness_analyzer.analyze,
+                    y_test,
+                    predictions,
+                )
+                artifact_future = pool.submit(self._save_and_sign, model, run_id, timings)
+                metrics = metrics_future.result()
+                adversarial_report = adversarial_future.result()
+                fairness_report = fairness_future.result()
+                model_path, signature = artifact_future.result()
 
         metadata = {
             "run_id": run_id,
+            "trained_at": f"{time.time():.3f}",
             "metrics": json.dumps(metrics),
-            "adversarial_score": str(adv_score),
+            "adversarial_score": str(self.adversarial_tester.summary_score(adversarial_report)),
+            "adversarial": json.dumps(adversarial_report),
             "fairness": json.dumps(fairness_report),
+            "stage_timings": json.dumps(timings),
+            **lineage,
         }
 
-        model_path = self.registry.save_model(model, run_id)
-        signature = self.signer.sign_model(model_path)
-
+        progress("register", 0.9)
         self.registry.register_model(
             run_id=run_id,
             model_path=model_path,
             metrics=metrics,
             signature=signature,
             metadata=metadata,
+            baseline_profile=baseline_profile.to_dict(),
         )
 
+        record_stage_timings("trainer", timings)
         audit_event("training", "completed", f"run_id={run_id} accuracy={metrics['accuracy']:.3f}")
+        progress("done", 1.0)
         return TrainingOutput(
             model_path=model_path, metrics=metrics, metadata=metadata, signature=signature
         )
+
+    def _save_and_sign(
+        self, model: Any, run_id: str, timings: Dict[str, float]
+    ) -> Tuple[Path, str]:
+        model_path = _timed(timings, "save", self.registry.save_model, model, run_id)
+        signature = _timed(timings, "sign", self.signer.sign_model, model_path)
+        return model_path, signature
@@ -3,23 +3,39 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 import time
 from typing import Any, Dict, List, Optional
 
-import joblib
 import numpy as np
 import pandas as pd
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, validator
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import BaseModel, root_validator, validator
+from starlette.concurrency import run_in_threadpool
 
 from backend.engines.compliance_engine import ComplianceEngine
 from backend.engines.container_builder import ContainerBuilder
+from backend.engines.dashboard import DashboardSnapshotCache, etag_matches
 from backend.engines.data_validator import DataValidator, ValidationResult
-from backend.engines.drift_detector import DriftDetector
-from backend.engines.model_registry import ModelRecord, ModelRegistry
+from backend.engines.drift_detector import BaselineProfile, DriftDetector
+from backend.engines.job_queue import JobQueueFullError, TrainingJob, TrainingJobQueue
+from backend.engines.micro_batcher import MicroBatcher, MicroBatcherOverloadedError
+from backend.engines.model_registry import ModelRegistry
+from backend.engines.model_search import SearchSpace
 from backend.engines.rollback_engine import RollbackEngine
-from backend.engines.trainer import Trainer
-from backend.utils.logger import audit_event, get_logger
+from backend.engines.trainer import FEATURE_COLUMNS, Trainer, new_run_id
+from backend.utils.dataset_io import UPLOAD_FORMATS, read_dataset_buffer, upload_format
+from backend.utils.logger import audit_event, get_logger, logging_stats
+from backend.utils.metrics import HTTP_COUNTER, HTTP_HISTOGRAM
+from backend.utils.metrics import metrics as runtime_metrics
+from backend.utils.profiling import (
+    PROFILING_ENABLED,
+    current_session,
+    profile_requests,
+    profiled,
+)
 
 app = FastAPI(title="Secure MLOps Pipeline", version="1.0.0")
 
@@ -33,10 +49,37 @@ rollback_engine = RollbackEngine(registry)
 compliance_engine = ComplianceEngine()
 
 
+def _on_training_complete(job: TrainingJob) -> None:
+    compliance_engine.record_event("NIST_AI_RMF", "Training completed")
+
+
+training_jobs = TrainingJobQueue(on_complete=_on_training_complete)
+
+MAX_BATCH_ROWS = 10_000
+MAX_UPLOAD_BYTES = int(os.getenv("MLOPS_MAX_UPLOAD_BYTES", str(256 * 1024 * 1024)))
+UPLOAD_SPOOL_BYTES = 16 * 1024 * 1024
+TRAINING_COLUMNS = [*FEATURE_COLUMNS, "label"]
+
+
+class SearchRequest(BaseModel):
+    """Optional hyperparameter search attached to a training request."""
+
+    params: Optional[Dict[str, List[Any]]] = None
+    strategy: str = "grid"
+    n_iter: int = 10
+    cv_folds: int = 0
+    n_jobs: Optional[int] = None
+
+    def to_space(self) -> SearchSpace:
+        overrides = {key: value for key, value in self.dict().items() if value is not None}
+        return SearchSpace(**overrides)
+
+
 class TrainRequest(BaseModel):
     """Schema for training data payloads."""
 
     records: List[Dict[str, float]]
+    search: Optional[SearchRequest] = None
 
     @classmethod
     def validate_non_empty(cls, value: List[Dict[str, float]]) -> List[Dict[str, float]]:
@@ -47,6 +90,15 @@ class TrainRequest(BaseModel):
     _records_not_empty = validator("records", allow_reuse=True)(validate_non_empty)
 
 
+class IncrementalTrainRequest(BaseModel):
+    """Training rows to fold into an existing run (the deployed one by default)."""
+
+    records: List[Dict[str, float]]
+    parent_run_id: Optional[str] = None
+
+    _records_not_empty = validator("records", allow_reuse=True)(TrainRequest.validate_non_empty)
+
+
 class DeployRequest(BaseModel):
     """Request body for deployment operations."""
 
@@ -73,6 +125,43 @@ class PredictRequest(BaseModel):
     feature3: float
 
 
+class BatchPredictRequest(BaseModel):
+    """Batch prediction input supplied either as rows or as feature columns."""
+
+    rows: Optional[List[List[float]]] = None
+    columns: Optional[Dict[str, List[float]]] = None
+
+    @root_validator(skip_on_failure=True)
+    def validate_shape(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        rows, columns = values.get("rows"), values.get("columns")
+        if (rows is None) == (columns is None):
+            raise ValueError("provide exactly one of rows or columns")
+        if rows is not None:
+            if any(len(row) != len(FEATURE_COLUMNS) for row in rows):
+                raise ValueError(f"each row must contain {len(FEATURE_COLUMNS)} features")
+            count = len(rows)
+        else:
+            missing = sorted(set(FEATURE_COLUMNS) - set(columns))
+            if missing:
+                raise ValueError(f"missing feature columns: {missing}")
+            lengths = {len(columns[name]) for name in FEATURE_COLUMNS}
+            if len(lengths) != 1:
+                raise ValueError("feature columns must have equal length")
+            count = lengths.pop()
+        if not 0 < count <= MAX_BATCH_ROWS:
+            raise ValueError(f"batch must contain between 1 and {MAX_BATCH_ROWS} rows")
+        return values
+
+    def to_matrix(self) -> np.ndarray:
+        """Return the batch as a contiguous (n_rows, n_features) float matrix."""
+
+        if self.rows is not None:
+            return np.asarray(self.rows, dtype=float)
+        return np.column_stack(
+            [np.asarray(self.columns[name], dtype=float) for name in FEATURE_COLUMNS]
+        )
+
+
 class PredictionResponse(BaseModel):
     """Response returned after predictions including drift score."""
 
@@ -80,10 +169,30 @@ class PredictionResponse(BaseModel):
     drift_score: float
 
 
+class BatchPredictionResponse(BaseModel):
+    """Response for batch predictions with a single batch-level drift score."""
+
+    predictions: List[int]
+    drift_score: float
+    count: int
+
+
+class DashboardRun(BaseModel):
+    """One registry entry as rendered by the dashboard."""
+
+    run_id: str
+    status: str
+    deployed: bool
+    metrics: Dict[str, float]
+    trained_at: Optional[float]
+    training_mode: Optional[str]
+    parent_run_id: Optional[str]
+
+
 class DashboardState(BaseModel):
     """Aggregated dashboard view returned to the frontend."""
 
-    registry: List[ModelRecord]
+    registry: List[DashboardRun]
     latest_metrics: Dict[str, Any]
     drift_score: float
     approvals: List[str]
@@ -97,16 +206,49 @@ def _load_dataframe(records: List[Dict[str, float]]) -> pd.DataFrame:
 
 
 def _load_deployed_model() -> Optional[Any]:
-    """Load the active deployed model from the registry if it exists."""
+    """Load the active deployed model for serving, preferring its verified fast path."""
 
-    deployed = registry.deployed_model()
-    if not deployed:
-        return None
     try:
-        return joblib.load(deployed.path)
+        entry = registry.load_deployed_entry()
     except Exception as exc:  # pragma: no cover - defensive guard
-        logger.error("Failed to load deployed model %s: %s", deployed.path, exc)
+        logger.error("Failed to load deployed model: %s", exc)
         return None
+    return entry.serving_model if entry else None
+
+
+def _activate_drift_baseline() -> None:
+    """Point the drift detector at the baseline profile of the deployed run."""
+
+    deployed = registry.deployed_model()
+    if deployed and deployed.baseline_profile:
+        drift_detector.load_profile(BaselineProfile.from_dict(deployed.baseline_profile))
+    else:
+        drift_detector.clear_baseline()
+
+
+_activate_drift_baseline()
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Record latency and status counts per route template."""
+
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        labels = {"method": request.method, "route": path}
+        runtime_metrics.observe(HTTP_HISTOGRAM, time.perf_counter() - start, **labels)
+        runtime_metrics.increment(HTTP_COUNTER, status=status, **labels)
+
+
+if PROFILING_ENABLED:
+    app.middleware("http")(profile_requests)
 
 
 @app.get("/health")
@@ -116,32 +258,148 @@ def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/train")
-def train_endpoint(request: TrainRequest) -> Dict[str, Any]:
-    """Trigger the training pipeline after validating incoming data."""
+@app.get("/serving/stats")
+def serving_stats() -> Dict[str, Any]:
+    """Expose serving-side cache counters for latency troubleshooting."""
 
-    df = _load_dataframe(request.records)
-    validation: ValidationResult = data_validator.validate(df)
+    return {
+        "model_cache": registry.model_cache.stats(),
+        "micro_batching": prediction_batcher.stats(),
+        "logging": logging_stats(),
+        "dashboard": dashboard_snapshots.stats(),
+    }
+
+
+def _train_on_dataframe(
+    df: pd.DataFrame, options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Validate a training DataFrame and queue a training job for it."""
+
+    with profiled():
+        validation: ValidationResult = data_validator.validate(df)
     if not validation.is_valid:
         raise HTTPException(status_code=400, detail=validation.issues)
-
-    run_id = str(int(time.time()))
     try:
-        output = trainer.train(df, run_id)
+        with profiled():
+            trainer.precheck(
+                df,
+                incremental=bool(options and options.get("incremental")),
+                parent_run_id=(options or {}).get("parent_run_id"),
+            )
     except ValueError as exc:
-        logger.error("Training failed validation for run %s: %s", run_id, exc)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    drift_detector.set_baseline(df[["feature1"]].values.flatten())
 
-    compliance_engine.record_event("NIST_AI_RMF", "Training completed")
+    session = current_session() if PROFILING_ENABLED else None
+    if session is not None:
+        options = {**(options or {}), "profile_id": session.profile_id}
+    try:
+        job = training_jobs.submit(df, new_run_id(), options)
+    except JobQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
     return {
-        "run_id": run_id,
-        "metrics": output.metrics,
-        "signature": output.signature,
+        "job_id": job.job_id,
+        "run_id": job.run_id,
+        "status": job.status,
         "validation": validation.__dict__,
     }
 
 
+@app.post("/train", status_code=202)
+def train_endpoint(request: TrainRequest) -> Dict[str, Any]:
+    """Validate incoming data and queue a training job; poll ``/jobs/{job_id}``."""
+
+    options = None
+    if request.search is not None:
+        try:
+            options = {"search": request.search.to_space()}
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _train_on_dataframe(_load_dataframe(request.records), options)
+
+
+@app.post("/train/incremental", status_code=202)
+def train_incremental(request: IncrementalTrainRequest) -> Dict[str, Any]:
+    """Queue a warm-start job that continues the deployed (or named) run on new rows only."""
+
+    try:
+        parent = trainer.resolve_parent(request.parent_run_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    options = {"incremental": True, "parent_run_id": parent.run_id}
+    result = _train_on_dataframe(_load_dataframe(request.records), options)
+    result["parent_run_id"] = parent.run_id
+    return result
+
+
+@app.post("/train/upload", status_code=202)
+async def train_upload(request: Request) -> Dict[str, Any]:
+    """Train from a raw CSV, Parquet, ``.npy`` or Arrow IPC request body."""
+
+    fmt = upload_format(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=415, detail=f"Content-Type must be one of {sorted(UPLOAD_FORMATS)}"
+        )
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {MAX_UPLOAD_BYTES} bytes")
+
+    received = 0
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_BYTES) as body:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=413, detail=f"Upload exceeds {MAX_UPLOAD_BYTES} bytes"
+                )
+            body.write(chunk)
+        body.seek(0)
+        start = time.perf_counter()
+        try:
+            df = await run_in_threadpool(read_dataset_buffer, body, fmt, TRAINING_COLUMNS)
+        except (ValueError, OSError) as exc:
+            raise HTTPException(status_code=400, detail=f"Unable to decode {fmt}: {exc}") from exc
+        parse_seconds = time.perf_counter() - start
+
+    result = await run_in_threadpool(_train_on_dataframe, df)
+    result["ingest"] = {
+        "format": fmt,
+        "bytes": received,
+        "rows": len(df),
+        "parse_seconds": round(parse_seconds, 6),
+    }
+    return result
+
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str) -> Dict[str, Any]:
+    """Report the status, stage, progress and stage timings of a training job."""
+
+    job = training_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.delete("/jobs/{job_id}")
+def cancel_job(job_id: str) -> Dict[str, Any]:
+    """Cancel a queued job, or stop a running one at its next stage boundary."""
+
+    job = training_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not training_jobs.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Job already {job.status}")
+    return training_jobs.get(job_id).to_dict()
+
+
+@app.on_event("shutdown")
+def shutdown_training_jobs() -> None:
+    """Stop the training worker pool with the application."""
+
+    training_jobs.shutdown()
+
+
 @app.post("/approve_model")
 def approve_model(request: ApprovalRequest) -> Dict[str, Any]:
     """Mark a specific run as approved for deployment."""
@@ -165,6 +423,7 @@ def deploy(request: DeployRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="Signature invalid")
     if not registry.mark_deployed(request.run_id):
         raise HTTPException(status_code=400, detail="Unable to mark deployment")
+    _activate_drift_baseline()
     audit_event("deploy", "initiated", f"run_id={request.run_id}")
     return {"status": "deployed", "run_id": request.run_id}
 
@@ -176,6 +435,7 @@ def rollback() -> Dict[str, Any]:
     success = rollback_engine.rollback()
     if not success:
         raise HTTPException(status_code=400, detail="No previous model")
+    _activate_drift_baseline()
     return {"rolled_back": True}
 
 
@@ -208,34 +468,90 @@ def metrics() -> Dict[str, Any]:
     return metrics_data
 
 
+def _score_rows(features: np.ndarray) -> List[PredictionResponse]:
+    """Score a micro-batch of single-row requests with one predict and one drift update."""
+
+    model = _load_deployed_model()
+    if model is None:
+        raise LookupError("No deployed model")
+    preds = model.predict(features)
+    drift_score = drift_detector.score(features)
+    if drift_detector.is_drifted():
+        audit_event("drift", "alert", f"score={drift_score} rows={len(features)}")
+    return [PredictionResponse(prediction=int(pred), drift_score=drift_score) for pred in preds]
+
+
+prediction_batcher = MicroBatcher(_score_rows)
+
+
+def _score_row_profiled(features: np.ndarray) -> PredictionResponse:
+    with profiled():
+        return _score_rows(features.reshape(1, -1))[0]
+
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse)
+def prometheus_metrics() -> PlainTextResponse:
+    """Expose route and engine-stage latency histograms in Prometheus text format."""
+
+    return PlainTextResponse(
+        runtime_metrics.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.post("/predict", response_model=PredictionResponse)
-def predict(request: PredictRequest) -> PredictionResponse:
-    """Perform prediction using the latest model and evaluate drift."""
+async def predict(request: PredictRequest) -> PredictionResponse:
+    """Perform prediction using the latest model and evaluate drift.
+
+    Concurrent calls are coalesced by the micro-batcher into one vectorized predict;
+    the returned drift score is that of the micro-batch the row was scored in.
+    """
+
+    features = np.array([request.feature1, request.feature2, request.feature3])
+    try:
+        if PROFILING_ENABLED and current_session() is not None:
+            # Profiled requests skip batching so the profile holds only their own scoring.
+            return await run_in_threadpool(_score_row_profiled, features)
+        return await prediction_batcher.submit(features)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail="No deployed model") from exc
+    except MicroBatcherOverloadedError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
+@app.post("/predict/batch", response_model=BatchPredictionResponse)
+def predict_batch(request: BatchPredictRequest) -> BatchPredictionResponse:
+    """Score a batch of rows with one vectorized predict and one drift evaluation."""
 
     model = _load_deployed_model()
     if model is None:
         raise HTTPException(status_code=404, detail="No deployed model")
-    features = np.array([[request.feature1, request.feature2, request.feature3]])
-    pred = int(model.predict(features)[0])
-    drift_score = drift_detector.score(features.flatten())
-    if drift_detector.is_drifted(features.flatten()):
-        audit_event("drift", "alert", f"score={drift_score}")
-    return PredictionResponse(prediction=pred, drift_score=drift_score)
+    features = request.to_matrix()
+    with profiled():
+        preds = model.predict(features)
+        drift_score = drift_detector.score(features)
+    if drift_detector.is_drifted():
+        audit_event("drift", "alert", f"score={drift_score} rows={len(features)}")
+    return BatchPredictionResponse(
+        predictions=preds.astype(int).tolist(), drift_score=drift_score, count=len(features)
+    )
 
 
-@app.get("/dashboard", response_model=DashboardState)
-def dashboard() -> DashboardState:
-    """Provide aggregate dashboard state for the frontend."""
+def _render_dashboard(payload: Dict[str, Any]) -> bytes:
+    """Validate a dashboard snapshot against ``DashboardState`` and serialize it once."""
 
-    models = registry.list_models()
-    approvals = [m.run_id for m in models if m.approved]
-    deployed = registry.deployed_model()
-    latest_metrics = json.loads(deployed.metadata.get("metrics", "{}")) if deployed else {}
-    drift_score = 0.0
-    return DashboardState(
-        registry=models,
-        latest_metrics=latest_metrics,
-        drift_score=drift_score,
-        approvals=approvals,
-        deployed_run_id=deployed.run_id if deployed else None,
-    )
+    return DashboardState(**payload).json(separators=(",", ":")).encode()
+
+
+dashboard_snapshots = DashboardSnapshotCache(registry, drift_detector, render=_render_dashboard)
+
+
+@app.get("/dashboard", response_model=DashboardState)
+def dashboard(request: Request) -> Response:
+    """Serve the dashboard snapshot, or 304 when the client's ETag is still current."""
+
+    snapshot = dashboard_snapshots.current()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        dashboard_snapshots.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
@@ -0,0 +1,79 @@
+"""Readers for on-disk and uploaded training datasets."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_ROWS = 100_000
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+MATRIX_NDIM = 2
+UPLOAD_FORMATS = {
+    "text/csv": "csv",
+    "application/vnd.apache.parquet": "parquet",
+    "application/x-parquet": "parquet",
+    "application/x-npy": "npy",
+    "application/vnd.apache.arrow.stream": "arrow",
+}
+
+
+def upload_format(content_type: Optional[str]) -> Optional[str]:
+    """Map a request Content-Type (ignoring parameters) to a dataset format name."""
+
+    if not content_type:
+        return None
+    return UPLOAD_FORMATS.get(content_type.split(";", 1)[0].strip().lower())
+
+
+def _require_pyarrow(feature: str) -> None:
+    try:
+        import pyarrow  # noqa: F401, PLC0415 - optional dependency
+    except ImportError as exc:
+        raise ValueError(f"{feature} requires the optional pyarrow package") from exc
+
+
+def iter_dataset_chunks(path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield a CSV or Parquet dataset as DataFrames of at most ``chunk_rows`` rows."""
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with pd.read_csv(path, chunksize=chunk_rows) as reader:
+            yield from reader
+    elif suffix in PARQUET_SUFFIXES:
+        _require_pyarrow("Parquet datasets")
+        import pyarrow.parquet as pq  # noqa: PLC0415 - optional dependency
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported dataset format: {path.suffix or path.name}")
+
+
+def read_dataset_buffer(source: BinaryIO, fmt: str, columns: Sequence[str]) -> pd.DataFrame:
+    """Decode an uploaded CSV, Parquet, ``.npy`` or Arrow IPC stream into a DataFrame.
+
+    Plain 2-D ``.npy`` arrays are mapped positionally onto ``columns``; structured
+    arrays keep their field names. Pickled object arrays are always rejected.
+    """
+
+    if fmt == "csv":
+        return pd.read_csv(source)
+    if fmt == "parquet":
+        _require_pyarrow("Parquet uploads")
+        return pd.read_parquet(source)
+    if fmt == "arrow":
+        _require_pyarrow("Arrow IPC uploads")
+        from pyarrow import ipc  # noqa: PLC0415 - optional dependency
+
+        return ipc.open_stream(source).read_all().to_pandas()
+    if fmt == "npy":
+        array = np.load(source, allow_pickle=False)
+        if array.dtype.names:
+            return pd.DataFrame(array)
+        if array.ndim != MATRIX_NDIM or array.shape[1] != len(columns):
+            raise ValueError(f"npy uploads must be 2-D with {len(columns)} columns {list(columns)}")
+        return pd.DataFrame(array, columns=list(columns))
+    raise ValueError(f"Unsupported dataset format: {fmt}")
@@ -3,30 +3,152 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import mmap
+import os
 from pathlib import Path
+from typing import Callable, List, Optional
 
+import numpy as np
+import pandas as pd
 
-def sha256_file(path: Path) -> str:
-    """Return SHA256 hash of a file."""
+HASH_BUFFER_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# Fingerprints are only comparable within one scheme; v1 digests differ from v2 ones.
+FINGERPRINT_SCHEME = "columnar-sha256-v2"
+FINGERPRINT_CHUNK_ROWS = 65_536
+SIGNING_KEY = "local-demo-key"
+
+
+def sha256_file(path: Path, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    """Return SHA256 hash of a file.
+
+    Large files are memory-mapped and hashed in a single ``update`` call, which lets
+    hashlib release the GIL for the whole digest; smaller files are read into a
+    reusable buffer.
+    """
     hash_obj = hashlib.sha256()
     with path.open("rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
-            hash_obj.update(chunk)
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
+            return hash_obj.hexdigest()
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                break
+            hash_obj.update(view[:read])
     return hash_obj.hexdigest()
 
 
-def fingerprint_dataset(content: bytes) -> str:
-    """Fingerprint dataset bytes."""
-    return hashlib.sha256(content).hexdigest()
+def sha256_directory(path: Path, file_digest: Callable[[Path], str] = sha256_file) -> str:
+    """Return a SHA256 over every file in a directory artifact.
+
+    The digest covers each relative file name and that file's own digest in sorted
+    order, so adding, removing, renaming or editing any file changes it.
+    """
+    hash_obj = hashlib.sha256()
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        relative = file.relative_to(path).as_posix()
+        hash_obj.update(f"{relative}\0{file_digest(file)}\n".encode())
+    return hash_obj.hexdigest()
+
+
+def _canonical_floats(values: np.ndarray) -> memoryview:
+    """Encode floats as little-endian float64 bytes with a single NaN bit pattern."""
+    values = np.array(values, dtype="<f8")
+    values[np.isnan(values)] = np.nan
+    return memoryview(values).cast("B")
+
+
+class _ColumnHasher:
+    """Hash one column as a numeric stream plus a stream of its non-numeric cells.
+
+    Every cell is first read as a number: native numeric dtypes directly, anything
+    else through ``pd.to_numeric(errors="coerce")``. Cells that are present but not
+    numeric contribute their dataset row number and a hash of their text to the
+    second stream. The result does not depend on the dtype pandas inferred for a
+    particular chunk, so a value such as ``"oops"`` in a later chunk of a float
+    column neither raises nor makes the digest depend on chunk boundaries.
+    """
+
+    def __init__(self) -> None:
+        self.numbers = hashlib.sha256()
+        self.text = hashlib.sha256()
+
+    def update(self, series: pd.Series, first_row: int) -> None:
+        if pd.api.types.is_numeric_dtype(series):
+            self.numbers.update(_canonical_floats(series.to_numpy(dtype=float, na_value=np.nan)))
+            return
+        numbers = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        self.numbers.update(_canonical_floats(numbers))
+        text_rows = np.flatnonzero(np.isnan(numbers) & series.notna().to_numpy())
+        if text_rows.size:
+            text = series.iloc[text_rows].astype(str)
+            cells = np.empty((text_rows.size, 2), dtype="<u8")
+            cells[:, 0] = text_rows + first_row
+            cells[:, 1] = pd.util.hash_pandas_object(text, index=False).to_numpy()
+            self.text.update(memoryview(cells).cast("B"))
+
+    def digest(self) -> bytes:
+        return self.numbers.digest() + self.text.digest()
+
+
+class DatasetFingerprinter:
+    """Incrementally fingerprint a table column by column without text serialization.
+
+    Each column is hashed as canonical float64 bytes plus its non-numeric cells (see
+    ``_ColumnHasher``). The final digest covers a header (scheme, column names, row
+    count) plus every column digest, so it is deterministic and independent of how
+    the rows were chunked or which dtype each chunk was parsed as.
+    """
+
+    def __init__(self, chunk_rows: int = FINGERPRINT_CHUNK_ROWS) -> None:
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._columns: Optional[List[str]] = None
+        self._hashers: List[_ColumnHasher] = []
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Fold the rows of ``df`` into the fingerprint."""
+        columns = [str(column) for column in df.columns]
+        if self._columns is None:
+            self._columns = columns
+            self._hashers = [_ColumnHasher() for _ in columns]
+        elif columns != self._columns:
+            raise ValueError("All chunks must share the same columns")
+        for start in range(0, len(df), self.chunk_rows):
+            chunk = df.iloc[start : start + self.chunk_rows]
+            for position, hasher in enumerate(self._hashers):
+                hasher.update(chunk.iloc[:, position], self.rows + start)
+        self.rows += len(df)
+
+    def hexdigest(self) -> str:
+        """Return the dataset fingerprint."""
+        header = {"scheme": FINGERPRINT_SCHEME, "columns": self._columns or [], "rows": self.rows}
+        digest = hashlib.sha256(json.dumps(header, sort_keys=True).encode())
+        for hasher in self._hashers:
+            digest.update(hasher.digest())
+        return digest.hexdigest()
+
+
+def fingerprint_dataframe(df: pd.DataFrame) -> str:
+    """Fingerprint an in-memory DataFrame with the columnar scheme."""
+    fingerprinter = DatasetFingerprinter()
+    fingerprinter.update(df)
+    return fingerprinter.hexdigest()
 
 
-def sign_blob(content: bytes, key: str = "local-demo-key") -> str:
+def sign_blob(content: bytes, key: str = SIGNING_KEY) -> str:
     """Create a simulated signature for a blob using a shared secret."""
     digest = hashlib.sha256(key.encode() + content).hexdigest()
     return digest
 
 
-def verify_signature(content: bytes, signature: str, key: str = "local-demo-key") -> bool:
+def verify_signature(content: bytes, signature: str, key: str = SIGNING_KEY) -> bool:
     """Verify signature produced by sign_blob."""
     expected = sign_blob(content, key)
     return expected == signature
@@ -1,42 +1,243 @@
-"""Structured logger configuration for secure MLOps."""
+"""Structured logger configuration for secure MLOps.
+
+All project loggers share one non-blocking pipeline: records are formatted on the
+calling thread, pushed onto a bounded in-memory queue, and written by a single
+background thread that drains the queue in batches and flushes once per batch. When
+the queue is full, records are dropped and counted rather than blocking the caller.
+High-frequency audit events can be rate limited per ``category/action``.
+"""
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 LOG_FILE = Path(os.getenv("MLOPS_LOG_FILE", "logs/secure_mlops.log"))
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+LOG_QUEUE_SIZE = int(os.getenv("MLOPS_LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.2
+DEFAULT_AUDIT_RATE_LIMITS = "drift/computed=10"
 
 
-def _create_handler() -> RotatingFileHandler:
-    """Create a rotating file handler with sensible defaults."""
-    handler = RotatingFileHandler(LOG_FILE, maxBytes=1_000_000, backupCount=5)
-    formatter = logging.Formatter(
+def _parse_rate_limits(spec: str) -> Dict[str, float]:
+    """Parse ``"category/action=events_per_second,..."`` into a limit map."""
+
+    limits: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        key, _, rate = item.partition("=")
+        limits[key.strip()] = float(rate)
+    return limits
+
+
+AUDIT_RATE_LIMITS = _parse_rate_limits(
+    os.getenv("MLOPS_AUDIT_RATE_LIMITS", DEFAULT_AUDIT_RATE_LIMITS)
+)
+
+
+def _create_formatter() -> logging.Formatter:
+    return logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%SZ",
     )
-    handler.setFormatter(formatter)
+
+
+class _DeferredFlushMixin:
+    """Skip the per-record flush of ``StreamHandler.emit``; the writer flushes per batch."""
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+
+class _BatchedFileHandler(_DeferredFlushMixin, RotatingFileHandler):
+    pass
+
+
+class _BatchedStderrHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """Write to whatever ``sys.stderr`` is at emit time (it may be swapped at runtime)."""
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+def _create_handler(log_file: Path = LOG_FILE) -> RotatingFileHandler:
+    """Create a rotating file handler with sensible defaults."""
+    handler = _BatchedFileHandler(log_file, maxBytes=1_000_000, backupCount=5)
+    handler.setFormatter(_create_formatter())
     return handler
 
 
+class _DroppingQueueHandler(QueueHandler):
+    """Enqueue without blocking, counting records dropped on a full queue per logger."""
+
+    def __init__(self, log_queue: "queue.Queue[Optional[logging.LogRecord]]") -> None:
+        super().__init__(log_queue)
+        self.dropped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped[record.name] = self.dropped.get(record.name, 0) + 1
+
+
+class LogPipeline:
+    """Shared bounded queue plus the single writer thread that owns the output handlers."""
+
+    def __init__(self, queue_size: int = LOG_QUEUE_SIZE, log_file: Path = LOG_FILE) -> None:
+        self.queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(queue_size)
+        self.queue_handler = _DroppingQueueHandler(self.queue)
+        self.handlers: List[logging.Handler] = [_create_handler(log_file), _BatchedStderrHandler()]
+        self.handlers[1].setFormatter(self.handlers[0].formatter)
+        self.written = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                record = self.queue.get(timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+            batch = [record]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[Optional[logging.LogRecord]]) -> bool:
+        stop = False
+        for record in batch:
+            if record is None:
+                stop = True
+                continue
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            self.written += 1
+        for handler in self.handlers:
+            handler.flush_batch()
+        self.batches += 1
+        return stop
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Drain the queue and stop the writer thread."""
+
+        if not self._thread.is_alive():
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        dropped = dict(self.queue_handler.dropped)
+        return {
+            "queue_size": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": dropped,
+            "dropped_total": sum(dropped.values()),
+        }
+
+
+class AuditRateLimiter:
+    """Per ``category/action`` token buckets; suppressed counts ride on the next event."""
+
+    def __init__(self, limits: Dict[str, float]) -> None:
+        self.limits = limits
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._suppressed: Dict[str, int] = {}
+        self.suppressed_total: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, key: str) -> Tuple[bool, int]:
+        """Return whether to emit ``key`` now and how many were suppressed before it."""
+
+        rate = self.limits.get(key)
+        if rate is None:
+            return True, 0
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (rate, now))
+            tokens = min(rate, tokens + (now - last) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                self.suppressed_total[key] = self.suppressed_total.get(key, 0) + 1
+                return False, 0
+            self._buckets[key] = (tokens - 1, now)
+            return True, self._suppressed.pop(key, 0)
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+audit_rate_limiter = AuditRateLimiter(AUDIT_RATE_LIMITS)
+
+
+def _get_pipeline() -> LogPipeline:
+    global _pipeline  # noqa: PLW0603 - process-wide singleton
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = LogPipeline()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+
 def get_logger(name: str) -> logging.Logger:
     """Return a logger pre-configured for the project."""
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(logging.INFO)
-        handler = _create_handler()
-        logger.addHandler(handler)
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(handler.formatter)
-        logger.addHandler(stream_handler)
+        logger.addHandler(_get_pipeline().queue_handler)
     return logger
 
 
+def logging_stats() -> Dict[str, Any]:
+    """Return queue, writer, drop and rate-limit counters for the logging pipeline."""
+
+    stats = _get_pipeline().stats()
+    stats["rate_limited"] = dict(audit_rate_limiter.suppressed_total)
+    stats["rate_limits"] = dict(audit_rate_limiter.limits)
+    return stats
+
+
 def audit_event(category: str, action: str, details: str) -> None:
     """Helper to emit standardized audit events."""
+    admitted, suppressed = audit_rate_limiter.admit(f"{category}/{action}")
+    if not admitted:
+        return
+    if suppressed:
+        details = f"{details} suppressed={suppressed}"
     logger = get_logger("audit")
     logger.info("AUDIT | %s | %s | %s", category, action, details)
 
@@ -0,0 +1,264 @@
+"""In-process latency histograms and counters rendered in Prometheus text format.
+
+Each thread records into its own shard, so the hot path takes no lock once a series
+exists; shards are merged only when the metrics are scraped. When a thread exits, its
+shard is folded into a shared retired shard, so short-lived pool threads do not grow
+the shard list.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+METRIC_PREFIX = "mlops"
+STAGE_HISTOGRAM = "stage_duration_seconds"
+HTTP_HISTOGRAM = "http_request_duration_seconds"
+HTTP_COUNTER = "http_requests"
+DIGEST_COUNTER = "digest_cache_lookups"
+
+Labels = Tuple[Tuple[str, str], ...]
+SeriesKey = Tuple[str, Labels]
+HELP = {
+    STAGE_HISTOGRAM: "Wall time of engine stages.",
+    HTTP_HISTOGRAM: "Latency of HTTP requests by route.",
+    HTTP_COUNTER: "HTTP requests by route and status.",
+    DIGEST_COUNTER: "Model artifact digest cache lookups by result.",
+}
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Shard:
+    """One thread's private series; the lock only guards creating new series."""
+
+    def __init__(self) -> None:
+        self.histograms: Dict[SeriesKey, _Histogram] = {}
+        self.counters: Dict[SeriesKey, float] = {}
+        self.lock = threading.Lock()
+
+
+class _ShardOwner:
+    """Thread-local handle whose collection at thread exit retires the thread's shard."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _merge(
+    histograms: Dict[SeriesKey, _Histogram],
+    counters: Dict[SeriesKey, float],
+    shard: _Shard,
+    buckets: int,
+) -> None:
+    """Add ``shard``'s series into ``histograms`` and ``counters``."""
+
+    with shard.lock:
+        shard_histograms = list(shard.histograms.items())
+        shard_counters = list(shard.counters.items())
+    for key, histogram in shard_histograms:
+        merged = histograms.setdefault(key, _Histogram(buckets))
+        merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+        merged.sum += histogram.sum
+        merged.count += histogram.count
+    for key, value in shard_counters:
+        counters[key] = counters.get(key, 0.0) + value
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    """Per-thread sharded histograms and counters."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            owner = _ShardOwner()
+            weakref.finalize(owner, self._retire, shard)
+            self._local.shard = shard
+            self._local.owner = owner
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold an exited thread's shard into the retired shard and forget it."""
+
+        with self._lock:
+            _merge(self._retired.histograms, self._retired.counters, shard, len(self.buckets))
+            self._shards.remove(shard)
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record ``value`` (seconds) in the histogram ``name`` for ``labels``."""
+
+        shard = self._shard()
+        key = (name, _labels(labels))
+        histogram = shard.histograms.get(key)
+        if histogram is None:
+            with shard.lock:
+                histogram = shard.histograms.setdefault(key, _Histogram(len(self.buckets)))
+        histogram.counts[bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def increment(self, name: str, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` to the counter ``name`` for ``labels``."""
+
+        shard = self._shard()
+        key = (name, _labels(labels))
+        if key not in shard.counters:
+            with shard.lock:
+                shard.counters.setdefault(key, 0.0)
+        shard.counters[key] += amount
+
+    def snapshot(self) -> Tuple[Dict[SeriesKey, _Histogram], Dict[SeriesKey, float]]:
+        """Merge every thread's shard into one set of series."""
+
+        histograms: Dict[SeriesKey, _Histogram] = {}
+        counters: Dict[SeriesKey, float] = {}
+        with self._lock:
+            shards = list(self._shards)
+            _merge(histograms, counters, self._retired, len(self.buckets))
+        for shard in shards:
+            _merge(histograms, counters, shard, len(self.buckets))
+        return histograms, counters
+
+    def render_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format (v0.0.4)."""
+
+        histograms, counters = self.snapshot()
+        lines: List[str] = []
+        for name in sorted({key[0] for key in histograms}):
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {HELP.get(name, name)}", f"# TYPE {metric} histogram"]
+            for (series, labels), histogram in sorted(histograms.items()):
+                if series != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip([*self.buckets, "+Inf"], histogram.counts):
+                    cumulative += count
+                    le = bound if isinstance(bound, str) else repr(float(bound))
+                    lines.append(
+                        f"{metric}_bucket{_format_labels(labels + (('le', le),))} {cumulative}"
+                    )
+                lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum!r}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        for name in sorted({key[0] for key in counters}):
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            lines += [f"# HELP {metric} {HELP.get(name, name)}", f"# TYPE {metric} counter"]
+            for (series, labels), value in sorted(counters.items()):
+                if series == name:
+                    lines.append(f"{metric}{_format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+metrics = MetricsRegistry()
+
+
+def observe_stage(component: str, stage: str, seconds: float) -> None:
+    """Record the wall time of one engine stage."""
+
+    metrics.observe(STAGE_HISTOGRAM, seconds, component=component, stage=stage)
+
+
+def record_stage_timings(component: str, timings: Dict[str, float]) -> None:
+    """Record a ``{stage: seconds}`` mapping, e.g. timings reported by a worker process."""
+
+    for stage, seconds in timings.items():
+        observe_stage(component, stage, seconds)
+
+
+@contextmanager
+def timed(component: str, stage: str) -> Iterator[None]:
+    """Time the enclosed block as ``component``/``stage``."""
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(component, stage, time.perf_counter() - start)
+
+
+def instrument(component: str, stage: str) -> Callable[[Callable], Callable]:
+    """Decorator form of ``timed``."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe_stage(component, stage, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+class StageTimer:
+    """Accumulate stage times across a loop (e.g. dataset chunks) and record the totals."""
+
+    def __init__(self, component: str) -> None:
+        self.component = component
+        self.totals: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0.0) + time.perf_counter() - start
+
+    def record(self) -> None:
+        record_stage_timings(self.component, self.totals)
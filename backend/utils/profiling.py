@@ -0,0 +1,195 @@
+"""Opt-in per-request cProfile capture.
+
+Profiling is off unless ``MLOPS_PROFILING=1``. When it is off, the API never installs
+the middleware and ``profiled()`` returns a shared no-op context. When it is on, a
+request is profiled if it carries ``X-MLOps-Profile: <MLOPS_PROFILING_TOKEN>`` or is
+every Nth request (``MLOPS_PROFILING_SAMPLE_EVERY``).
+
+cProfile only sees the thread it was enabled in. Engine work is therefore wrapped in
+``profiled()`` where it runs: thread-pool handlers see the request's session through
+a context variable, and a training job worker profiles the whole job under a
+process-wide session. Each capture is written as a ``pstats`` file named after the
+request id to ``logs/profiles/``, which keeps only the newest
+``MLOPS_PROFILING_MAX_FILES`` profiles.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import itertools
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import ContextManager, Iterator, List, Mapping, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.utils.logger import audit_event, get_logger
+
+logger = get_logger(__name__)
+
+PROFILING_ENABLED = os.getenv("MLOPS_PROFILING", "0") == "1"
+PROFILING_TOKEN = os.getenv("MLOPS_PROFILING_TOKEN", "")
+SAMPLE_EVERY = int(os.getenv("MLOPS_PROFILING_SAMPLE_EVERY", "0"))
+PROFILE_DIR = Path(os.getenv("MLOPS_PROFILE_DIR", "logs/profiles"))
+MAX_PROFILES = int(os.getenv("MLOPS_PROFILING_MAX_FILES", "50"))
+PROFILE_HEADER = "X-MLOps-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+REQUEST_ID_HEADER = "X-Request-ID"
+PROFILE_SUFFIX = ".prof"
+JOB_SUFFIX = ".job"
+MAX_REQUEST_ID_CHARS = 64
+_UNSAFE_ID_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class ProfileSession:
+    """The per-thread cProfile captures that make up one profile."""
+
+    def __init__(self, profile_id: str) -> None:
+        self.profile_id = profile_id
+        self.profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def thread_profile(self) -> Iterator[None]:
+        """Profile the enclosed block on the current thread (no-op if already profiling)."""
+
+        if getattr(_thread_state, "active", False):
+            yield
+            return
+        profiler = cProfile.Profile()
+        _thread_state.active = True
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _thread_state.active = False
+            with self._lock:
+                self.profiles.append(profiler)
+
+    def save(self, suffix: str = "") -> Optional[Path]:
+        """Merge the captures into one ``pstats`` file; ``None`` if nothing ran."""
+
+        with self._lock:
+            profiles = list(self.profiles)
+        if not profiles:
+            return None
+        return save_profile(f"{self.profile_id}{suffix}", profiles)
+
+
+_current: ContextVar[Optional[ProfileSession]] = ContextVar("mlops_profile", default=None)
+_process_session: Optional[ProfileSession] = None
+_thread_state = threading.local()
+_request_counter = itertools.count(1)
+_NO_PROFILE = nullcontext()
+
+
+def current_session() -> Optional[ProfileSession]:
+    return _current.get() or _process_session
+
+
+def profiled() -> ContextManager[None]:
+    """Profile the enclosed block into the active request's or job's profile, if any."""
+
+    if not PROFILING_ENABLED:
+        return _NO_PROFILE
+    session = current_session()
+    return session.thread_profile() if session is not None else _NO_PROFILE
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def save_profile(name: str, profiles: List[cProfile.Profile]) -> Path:
+    """Write merged stats to ``PROFILE_DIR/<name>.prof`` and trim the ring."""
+
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stats = pstats.Stats(profiles[0])
+    for profile in profiles[1:]:
+        stats.add(profile)
+    path = PROFILE_DIR / f"{name}{PROFILE_SUFFIX}"
+    stats.dump_stats(path)
+    stored = sorted(PROFILE_DIR.glob(f"*{PROFILE_SUFFIX}"), key=_mtime)
+    for stale in stored[: max(0, len(stored) - MAX_PROFILES)]:
+        stale.unlink(missing_ok=True)
+    return path
+
+
+def request_profile_id(headers: Mapping[str, str]) -> Optional[str]:
+    """Return a profile id when this request should be profiled, else ``None``."""
+
+    token = headers.get(PROFILE_HEADER)
+    # Starlette decodes header bytes as latin-1; compare the raw bytes so any value works.
+    triggered = bool(
+        PROFILING_TOKEN
+        and token
+        and hmac.compare_digest(token.encode("latin-1"), PROFILING_TOKEN.encode())
+    )
+    if not triggered and SAMPLE_EVERY > 0:
+        triggered = next(_request_counter) % SAMPLE_EVERY == 0
+    if not triggered:
+        return None
+    supplied = _UNSAFE_ID_CHARS.sub("", headers.get(REQUEST_ID_HEADER, ""))[:MAX_REQUEST_ID_CHARS]
+    # A client-supplied id may repeat, so it gets a random suffix to keep file names unique.
+    request_id = f"{supplied}-{uuid.uuid4().hex[:8]}" if supplied else uuid.uuid4().hex
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{request_id}"
+
+
+@contextmanager
+def capture(profile_id: str) -> Iterator[ProfileSession]:
+    """Make a new session current for this context (and threads it hands work to)."""
+
+    session = ProfileSession(profile_id)
+    token = _current.set(session)
+    try:
+        yield session
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def capture_process(profile_id: str) -> Iterator[ProfileSession]:
+    """Profile a training job worker: its main thread plus any ``profiled()`` blocks."""
+
+    global _process_session  # noqa: PLW0603 - one job at a time per worker process
+    session = ProfileSession(profile_id)
+    _process_session = session
+    try:
+        with session.thread_profile():
+            yield session
+    finally:
+        _process_session = None
+        path = session.save(JOB_SUFFIX)
+        audit_event("profiling", "job_captured", f"profile_id={profile_id} path={path}")
+
+
+async def profile_requests(request, call_next):
+    """HTTP middleware that captures a profile for triggered requests."""
+
+    profile_id = request_profile_id(request.headers)
+    if profile_id is None:
+        return await call_next(request)
+    with capture(profile_id) as session:
+        response = await call_next(request)
+    path = await run_in_threadpool(session.save)
+    if path is not None:
+        audit_event(
+            "profiling",
+            "captured",
+            f"profile_id={profile_id} route={request.url.path} "
+            f"status={response.status_code} path={path}",
+        )
+        response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
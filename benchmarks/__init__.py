@@ -0,0 +1 @@
+"""Offline micro-benchmarks for the engine hot paths (``python -m benchmarks.run``)."""
@@ -0,0 +1,208 @@
+"""Benchmark case definitions.
+
+Each case is a context manager factory: setup runs on entry, the yielded zero-argument
+callable is the timed operation, and teardown runs on exit. Engine modules are
+imported inside the factories because they resolve ``models/`` and ``logs/`` relative
+to the working directory, which the runner points at a scratch directory first.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+SEED = 42
+MB = 1024 * 1024
+PREDICT_TRAINING_ROWS = 400
+LABEL_THRESHOLD = 1.5
+PREDICT_PAYLOAD = {"feature1": 0.2, "feature2": 0.4, "feature3": 0.6}
+
+CaseFactory = Callable[..., ContextManager[Callable[[], Any]]]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One benchmarked operation and the parameter sets it runs with."""
+
+    name: str
+    factory: CaseFactory
+    params: Tuple[Dict[str, Any], ...]
+    quick_params: Tuple[Dict[str, Any], ...]
+
+    def instances(self, quick: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return ``(case_id, params)`` pairs, e.g. ``psi[rows=10000]``."""
+
+        chosen = self.quick_params if quick else self.params
+        return [(case_id(self.name, params), params) for params in chosen]
+
+
+def case_id(name: str, params: Dict[str, Any]) -> str:
+    labels = ",".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return f"{name}[{labels}]"
+
+
+def _training_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(SEED)
+    features = rng.random((rows, 3))
+    return pd.DataFrame(
+        {
+            "feature1": features[:, 0],
+            "feature2": features[:, 1],
+            "feature3": features[:, 2],
+            "label": (features.sum(axis=1) > LABEL_THRESHOLD).astype(int),
+        }
+    )
+
+
+@contextmanager
+def validator_validate(rows: int) -> Iterator[Callable[[], Any]]:
+    from backend.engines.data_validator import DataValidator
+
+    validator = DataValidator()
+    df = _training_frame(rows)
+    yield lambda: validator.validate(df)
+
+
+@contextmanager
+def population_stability_index(rows: int) -> Iterator[Callable[[], Any]]:
+    from backend.engines.drift_detector import population_stability_index as psi
+
+    rng = np.random.default_rng(SEED)
+    expected = rng.normal(size=rows)
+    actual = rng.normal(loc=0.1, size=rows)
+    yield lambda: psi(expected, actual)
+
+
+@contextmanager
+def drift_score(rows: int, features: int) -> Iterator[Callable[[], Any]]:
+    from backend.engines.drift_detector import DriftDetector
+
+    rng = np.random.default_rng(SEED)
+    detector = DriftDetector()
+    detector.set_baseline(rng.normal(size=(rows, features)))
+    batch = rng.normal(loc=0.1, size=(rows, features))
+    yield lambda: detector.score(batch)
+
+
+def _write_registry(entries: int) -> None:
+    from backend.engines.model_registry import REGISTRY_FILE
+
+    models = [
+        {
+            "run_id": f"bench-{index}",
+            "path": f"models/model_bench-{index}.joblib",
+            "metrics": {"accuracy": 0.9},
+            "signature": "sig",
+            "metadata": {"metrics": "{}"},
+            "approved": True,
+        }
+        for index in range(entries)
+    ]
+    REGISTRY_FILE.write_text(json.dumps({"models": models, "deployed_run_id": None}))
+
+
+@contextmanager
+def registry_get_model(entries: int) -> Iterator[Callable[[], Any]]:
+    from backend.engines.model_registry import ModelRegistry
+
+    _write_registry(entries)
+    registry = ModelRegistry()
+    run_id = f"bench-{entries // 2}"
+    yield lambda: registry.get_model(run_id)
+
+
+@contextmanager
+def registry_list_models(entries: int) -> Iterator[Callable[[], Any]]:
+    from backend.engines.model_registry import ModelRegistry
+
+    _write_registry(entries)
+    registry = ModelRegistry()
+    yield registry.list_models
+
+
+@contextmanager
+def sha256_file(mb: int) -> Iterator[Callable[[], Any]]:
+    from backend.utils.hash_utils import sha256_file as digest
+
+    path = Path("models") / f"bench_{mb}mb.bin"
+    with path.open("wb") as handle:
+        for _ in range(mb):
+            handle.write(os.urandom(MB))
+    try:
+        yield lambda: digest(path)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+@contextmanager
+def predict_single(fast_path: bool) -> Iterator[Callable[[], Any]]:
+    from fastapi.testclient import TestClient
+
+    from backend.engines import fast_predictor
+    from backend.engines.trainer import new_run_id
+    from backend.main import app, registry, trainer
+
+    enabled = fast_predictor.FAST_PREDICT_ENABLED
+    fast_predictor.FAST_PREDICT_ENABLED = fast_path
+    try:
+        run_id = new_run_id()
+        trainer.train(_training_frame(PREDICT_TRAINING_ROWS), run_id)
+        registry.approve(run_id)
+        with TestClient(app) as client:
+            client.post("/deploy", json={"run_id": run_id}).raise_for_status()
+            yield lambda: client.post("/predict", json=PREDICT_PAYLOAD).raise_for_status()
+    finally:
+        fast_predictor.FAST_PREDICT_ENABLED = enabled
+
+
+CASES: Tuple[BenchmarkCase, ...] = (
+    BenchmarkCase(
+        "validator.validate",
+        validator_validate,
+        params=({"rows": 1_000}, {"rows": 10_000}, {"rows": 100_000}),
+        quick_params=({"rows": 1_000},),
+    ),
+    BenchmarkCase(
+        "drift.psi",
+        population_stability_index,
+        params=({"rows": 10_000}, {"rows": 1_000_000}),
+        quick_params=({"rows": 10_000},),
+    ),
+    BenchmarkCase(
+        "drift.score",
+        drift_score,
+        params=({"rows": 10_000, "features": 3}, {"rows": 10_000, "features": 32}),
+        quick_params=({"rows": 10_000, "features": 3},),
+    ),
+    BenchmarkCase(
+        "registry.get_model",
+        registry_get_model,
+        params=({"entries": 10}, {"entries": 1_000}, {"entries": 10_000}),
+        quick_params=({"entries": 10}, {"entries": 1_000}),
+    ),
+    BenchmarkCase(
+        "registry.list_models",
+        registry_list_models,
+        params=({"entries": 10}, {"entries": 1_000}, {"entries": 10_000}),
+        quick_params=({"entries": 10},),
+    ),
+    BenchmarkCase(
+        "hash.sha256_file",
+        sha256_file,
+        params=({"mb": 1}, {"mb": 16}, {"mb": 128}),
+        quick_params=({"mb": 1},),
+    ),
+    BenchmarkCase(
+        "api.predict",
+        predict_single,
+        params=({"fast_path": True}, {"fast_path": False}),
+        quick_params=({"fast_path": True},),
+    ),
+)
@@ -0,0 +1,623 @@
+"""End-to-end load generator for ``backend.main:app``.
+
+Usage::
+
+    python -m benchmarks.loadtest --workers 0              # in-process (ASGI transport)
+    python -m benchmarks.loadtest --workers 1 2 4          # uvicorn, one run per count
+    python -m benchmarks.loadtest --rps 200 --mix predict=95,dashboard=5
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000   # an already running server
+
+Each run starts the app in a fresh scratch directory, trains, approves and deploys a
+model, then replays a weighted mix of ``/predict``, ``/predict/batch``, ``/dashboard``,
+``/serving/stats``, ``/train`` and ``/deploy`` traffic shaped like the ``examples/``
+payloads. A ``--url`` target is somebody's real registry, so it gets no setup run and
+only read-only operations unless ``--allow-writes`` is given; even then nothing is
+ever approved, and ``deploy`` only redeploys a newest run an operator has already
+approved (otherwise the server's ``403`` is what gets measured). Without ``--rps`` the load
+is closed-loop: ``--concurrency`` clients each send their next request as soon as
+the last one returns. With ``--rps``, arrivals follow a fixed schedule and each
+latency is measured from its scheduled start, so server stalls show up in the tail
+instead of silently lowering the offered load. ``--concurrency`` then caps the
+requests in flight.
+
+The report gives throughput, p50/p95/p99 latency and error rates per operation. It
+also gives CPU time and peak RSS for the server process tree, read from ``/proc``.
+In-process runs share one process with the load generator, so their CPU figures
+include the client.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+EXAMPLES_DIR = ROOT / "examples"
+RESULTS_FILE = ROOT / "loadtest-results.json"
+READ_ONLY_OPERATIONS = ("predict", "batch", "dashboard", "stats")
+WRITE_OPERATIONS = ("train", "deploy")
+OPERATIONS = READ_ONLY_OPERATIONS + WRITE_OPERATIONS
+DEFAULT_MIX = "predict=90,dashboard=8,train=1,deploy=1"
+DEFAULT_EXTERNAL_MIX = "predict=85,batch=5,dashboard=8,stats=2"
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DURATION = 10.0
+DEFAULT_WARMUP = 2.0
+DEFAULT_PORT = 8765
+DEFAULT_TRAIN_ROWS = 200
+BATCH_ROWS = 32
+PERCENTILES = (50, 95, 99)
+HTTP_ERROR = 400
+CLIENT_ERROR_STATUS = 0
+REQUEST_TIMEOUT = 30.0
+STARTUP_TIMEOUT = 60.0
+SETUP_TIMEOUT = 120.0
+POLL_INTERVAL = 0.25
+SAMPLE_INTERVAL = 0.5
+CMDLINE_CHARS = 80
+FINISHED_JOB_STATES = ("succeeded", "failed", "cancelled")
+
+
+@dataclass
+class Sample:
+    operation: str
+    status: int
+    latency: float
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse ``"predict=90,dashboard=10"`` into normalized operation weights."""
+
+    weights: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation {name!r}; expected one of {OPERATIONS}")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0 or any(weight < 0 for weight in weights.values()):
+        raise ValueError("mix weights must be non-negative and sum to more than zero")
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+
+class Payloads:
+    """Random request bodies with the field names of ``examples/*_payload.json``."""
+
+    def __init__(self, train_rows: int, seed: int = 42) -> None:
+        predict = json.loads((EXAMPLES_DIR / "predict_payload.json").read_text())
+        train = json.loads((EXAMPLES_DIR / "train_payload.json").read_text())
+        self.features = list(predict)
+        self.train_features = [key for key in train["records"][0] if key != "label"]
+        self.train_rows = train_rows
+        self.rng = random.Random(seed)
+
+    def predict(self) -> Dict[str, float]:
+        return {name: self.rng.random() for name in self.features}
+
+    def batch(self) -> Dict[str, Any]:
+        return {
+            "columns": {
+                name: [self.rng.random() for _ in range(BATCH_ROWS)] for name in self.features
+            }
+        }
+
+    def train(self) -> Dict[str, Any]:
+        records = []
+        for index in range(self.train_rows):
+            record = {name: self.rng.random() for name in self.train_features}
+            record["label"] = index % 2
+            records.append(record)
+        return {"records": records}
+
+
+class Traffic:
+    """One coroutine per operation; each returns the HTTP status it ended with.
+
+    ``auto_approve`` lets ``deploy`` approve the run it deploys; it is only set for
+    the scratch registries this module starts itself.
+    """
+
+    def __init__(
+        self, client: httpx.AsyncClient, payloads: Payloads, auto_approve: bool = False
+    ) -> None:
+        self.client = client
+        self.payloads = payloads
+        self.auto_approve = auto_approve
+        self.job_ids: List[str] = []
+
+    async def predict(self) -> int:
+        response = await self.client.post("/predict", json=self.payloads.predict())
+        return response.status_code
+
+    async def batch(self) -> int:
+        response = await self.client.post("/predict/batch", json=self.payloads.batch())
+        return response.status_code
+
+    async def dashboard(self) -> int:
+        return (await self.client.get("/dashboard")).status_code
+
+    async def stats(self) -> int:
+        return (await self.client.get("/serving/stats")).status_code
+
+    async def train(self) -> int:
+        response = await self.client.post("/train", json=self.payloads.train())
+        if response.status_code == httpx.codes.ACCEPTED:
+            self.job_ids.append(response.json()["job_id"])
+        return response.status_code
+
+    async def deploy(self) -> int:
+        """Redeploy the newest registered run, approving it first only with ``auto_approve``."""
+
+        latest = await self.client.get("/model/latest")
+        if latest.status_code >= HTTP_ERROR:
+            return latest.status_code
+        run_id = latest.json()["run_id"]
+        if self.auto_approve:
+            approval = await self.client.post("/approve_model", json={"run_id": run_id})
+            if approval.status_code >= HTTP_ERROR:
+                return approval.status_code
+        return (await self.client.post("/deploy", json={"run_id": run_id})).status_code
+
+    async def run(self, operation: str) -> int:
+        try:
+            return await getattr(self, operation)()
+        except httpx.HTTPError:
+            return CLIENT_ERROR_STATUS
+
+    async def drain(self) -> None:
+        """Cancel the training jobs this run queued and wait for them to stop."""
+
+        for job_id in self.job_ids:
+            await self.client.delete(f"/jobs/{job_id}")
+        deadline = time.monotonic() + SETUP_TIMEOUT
+        pending = list(self.job_ids)
+        while pending and time.monotonic() < deadline:
+            statuses = [(await self.client.get(f"/jobs/{job_id}")) for job_id in pending]
+            pending = [
+                job_id
+                for job_id, response in zip(pending, statuses)
+                if response.status_code == httpx.codes.OK
+                and response.json()["status"] not in FINISHED_JOB_STATES
+            ]
+            if pending:
+                await asyncio.sleep(POLL_INTERVAL)
+
+
+async def prepare(client: httpx.AsyncClient, payloads: Payloads) -> str:
+    """Train, approve and deploy a model so ``/predict`` has something to serve.
+
+    Only used for the scratch targets this module starts; ``--url`` runs skip it.
+
+    Completion is detected through ``/model/latest`` because with several uvicorn
+    workers the job table lives in whichever worker accepted the job.
+    """
+
+    response = await client.post("/train", json=payloads.train())
+    response.raise_for_status()
+    run_id = response.json()["run_id"]
+    deadline = time.monotonic() + SETUP_TIMEOUT
+    while time.monotonic() < deadline:
+        latest = await client.get("/model/latest")
+        if latest.status_code == httpx.codes.OK and latest.json()["run_id"] == run_id:
+            break
+        await asyncio.sleep(POLL_INTERVAL)
+    else:
+        raise TimeoutError(f"setup run {run_id} was not registered in {SETUP_TIMEOUT}s")
+    (await client.post("/approve_model", json={"run_id": run_id})).raise_for_status()
+    (await client.post("/deploy", json={"run_id": run_id})).raise_for_status()
+    return run_id
+
+
+async def closed_loop(
+    traffic: Traffic, mix: Dict[str, float], concurrency: int, duration: float, warmup: float
+) -> List[Sample]:
+    """``concurrency`` clients issue back-to-back requests until the run ends."""
+
+    samples: List[Sample] = []
+    rng = random.Random(0)
+    names, weights = list(mix), list(mix.values())
+    recording_from = time.perf_counter() + warmup
+    stop_at = recording_from + duration
+
+    async def client_loop() -> None:
+        while (start := time.perf_counter()) < stop_at:
+            operation = rng.choices(names, weights)[0]
+            status = await traffic.run(operation)
+            if start >= recording_from:
+                samples.append(Sample(operation, status, time.perf_counter() - start))
+
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return samples
+
+
+async def open_loop(
+    traffic: Traffic,
+    mix: Dict[str, float],
+    rps: float,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> List[Sample]:
+    """Issue requests on a fixed ``rps`` schedule, timing each from its scheduled start."""
+
+    samples: List[Sample] = []
+    rng = random.Random(0)
+    names, weights = list(mix), list(mix.values())
+    in_flight = asyncio.Semaphore(concurrency)
+    begin = time.perf_counter()
+    recording_from = begin + warmup
+    total = int((warmup + duration) * rps)
+
+    async def fire(operation: str, scheduled: float) -> None:
+        async with in_flight:
+            status = await traffic.run(operation)
+        if scheduled >= recording_from:
+            samples.append(Sample(operation, status, time.perf_counter() - scheduled))
+
+    tasks = []
+    for index in range(total):
+        scheduled = begin + index / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(fire(rng.choices(names, weights)[0], scheduled)))
+    await asyncio.gather(*tasks)
+    return samples
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    values = np.asarray(latencies) * 1000
+    summary = {
+        f"p{pct}_ms": round(float(value), 3)
+        for pct, value in zip(PERCENTILES, np.percentile(values, PERCENTILES))
+    }
+    summary["mean_ms"] = round(float(values.mean()), 3)
+    summary["max_ms"] = round(float(values.max()), 3)
+    return summary
+
+
+def summarize(samples: List[Sample], duration: float) -> Dict[str, Dict[str, Any]]:
+    """Per-operation and overall throughput, error rate, status counts and latency."""
+
+    groups: Dict[str, List[Sample]] = {"all": samples}
+    for sample in samples:
+        groups.setdefault(sample.operation, []).append(sample)
+    report: Dict[str, Dict[str, Any]] = {}
+    for name, group in groups.items():
+        statuses: Dict[str, int] = {}
+        for sample in group:
+            statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+        errors = sum(
+            1
+            for sample in group
+            if sample.status >= HTTP_ERROR or sample.status == CLIENT_ERROR_STATUS
+        )
+        report[name] = {
+            "requests": len(group),
+            "throughput_rps": round(len(group) / duration, 2) if duration else 0.0,
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4) if group else 0.0,
+            "statuses": statuses,
+            **_latency_summary([sample.latency for sample in group]),
+        }
+    return report
+
+
+def _descendants(root: int) -> List[int]:
+    children: Dict[int, List[int]] = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+    found, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        found.append(pid)
+        pending.extend(children.get(pid, []))
+    return found
+
+
+class ProcessSampler:
+    """Poll CPU ticks and RSS of a process tree from ``/proc`` on a background thread."""
+
+    def __init__(self, root_pid: int, interval: float = SAMPLE_INTERVAL) -> None:
+        self.root_pid = root_pid
+        self.interval = interval
+        self.available = Path("/proc/self/stat").exists()
+        self.processes: Dict[int, Dict[str, Any]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="loadtest-sampler", daemon=True)
+        self._tick = os.sysconf("SC_CLK_TCK") if self.available else 1
+        self._page = os.sysconf("SC_PAGE_SIZE") if self.available else 1
+        self._started = time.monotonic()
+
+    def __enter__(self) -> "ProcessSampler":
+        if self.available:
+            self._started = time.monotonic()
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self.available:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        for pid in _descendants(self.root_pid):
+            proc = Path("/proc") / str(pid)
+            try:
+                fields = (proc / "stat").read_text().rsplit(")", 1)[1].split()
+                rss = int((proc / "statm").read_text().split()[1]) * self._page
+                cmdline = (proc / "cmdline").read_bytes().replace(b"\0", b" ").decode()
+            except (OSError, IndexError, ValueError):
+                continue
+            ticks = int(fields[11]) + int(fields[12])
+            entry = self.processes.setdefault(
+                pid,
+                {"ppid": int(fields[1]), "cmdline": cmdline.strip()[:CMDLINE_CHARS]},
+            )
+            entry.setdefault("first_ticks", ticks)
+            entry["last_ticks"] = ticks
+            entry["rss_max_mb"] = max(entry.get("rss_max_mb", 0.0), rss / 1024 / 1024)
+
+    def report(self) -> Dict[str, Any]:
+        if not self.available:
+            return {"available": False}
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        processes = {}
+        for pid, entry in self.processes.items():
+            cpu = (entry["last_ticks"] - entry["first_ticks"]) / self._tick
+            processes[str(pid)] = {
+                "ppid": entry["ppid"],
+                "cmdline": entry["cmdline"],
+                "cpu_seconds": round(cpu, 2),
+                "cpu_percent": round(cpu / elapsed * 100, 1),
+                "rss_max_mb": round(entry["rss_max_mb"], 1),
+            }
+        return {
+            "available": True,
+            "processes": processes,
+            "cpu_seconds_total": round(sum(p["cpu_seconds"] for p in processes.values()), 2),
+            "rss_max_mb_total": round(sum(p["rss_max_mb"] for p in processes.values()), 1),
+        }
+
+
+@contextmanager
+def _scratch_directory() -> Iterator[Path]:
+    origin = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="mlops-loadtest-") as scratch:
+        os.chdir(scratch)
+        try:
+            yield Path(scratch)
+        finally:
+            os.chdir(origin)
+
+
+@asynccontextmanager
+async def in_process_target() -> AsyncIterator[Tuple[httpx.AsyncClient, int]]:
+    """Serve the app through httpx's ASGI transport inside this process."""
+
+    with _scratch_directory():
+        from backend.main import app, shutdown_training_jobs
+
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=REQUEST_TIMEOUT
+            ) as client:
+                yield client, os.getpid()
+        finally:
+            shutdown_training_jobs()
+
+
+@asynccontextmanager
+async def uvicorn_target(
+    workers: int, port: int, concurrency: int
+) -> AsyncIterator[Tuple[httpx.AsyncClient, int]]:
+    """Start ``uvicorn backend.main:app --workers N`` in a scratch directory."""
+
+    with _scratch_directory() as scratch:
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.getenv("PYTHONPATH")])),
+        }
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ]
+        server = subprocess.Popen(command, cwd=scratch, env=env)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        try:
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}", timeout=REQUEST_TIMEOUT, limits=limits
+            ) as client:
+                await _wait_for_health(client, server)
+                yield client, server.pid
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=STARTUP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+
+async def _wait_for_health(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            if (await client.get("/health")).status_code == httpx.codes.OK:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(POLL_INTERVAL)
+    raise TimeoutError(f"server did not become healthy within {STARTUP_TIMEOUT}s")
+
+
+@asynccontextmanager
+async def external_target(
+    url: str, concurrency: int
+) -> AsyncIterator[Tuple[httpx.AsyncClient, None]]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=REQUEST_TIMEOUT, limits=limits) as client:
+        yield client, None
+
+
+async def run_once(args: argparse.Namespace, workers: Optional[int]) -> Dict[str, Any]:
+    """Run one load test against ``workers`` uvicorn workers (0: in-process)."""
+
+    mix = parse_mix(args.mix)
+    scratch = not args.url
+    payloads = Payloads(args.train_rows)
+    if args.url:
+        target = external_target(args.url, args.concurrency)
+    elif workers == 0:
+        target = in_process_target()
+    else:
+        target = uvicorn_target(workers, args.port, args.concurrency)
+    async with target as (client, pid):
+        if scratch:
+            run_id: Optional[str] = await prepare(client, payloads)
+        else:
+            (await client.get("/health")).raise_for_status()
+            run_id = None
+        traffic = Traffic(client, payloads, auto_approve=scratch)
+        sampler = ProcessSampler(pid) if pid is not None else None
+        started = time.perf_counter()
+        with sampler or _null_context():
+            if args.rps:
+                samples = await open_loop(
+                    traffic, mix, args.rps, args.concurrency, args.duration, args.warmup
+                )
+            else:
+                samples = await closed_loop(
+                    traffic, mix, args.concurrency, args.duration, args.warmup
+                )
+        measured = time.perf_counter() - started - args.warmup
+        await traffic.drain()
+    return {
+        "target": args.url or ("in-process" if workers == 0 else f"uvicorn x{workers}"),
+        "workers": workers,
+        "mode": "open-loop" if args.rps else "closed-loop",
+        "rps_target": args.rps,
+        "concurrency": args.concurrency,
+        "duration_s": round(measured, 3),
+        "mix": mix,
+        "setup_run_id": run_id,
+        "operations": summarize(samples, measured),
+        "resources": sampler.report() if sampler else {"available": False},
+    }
+
+
+@contextmanager
+def _null_context() -> Iterator[None]:
+    yield
+
+
+def _print_run(report: Dict[str, Any]) -> None:
+    print(f"\n{report['target']} ({report['mode']}, {report['duration_s']}s)")
+    header = ("req", "rps", "err%", "p50ms", "p95ms", "p99ms")
+    print(f"{'operation':<10} {header[0]:>7} " + " ".join(f"{name:>9}" for name in header[1:]))
+    for name, stats in sorted(report["operations"].items()):
+        print(
+            f"{name:<10} {stats['requests']:>7} {stats['throughput_rps']:>9.1f} "
+            f"{stats['error_rate'] * 100:>9.2f} {stats.get('p50_ms', 0):>9.2f} "
+            f"{stats.get('p95_ms', 0):>9.2f} {stats.get('p99_ms', 0):>9.2f}"
+        )
+    resources = report["resources"]
+    if resources.get("available"):
+        print(
+            f"server tree: {len(resources['processes'])} processes, "
+            f"cpu {resources['cpu_seconds_total']}s, rss {resources['rss_max_mb_total']} MB"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[0], help="uvicorn worker counts; 0 = in-process"
+    )
+    parser.add_argument("--url", help="target an already running server instead")
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="with --url, permit train/deploy operations (runs are never auto-approved)",
+    )
+    parser.add_argument(
+        "--mix",
+        help=f"operation=weight,... (default {DEFAULT_MIX}; with --url {DEFAULT_EXTERNAL_MIX})",
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rps", type=float, help="open-loop arrival rate")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION)
+    parser.add_argument("--warmup", type=float, default=DEFAULT_WARMUP)
+    parser.add_argument("--train-rows", type=int, default=DEFAULT_TRAIN_ROWS)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    args = parser.parse_args(argv)
+
+    if args.mix is None:
+        args.mix = DEFAULT_EXTERNAL_MIX if args.url else DEFAULT_MIX
+    try:
+        writes = set(parse_mix(args.mix)) & set(WRITE_OPERATIONS)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.url and writes and not args.allow_writes:
+        parser.error(
+            f"{sorted(writes)} would modify the registry at {args.url}; pass --allow-writes"
+        )
+    worker_counts: List[Optional[int]] = [None] if args.url else list(args.workers)
+    runs = []
+    for workers in worker_counts:
+        report = asyncio.run(run_once(args, workers))
+        _print_run(report)
+        runs.append(report)
+    args.output.write_text(json.dumps({"runs": runs}, indent=2, sort_keys=True))
+    print(f"\nresults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Run the engine micro-benchmarks and compare them with a stored baseline.
+
+Usage::
+
+    python -m benchmarks.run                    # full sizes, compare with baseline
+    python -m benchmarks.run --quick -k drift   # small sizes, drift cases only
+    python -m benchmarks.run --update-baseline  # record this machine's baseline
+
+Each case is calibrated so one round takes at least ``--min-time`` seconds and then
+timed for ``--rounds`` rounds. The fastest round's per-call time is the tracked
+statistic, since slower rounds mostly measure scheduler and cache noise. The run
+exits with status 1 when a case present in the baseline is slower by more than
+``--threshold`` percent (``MLOPS_BENCH_THRESHOLD``, default 25). Baselines are only
+comparable on the machine that recorded them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.cases import CASES  # noqa: E402
+
+BASELINE_FILE = ROOT / "benchmarks" / "baseline.json"
+RESULTS_FILE = ROOT / "bench-results.json"
+DEFAULT_THRESHOLD = float(os.getenv("MLOPS_BENCH_THRESHOLD", "25"))
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME = 0.2
+TRACKED_STAT = "min_s"
+
+
+def measure(func: Callable[[], Any], rounds: int, min_time: float) -> Dict[str, Any]:
+    """Time ``func`` per call: calibrate the loop count, then run ``rounds`` rounds.
+
+    As in ``timeit``, the garbage collector is paused while timing so collections
+    triggered by earlier cases do not land in this one.
+    """
+
+    func()
+    gc.collect()
+    gc.disable()
+    try:
+        return _timed_rounds(func, rounds, min_time)
+    finally:
+        gc.enable()
+
+
+def _timed_rounds(func: Callable[[], Any], rounds: int, min_time: float) -> Dict[str, Any]:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    per_call = [elapsed / loops]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter() - start) / loops)
+    return {
+        "loops": loops,
+        "rounds": rounds,
+        "min_s": min(per_call),
+        "median_s": statistics.median(per_call),
+        "mean_s": statistics.fmean(per_call),
+        "stdev_s": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold_pct: float,
+) -> List[Dict[str, Any]]:
+    """Return one row per case found in both runs, flagging slowdowns past the threshold."""
+
+    rows = []
+    for name in sorted(results.keys() & baseline.keys()):
+        previous = baseline[name][TRACKED_STAT]
+        current = results[name][TRACKED_STAT]
+        change = (current - previous) / previous * 100 if previous else 0.0
+        rows.append(
+            {
+                "case": name,
+                "baseline_s": previous,
+                "current_s": current,
+                "change_pct": round(change, 2),
+                "regressed": change > threshold_pct,
+            }
+        )
+    return rows
+
+
+def environment() -> Dict[str, Any]:
+    import numpy
+    import sklearn
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def run_cases(quick: bool, pattern: Optional[str], rounds: int, min_time: float) -> Dict:
+    """Run matching cases inside a scratch working directory and return their timings."""
+
+    results: Dict[str, Dict[str, Any]] = {}
+    origin = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="mlops-bench-") as scratch:
+        os.chdir(scratch)
+        Path("models").mkdir()
+        # Audit logging would only add writer-thread noise to the timings.
+        logging.disable(logging.INFO)
+        try:
+            for case in CASES:
+                for name, params in case.instances(quick):
+                    if pattern and pattern not in name:
+                        continue
+                    with case.factory(**params) as func:
+                        results[name] = {"params": params, **measure(func, rounds, min_time)}
+                    print(f"{name:<48} {results[name][TRACKED_STAT] * 1e3:>12.4f} ms", flush=True)
+        finally:
+            logging.disable(logging.NOTSET)
+            os.chdir(origin)
+    return results
+
+
+def _load(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--quick", action="store_true", help="smallest input sizes only; same timing rules"
+    )
+    parser.add_argument("-k", dest="pattern", help="only run cases whose id contains this")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument(
+        "--min-time", type=float, default=DEFAULT_MIN_TIME, help="minimum seconds per round"
+    )
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="percent")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.quick, args.pattern, args.rounds, args.min_time)
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": environment(),
+        "quick": args.quick,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"results written to {args.output}")
+
+    if args.update_baseline:
+        merged = {**_load(args.baseline), **results}
+        args.baseline.write_text(
+            json.dumps({**report, "results": merged}, indent=2, sort_keys=True)
+        )
+        print(f"baseline updated: {args.baseline}")
+        return 0
+
+    baseline = _load(args.baseline)
+    if not baseline:
+        print(f"no baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+    rows = compare(results, baseline, args.threshold)
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else "ok"
+        print(f"{row['case']:<48} {row['change_pct']:>+9.2f}%  {flag}")
+    regressions = [row for row in rows if row["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
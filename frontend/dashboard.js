@@ -1,11 +1,19 @@
+const POLL_INTERVAL_MS = 5000;
+let dashboardEtag = null;
+
 async function loadDashboard() {
   const metricsEl = document.getElementById('metrics');
   const registryEl = document.getElementById('registry');
   const deployedEl = document.getElementById('deployed');
   const alertsEl = document.getElementById('alerts');
   try {
-    const response = await fetch('/dashboard');
+    const headers = dashboardEtag ? { 'If-None-Match': dashboardEtag } : {};
+    const response = await fetch('/dashboard', { cache: 'no-store', headers });
+    if (response.status === 304) {
+      return;
+    }
     const data = await response.json();
+    dashboardEtag = response.headers.get('ETag');
     metricsEl.innerHTML = `<h2>Latest Metrics</h2><pre>${JSON.stringify(data.latest_metrics, null, 2)}</pre>`;
     registryEl.innerHTML = `<h2>Registry</h2><pre>${JSON.stringify(data.registry, null, 2)}</pre>`;
     deployedEl.innerHTML = `<h2>Deployed Model</h2><pre>${data.deployed_run_id ?? 'none'}</pre>`;
@@ -15,4 +23,7 @@ async function loadDashboard() {
   }
 }
 
-document.addEventListener('DOMContentLoaded', loadDashboard);
+document.addEventListener('DOMContentLoaded', () => {
+  loadDashboard();
+  setInterval(loadDashboard, POLL_INTERVAL_MS);
+});
@@ -1,4 +1,7 @@
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -7,6 +10,11 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Keep the shared digest cache (also used by spawned training workers) out of models/.
+os.environ["MLOPS_DIGEST_CACHE"] = str(
+    Path(tempfile.mkdtemp(prefix="mlops-tests-")) / "digest_cache.json"
+)
+
 
 @pytest.fixture(autouse=True)
 def restore_registry_state():
@@ -19,3 +27,5 @@ def restore_registry_state():
         registry_path.write_text(original)
     for model_file in (ROOT / "models").glob("model_*.joblib"):
         model_file.unlink(missing_ok=True)
+    for model_dir in (ROOT / "models").glob("model_*/"):
+        shutil.rmtree(model_dir, ignore_errors=True)
@@ -1,11 +1,48 @@
+import io
+import time
 from http import HTTPStatus
 
+import numpy as np
 from fastapi.testclient import TestClient
 
-from backend.main import app
+from backend import main
+from backend.engines import dashboard
+from backend.main import app, drift_detector
 
 client = TestClient(app)
 
+TRAIN_PAYLOAD = {
+    "records": [
+        {"feature1": 0.1, "feature2": 0.2, "feature3": 0.3, "label": 0},
+        {"feature1": 0.4, "feature2": 0.2, "feature3": 0.6, "label": 1},
+        {"feature1": 0.3, "feature2": 0.7, "feature3": 0.5, "label": 0},
+        {"feature1": 0.9, "feature2": 0.1, "feature3": 0.4, "label": 1},
+        {"feature1": 0.2, "feature2": 0.5, "feature3": 0.8, "label": 0},
+    ]
+}
+
+
+JOB_TIMEOUT_SECONDS = 60
+DASHBOARD_POLLS = 20
+
+
+def _wait_for_job(job_id):
+    deadline = time.monotonic() + JOB_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in {"succeeded", "failed", "cancelled"}:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def _train(payload):
+    response = client.post("/train", json=payload)
+    assert response.status_code == HTTPStatus.ACCEPTED
+    job = _wait_for_job(response.json()["job_id"])
+    assert job["status"] == "succeeded", job["error"]
+    return job
+
 
 def test_health_endpoint():
     response = client.get("/health")
@@ -21,18 +58,10 @@ def test_train_rejects_missing_fields():
 
 
 def test_deploy_requires_approval_and_sets_deployed_model():
-    payload = {
-        "records": [
-            {"feature1": 0.1, "feature2": 0.2, "feature3": 0.3, "label": 0},
-            {"feature1": 0.4, "feature2": 0.2, "feature3": 0.6, "label": 1},
-            {"feature1": 0.3, "feature2": 0.7, "feature3": 0.5, "label": 0},
-            {"feature1": 0.9, "feature2": 0.1, "feature3": 0.4, "label": 1},
-            {"feature1": 0.2, "feature2": 0.5, "feature3": 0.8, "label": 0},
-        ]
-    }
-    train_resp = client.post("/train", json=payload)
-    assert train_resp.status_code == HTTPStatus.OK
-    run_id = train_resp.json()["run_id"]
+    job = _train(TRAIN_PAYLOAD)
+    run_id = job["run_id"]
+    assert job["result"]["run_id"] == run_id
+    assert "fit" in job["timings"]
 
     # Deployment should be blocked until approval is granted.
     deploy_resp = client.post("/deploy", json={"run_id": run_id})
@@ -47,3 +76,127 @@ def test_deploy_requires_approval_and_sets_deployed_model():
     metrics_resp = client.get("/metrics")
     assert metrics_resp.status_code == HTTPStatus.OK
     assert "accuracy" in metrics_resp.json()
+
+    dashboard = client.get("/dashboard")
+    assert dashboard.status_code == HTTPStatus.OK
+    assert dashboard.json()["deployed_run_id"] == run_id
+    runs = {model["run_id"]: model for model in dashboard.json()["registry"]}
+    assert runs[run_id]["status"] == "deployed" and runs[run_id]["deployed"]
+    assert runs[run_id]["trained_at"] is not None
+    assert "baseline_profile" not in runs[run_id] and "signature" not in runs[run_id]
+
+
+def test_dashboard_revalidates_with_etag():
+    first = client.get("/dashboard")
+    etag = first.headers["etag"]
+    unchanged = client.get("/dashboard", headers={"If-None-Match": etag})
+    assert unchanged.status_code == HTTPStatus.NOT_MODIFIED
+    assert unchanged.content == b""
+
+    run_id = _train(TRAIN_PAYLOAD)["run_id"]
+    client.post("/approve_model", json={"run_id": run_id})
+    changed = client.get("/dashboard", headers={"If-None-Match": etag})
+    assert changed.status_code == HTTPStatus.OK
+    assert changed.headers["etag"] != etag
+    assert run_id in changed.json()["approvals"]
+    assert client.get("/serving/stats").json()["dashboard"]["not_modified"] >= 1
+
+
+def test_dashboard_polls_stay_cached_under_prediction_traffic(monkeypatch):
+    run_id = _train(TRAIN_PAYLOAD)["run_id"]
+    client.post("/approve_model", json={"run_id": run_id})
+    assert client.post("/deploy", json={"run_id": run_id}).status_code == HTTPStatus.OK
+    monkeypatch.setattr(dashboard, "DRIFT_REFRESH_SECONDS", 3600.0)
+
+    etag = client.get("/dashboard").headers["etag"]
+    builds = client.get("/serving/stats").json()["dashboard"]["builds"]
+    for index in range(DASHBOARD_POLLS):
+        row = {"feature1": index / 10, "feature2": 0.2, "feature3": 0.3}
+        assert client.post("/predict", json=row).status_code == HTTPStatus.OK
+        polled = client.get("/dashboard", headers={"If-None-Match": etag})
+        assert polled.status_code == HTTPStatus.NOT_MODIFIED
+    assert client.get("/serving/stats").json()["dashboard"]["builds"] == builds
+
+    monkeypatch.setattr(dashboard, "DRIFT_REFRESH_SECONDS", 0.0)
+    client.post("/predict/batch", json={"rows": [[50.0, 50.0, 50.0]] * DASHBOARD_POLLS})
+    refreshed = client.get("/dashboard", headers={"If-None-Match": etag})
+    assert refreshed.status_code == HTTPStatus.OK
+    assert refreshed.json()["drift_score"] > 0
+
+
+def test_batch_predict_accepts_rows_and_columns():
+    run_id = _train(TRAIN_PAYLOAD)["run_id"]
+    client.post("/approve_model", json={"run_id": run_id})
+    assert client.post("/deploy", json={"run_id": run_id}).status_code == HTTPStatus.OK
+    assert drift_detector.has_baseline
+
+    rows = [[0.1, 0.2, 0.3], [0.9, 0.1, 0.4], [0.3, 0.7, 0.5]]
+    columns = {f"feature{i + 1}": [row[i] for row in rows] for i in range(3)}
+    by_rows = client.post("/predict/batch", json={"rows": rows})
+    by_columns = client.post("/predict/batch", json={"columns": columns})
+    assert by_rows.status_code == HTTPStatus.OK
+    assert by_rows.json()["count"] == len(rows)
+    assert by_rows.json()["predictions"] == by_columns.json()["predictions"]
+
+    single = client.post("/predict", json={"feature1": 0.1, "feature2": 0.2, "feature3": 0.3})
+    assert single.json()["prediction"] == by_rows.json()["predictions"][0]
+    assert client.get("/serving/stats").json()["micro_batching"]["requests"] >= 1
+
+
+def test_batch_predict_rejects_ragged_columns():
+    columns = {"feature1": [0.1, 0.2], "feature2": [0.1], "feature3": [0.3, 0.4]}
+    response = client.post("/predict/batch", json={"columns": columns})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_train_upload_accepts_csv_and_npy_bodies():
+    rows = [
+        [r[c] for c in ("feature1", "feature2", "feature3", "label")]
+        for r in TRAIN_PAYLOAD["records"]
+    ]
+    csv_body = "feature1,feature2,feature3,label\n" + "\n".join(",".join(map(str, r)) for r in rows)
+    response = client.post("/train/upload", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert response.json()["ingest"]["rows"] == len(rows)
+    assert _wait_for_job(response.json()["job_id"])["status"] == "succeeded"
+
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(rows, dtype=float))
+    response = client.post(
+        "/train/upload", content=buffer.getvalue(), headers={"Content-Type": "application/x-npy"}
+    )
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert response.json()["ingest"]["format"] == "npy"
+    assert _wait_for_job(response.json()["job_id"])["status"] == "succeeded"
+
+
+def test_train_upload_rejects_unknown_types_and_oversized_bodies(monkeypatch):
+    response = client.post("/train/upload", content=b"{}", headers={"Content-Type": "text/plain"})
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 8)
+    response = client.post(
+        "/train/upload", content=b"a,b\n1,2\n3,4\n", headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+def test_unknown_job_returns_not_found():
+    assert client.get("/jobs/missing").status_code == HTTPStatus.NOT_FOUND
+    assert client.delete("/jobs/missing").status_code == HTTPStatus.NOT_FOUND
+
+
+def test_incremental_training_requires_known_parent():
+    payload = {**TRAIN_PAYLOAD, "parent_run_id": "missing"}
+    response = client.post("/train/incremental", json=payload)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_incremental_training_rejects_unusable_batches_up_front():
+    parent_run_id = _train(TRAIN_PAYLOAD)["run_id"]
+    single_class = [{**record, "label": 1} for record in TRAIN_PAYLOAD["records"]]
+    one_row = TRAIN_PAYLOAD["records"][:1]
+    for records in (single_class, one_row):
+        payload = {"records": records, "parent_run_id": parent_run_id}
+        response = client.post("/train/incremental", json=payload)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, response.json()
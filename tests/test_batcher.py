@@ -0,0 +1,75 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.engines.micro_batcher import MicroBatcher, MicroBatcherOverloadedError
+
+CONCURRENT_REQUESTS = 64
+
+
+def test_concurrent_rows_are_coalesced_and_fanned_out():
+    batch_sizes = []
+
+    def handler(matrix):
+        batch_sizes.append(len(matrix))
+        return matrix.sum(axis=1).tolist()
+
+    async def scenario():
+        batcher = MicroBatcher(handler, max_batch_rows=16, max_wait_seconds=0.01)
+        rows = [np.array([float(i), 1.0]) for i in range(CONCURRENT_REQUESTS)]
+        results = await asyncio.gather(*(batcher.submit(row) for row in rows))
+        return batcher, rows, results
+
+    batcher, rows, results = asyncio.run(scenario())
+    assert results == [row.sum() for row in rows]
+    assert sum(batch_sizes) == len(rows)
+    assert max(batch_sizes) <= batcher.max_batch_rows
+    assert batcher.stats()["batches"] < len(rows)
+
+
+def test_full_queue_rejects_and_handler_errors_propagate():
+    def failing(matrix):
+        raise LookupError("no model")
+
+    async def scenario():
+        batcher = MicroBatcher(failing, max_queue_depth=1)
+        first = asyncio.ensure_future(batcher.submit(np.zeros(2)))
+        await asyncio.sleep(0)
+        with pytest.raises(MicroBatcherOverloadedError):
+            await batcher.submit(np.zeros(2))
+        with pytest.raises(LookupError):
+            await first
+        return batcher
+
+    assert asyncio.run(scenario()).stats()["rejected"] == 1
+
+
+class _DispatcherAbort(BaseException):
+    pass
+
+
+def test_short_results_and_dispatcher_death_never_strand_callers():
+    behaviours = iter(["short", "abort"])
+
+    def handler(matrix):
+        behaviour = next(behaviours, "ok")
+        if behaviour == "short":
+            return [0.0]
+        if behaviour == "abort":
+            raise _DispatcherAbort
+        return matrix.sum(axis=1).tolist()
+
+    async def scenario():
+        batcher = MicroBatcher(handler, max_batch_rows=2, max_wait_seconds=0.05)
+        short = await asyncio.gather(
+            batcher.submit(np.zeros(2)), batcher.submit(np.zeros(2)), return_exceptions=True
+        )
+        with pytest.raises(RuntimeError, match="aborted"):
+            await batcher.submit(np.ones(2))
+        recovered = await batcher.submit(np.ones(2))
+        return short, recovered
+
+    short, recovered = asyncio.run(scenario())
+    assert all(isinstance(outcome, RuntimeError) for outcome in short)
+    assert recovered == np.ones(2).sum()
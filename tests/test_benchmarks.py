@@ -0,0 +1,65 @@
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.loadtest import Payloads, Sample, Traffic, main, parse_mix, summarize
+from benchmarks.run import compare
+
+THRESHOLD_PCT = 25.0
+LOAD_SECONDS = 2.0
+
+
+def test_compare_flags_only_regressions_past_threshold():
+    baseline = {"fast": {"min_s": 1.0}, "slow": {"min_s": 1.0}, "retired": {"min_s": 1.0}}
+    results = {"fast": {"min_s": 1.2}, "slow": {"min_s": 1.3}, "new": {"min_s": 9.0}}
+
+    rows = {row["case"]: row for row in compare(results, baseline, THRESHOLD_PCT)}
+
+    assert set(rows) == {"fast", "slow"}
+    assert not rows["fast"]["regressed"]
+    assert rows["slow"]["regressed"]
+
+
+def test_quick_cases_are_covered_by_full_sizes():
+    for case in CASES:
+        full = {name for name, _ in case.instances()}
+        assert {name for name, _ in case.instances(quick=True)} <= full
+
+
+def test_loadtest_mix_and_summary():
+    assert parse_mix("predict=3,dashboard=1") == {"predict": 0.75, "dashboard": 0.25}
+    with pytest.raises(ValueError):
+        parse_mix("predict=1,delete_everything=1")
+
+    samples = [Sample("predict", 200, 0.01), Sample("predict", 503, 0.02)]
+    samples.append(Sample("dashboard", 0, 0.5))
+    report = summarize(samples, LOAD_SECONDS)
+
+    assert report["all"]["requests"] == len(samples)
+    assert report["all"]["throughput_rps"] == len(samples) / LOAD_SECONDS
+    assert report["predict"]["statuses"] == {"200": 1, "503": 1}
+    assert report["dashboard"]["error_rate"] == 1.0
+    assert report["predict"]["p50_ms"] < report["predict"]["p99_ms"]
+
+
+def test_loadtest_never_writes_to_external_targets_by_default():
+    with pytest.raises(SystemExit):
+        main(["--url", "http://127.0.0.1:9", "--mix", "predict=9,deploy=1"])
+
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        if request.url.path == "/model/latest":
+            return httpx.Response(200, json={"run_id": "live-run"})
+        return httpx.Response(403)
+
+    async def deploy():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url="http://live") as client:
+            return await Traffic(client, Payloads(train_rows=1)).deploy()
+
+    assert asyncio.run(deploy()) == httpx.codes.FORBIDDEN
+    assert requested == ["/model/latest", "/deploy"]
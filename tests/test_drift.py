@@ -1,6 +1,10 @@
+import threading
+
 import numpy as np
 
-from backend.engines.drift_detector import DriftDetector
+from backend.engines.drift_detector import BaselineProfile, DriftDetector
+
+SWAPS = 300
 
 
 def test_psi_no_drift():
@@ -10,3 +14,65 @@ def test_psi_no_drift():
     detector.set_baseline(baseline)
     score = detector.score(np.array([0.15, 0.25, 0.35, 0.45]))
     assert score < threshold
+
+
+def test_no_baseline_does_not_adopt_first_request():
+    detector = DriftDetector()
+    assert detector.score(np.array([[0.1, 0.2, 0.3]])) == 0.0
+    assert not detector.has_baseline
+
+
+def test_sliding_window_detects_shift_and_evicts_old_values():
+    window_size = 500
+    rng = np.random.default_rng(0)
+    detector = DriftDetector(threshold=0.2, window_size=window_size)
+    detector.set_baseline(rng.normal(0, 1, size=(2000, 2)))
+
+    detector.score(rng.normal(0, 1, size=(window_size, 2)))
+    assert not detector.is_drifted()
+
+    for _ in range(window_size):
+        detector.score(rng.normal(3, 1, size=(1, 2)))
+    assert detector.window_observations == window_size
+    assert detector.is_drifted()
+
+
+def test_baseline_profile_roundtrip_and_merge_matches_full_data():
+    rng = np.random.default_rng(1)
+    first, second = rng.normal(size=(300, 3)), rng.normal(size=(200, 3))
+    profile = BaselineProfile.from_dict(BaselineProfile.from_matrix(first).to_dict())
+    merged = profile.merge_matrix(second)
+    full = np.vstack([first, second])
+    assert merged.count == len(full)
+    assert np.allclose(merged.mean, full.mean(axis=0))
+    assert np.allclose(merged.std, full.std(axis=0))
+    assert np.asarray(merged.counts).sum() == len(full) * full.shape[1]
+
+    detector = DriftDetector()
+    detector.load_profile(merged)
+    assert detector.score(full[:100]) < detector.threshold
+
+
+def test_concurrent_baseline_swaps_never_mix_edges_and_window():
+    rng = np.random.default_rng(5)
+    detector = DriftDetector(window_size=64)
+    baselines = [rng.normal(size=(200, 3)), rng.normal(size=(200, 2))]
+    detector.set_baseline(baselines[0])
+    unexpected = []
+
+    def scorer():
+        for _ in range(SWAPS):
+            try:
+                detector.score(rng.normal(size=(8, 3)))
+            except ValueError as exc:
+                if "expected 2 features" not in str(exc):
+                    unexpected.append(exc)
+            except Exception as exc:  # noqa: BLE001 - any other error is the bug
+                unexpected.append(exc)
+
+    thread = threading.Thread(target=scorer)
+    thread.start()
+    for index in range(SWAPS):
+        detector.set_baseline(baselines[index % 2])
+    thread.join()
+    assert unexpected == []
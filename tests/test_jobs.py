@@ -0,0 +1,53 @@
+import time
+
+import pandas as pd
+
+from backend.engines.job_queue import (
+    FINISHED_STATES,
+    JOB_CANCELLED,
+    JOB_SUCCEEDED,
+    TrainingJobQueue,
+)
+from backend.engines.trainer import new_run_id
+
+JOB_TIMEOUT_SECONDS = 120
+
+
+def _dataset():
+    return pd.DataFrame(
+        {
+            "feature1": [0.1, 0.4, 0.3, 0.9, 0.2, 0.7],
+            "feature2": [0.2, 0.2, 0.7, 0.1, 0.5, 0.3],
+            "feature3": [0.3, 0.6, 0.5, 0.4, 0.8, 0.9],
+            "label": [0, 1, 0, 1, 0, 1],
+        }
+    )
+
+
+def test_queued_job_can_be_cancelled_while_others_complete():
+    completed = []
+    queue = TrainingJobQueue(max_workers=1, on_complete=completed.append)
+    try:
+        jobs = [queue.submit(_dataset(), new_run_id()) for _ in range(3)]
+        assert len({job.run_id for job in jobs}) == len(jobs)
+        assert queue.cancel(jobs[-1].job_id)
+
+        deadline = time.monotonic() + JOB_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if all(queue.get(job.job_id).status in FINISHED_STATES for job in jobs):
+                break
+            time.sleep(0.05)
+
+        assert queue.get(jobs[-1].job_id).status == JOB_CANCELLED
+        for job in jobs[:-1]:
+            finished = queue.get(job.job_id)
+            assert finished.status == JOB_SUCCEEDED, finished.error
+            assert finished.result["metrics"]["accuracy"] >= 0
+            assert finished.created_at <= finished.started_at <= finished.finished_at
+        # One worker: the second job cannot start before the first one.
+        assert queue.get(jobs[1].job_id).started_at >= queue.get(jobs[0].job_id).started_at
+        assert queue.get(jobs[-1].job_id).started_at is None
+        assert [job.job_id for job in completed] == [job.job_id for job in jobs[:-1]]
+        assert not queue.cancel(jobs[0].job_id)
+    finally:
+        queue.shutdown()
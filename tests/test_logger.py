@@ -0,0 +1,34 @@
+import logging
+
+from backend.utils.logger import AuditRateLimiter, LogPipeline
+
+RECORDS = 2000
+
+
+def test_rate_limiter_suppresses_bursts_and_reports_them():
+    limiter = AuditRateLimiter({"drift/computed": 2})
+    admitted = [limiter.admit("drift/computed")[0] for _ in range(10)]
+    assert admitted.count(True) == limiter.limits["drift/computed"]
+    assert limiter.suppressed_total["drift/computed"] == admitted.count(False)
+    assert limiter.admit("deploy/initiated") == (True, 0)
+
+    limiter._buckets["drift/computed"] = (1.0, 0.0)
+    assert limiter.admit("drift/computed") == (True, admitted.count(False))
+
+
+def test_pipeline_drops_instead_of_blocking_when_saturated(tmp_path):
+    pipeline = LogPipeline(queue_size=1, log_file=tmp_path / "pipeline.log")
+    logger = logging.getLogger("tests.log_pipeline")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(pipeline.queue_handler)
+    try:
+        for index in range(RECORDS):
+            logger.info("event %s", index)
+    finally:
+        logger.removeHandler(pipeline.queue_handler)
+        pipeline.stop()
+    stats = pipeline.stats()
+    assert stats["dropped_total"] > 0
+    assert stats["written"] + stats["dropped_total"] == RECORDS
+    assert (tmp_path / "pipeline.log").read_text().count("event ") == stats["written"]
@@ -0,0 +1,51 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.utils.metrics import MetricsRegistry
+
+THREADS = 4
+OBSERVATIONS = 100
+
+
+def test_per_thread_shards_merge_into_cumulative_histograms():
+    registry = MetricsRegistry(buckets=(0.01, 0.1))
+
+    def worker():
+        for _ in range(OBSERVATIONS):
+            registry.observe("stage_duration_seconds", 0.05, component="c", stage="s")
+            registry.increment("events", kind="x")
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = registry.render_prometheus()
+    total = THREADS * OBSERVATIONS
+    assert 'mlops_stage_duration_seconds_bucket{component="c",stage="s",le="0.01"} 0' in text
+    assert (
+        f'mlops_stage_duration_seconds_bucket{{component="c",stage="s",le="+Inf"}} {total}' in text
+    )
+    assert f'mlops_events_total{{kind="x"}} {float(total)}' in text
+
+
+def test_exited_threads_fold_into_retired_shard():
+    registry = MetricsRegistry(buckets=(0.01,))
+    for _ in range(THREADS):
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            list(pool.map(lambda _: registry.increment("hashes"), range(OBSERVATIONS)))
+
+    assert not registry._shards
+    assert f"mlops_hashes_total {float(THREADS * OBSERVATIONS)}" in registry.render_prometheus()
+
+
+def test_prometheus_endpoint_reports_routes_by_template():
+    client = TestClient(app)
+    client.get("/jobs/unknown")
+    response = client.get("/metrics/prometheus")
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/jobs/{job_id}",status="404"' in response.text
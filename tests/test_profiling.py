@@ -0,0 +1,64 @@
+import pstats
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.utils import profiling
+
+TOKEN = "test-token"
+MAX_PROFILES = 2
+REQUESTS = 3
+
+
+def _profiled_app():
+    app = FastAPI()
+    app.middleware("http")(profiling.profile_requests)
+
+    @app.get("/work")
+    def work():
+        with profiling.profiled():
+            sorted(range(1000), reverse=True)
+        return {"ok": True}
+
+    return app
+
+
+def test_disabled_profiling_installs_nothing():
+    assert not profiling.PROFILING_ENABLED
+    assert profiling.profiled() is profiling.profiled()
+    assert all(
+        m.kwargs.get("dispatch") is not profiling.profile_requests for m in main.app.user_middleware
+    )
+
+
+def test_token_header_writes_bounded_profile_ring(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiling, "PROFILING_TOKEN", TOKEN)
+    monkeypatch.setattr(profiling, "PROFILE_DIR", tmp_path)
+    monkeypatch.setattr(profiling, "MAX_PROFILES", MAX_PROFILES)
+    client = TestClient(_profiled_app())
+
+    assert profiling.PROFILE_ID_HEADER not in client.get("/work").headers
+    wrong = client.get("/work", headers={profiling.PROFILE_HEADER: "guess"})
+    assert profiling.PROFILE_ID_HEADER not in wrong.headers
+
+    non_ascii = client.get("/work", headers={profiling.PROFILE_HEADER: "tökén".encode()})
+    assert profiling.PROFILE_ID_HEADER not in non_ascii.headers
+
+    headers = {profiling.PROFILE_HEADER: TOKEN, profiling.REQUEST_ID_HEADER: "req/../1"}
+    ids = [client.get("/work", headers=headers).headers[profiling.PROFILE_ID_HEADER]]
+    ids += [client.get("/work", headers=headers).headers[profiling.PROFILE_ID_HEADER]]
+    ids += [
+        client.get("/work", headers={profiling.PROFILE_HEADER: TOKEN}).headers[
+            profiling.PROFILE_ID_HEADER
+        ]
+        for _ in range(REQUESTS - 2)
+    ]
+
+    assert "-req1-" in ids[0]
+    assert len(set(ids)) == len(ids)
+    stored = sorted(tmp_path.glob("*.prof"))
+    assert len(stored) == MAX_PROFILES
+    functions = {name for (_, _, name) in pstats.Stats(str(stored[-1])).stats}
+    assert any("sorted" in name for name in functions)
@@ -1,4 +1,15 @@
-from backend.engines.model_registry import ModelRegistry
+import json
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from backend.engines.fast_predictor import LinearPredictor, compile_predictor
+from backend.engines.model_artifacts import load_linear_artifact, save_linear_artifact
+from backend.engines.model_cache import artifact_key
+from backend.engines.model_registry import REGISTRY_FILE, ModelRegistry
+from backend.engines.registry_store import SqliteRegistryStore
 
 
 def test_registry_register_and_list(tmp_path):
@@ -35,3 +46,155 @@ def test_mark_deployed_tracks_state(tmp_path):
     deployed = registry.deployed_model()
     assert deployed is not None
     assert deployed.run_id == "run-approved"
+
+
+def test_deployed_model_cache_reuses_loaded_artifact(tmp_path):
+    registry = ModelRegistry()
+    model_path = tmp_path / "cached.joblib"
+    joblib.dump({"weights": [1, 2, 3]}, model_path)
+    signature = registry.signer.sign_model(model_path)
+    registry.register_model(
+        run_id="run-cached",
+        model_path=model_path,
+        metrics={"accuracy": 0.9},
+        signature=signature,
+        metadata={"metrics": "{}"},
+    )
+    registry.approve("run-cached")
+    assert registry.mark_deployed("run-cached")
+
+    lookups = [registry.load_deployed() for _ in range(2)]
+    assert lookups[0] is lookups[1]
+    stats = registry.model_cache.stats()
+    assert stats["hits"] == len(lookups)
+    assert stats["misses"] == 0
+    assert stats["cached_run_id"] == "run-cached"
+
+    joblib.dump({"weights": [4, 5, 6, 7]}, model_path)
+    assert registry.load_deployed() == {"weights": [4, 5, 6, 7]}
+    assert registry.model_cache.stats()["misses"] == 1
+    assert registry.load_deployed_entry().serving_model == {"weights": [4, 5, 6, 7]}
+    assert not registry.model_cache.stats()["fast_path"]
+
+
+def test_registry_view_is_reused_until_file_changes(tmp_path):
+    registry = ModelRegistry()
+    dummy_model = tmp_path / "dummy.joblib"
+    dummy_model.write_text("placeholder")
+    for run_id in ("run-a", "run-b"):
+        registry.register_model(
+            run_id=run_id,
+            model_path=dummy_model,
+            metrics={"accuracy": 0.9},
+            signature="sig",
+            metadata={"metrics": "{}"},
+        )
+    store = registry.store
+    view = store.view()
+    generation = store.generation
+    assert registry.get_model("run-a") is view.index["run-a"]
+    assert store.view() is view
+    assert registry.latest_model().run_id == "run-b"
+
+    # Writes from other processes are picked up through the file stamp.
+    REGISTRY_FILE.write_text(json.dumps({"models": [], "deployed_run_id": None}))
+    assert registry.get_model("run-a") is None
+    assert store.generation > generation
+
+
+def test_sqlite_store_migrates_json_and_tracks_deployment(tmp_path):
+    legacy = tmp_path / "registry.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "models": [
+                    {
+                        "run_id": "legacy-1",
+                        "path": "models/model_legacy-1.joblib",
+                        "metrics": {"accuracy": 0.8},
+                        "signature": "sig",
+                        "metadata": {"metrics": "{}"},
+                        "approved": True,
+                    }
+                ],
+                "deployed_run_id": "legacy-1",
+            }
+        )
+    )
+    store = SqliteRegistryStore(tmp_path / "registry.db", json_path=legacy)
+    registry = ModelRegistry(store=store)
+    assert registry.deployed_model().run_id == "legacy-1"
+
+    version = registry.version()
+    registry.register_model(
+        run_id="run-new",
+        model_path=tmp_path / "missing.joblib",
+        metrics={"accuracy": 0.9},
+        signature="sig",
+        metadata={"metrics": "{}"},
+    )
+    assert registry.version() != version
+    assert not registry.mark_deployed("run-new")
+    assert registry.approve("run-new")
+    assert registry.mark_deployed("run-new")
+    assert registry.latest_model().run_id == "run-new"
+    assert [m.run_id for m in registry.list_models()] == ["legacy-1", "run-new"]
+
+    # Re-opening the database must not import the JSON registry twice.
+    reopened = SqliteRegistryStore(tmp_path / "registry.db", json_path=legacy)
+    assert reopened.deployed_model().run_id == "run-new"
+    assert len(reopened.list_models()) == len(registry.list_models())
+
+
+def test_npy_artifacts_are_memory_mapped_and_signed():
+    features = np.array([[0.1, 0.2, 0.3], [0.9, 0.8, 0.7], [0.2, 0.1, 0.4], [0.8, 0.9, 0.6]])
+    labels = np.array([0, 1, 0, 1])
+    model = LogisticRegression().fit(features, labels)
+    registry = ModelRegistry(artifact_format="npy")
+    path = registry.save_model(model, "npy-run")
+    signature = registry.signer.sign_model(path)
+
+    loaded = registry.load_model(path)
+    assert path.is_dir()
+    assert isinstance(loaded.coef_, np.memmap)
+    assert (loaded.predict(features) == model.predict(features)).all()
+    assert registry.signer.verify_model(path, signature)
+
+    key = artifact_key("npy-run", path, signature)
+    np.save(path / "intercept.npy", model.intercept_ + 1)
+    assert not registry.signer.verify_model(path, signature)
+    assert artifact_key("npy-run", path, signature) != key
+
+
+def test_npy_artifacts_keep_int_class_weights_and_are_never_overwritten(tmp_path):
+    features = np.array([[0.1, 0.2, 0.3], [0.9, 0.8, 0.7], [0.2, 0.1, 0.4], [0.8, 0.9, 0.6]])
+    labels = np.array([0, 1, 0, 1])
+    class_weight = {0: 1.0, 1: 3.0}
+    model = LogisticRegression(class_weight=class_weight).fit(features, labels)
+    path = save_linear_artifact(model, tmp_path / "model_weighted")
+
+    loaded = load_linear_artifact(path)
+    assert loaded.get_params()["class_weight"] == class_weight
+    loaded.fit(features, labels)
+
+    with pytest.raises(FileExistsError):
+        save_linear_artifact(LogisticRegression().fit(features, labels), path)
+    assert load_linear_artifact(path).get_params()["class_weight"] == class_weight
+    assert [entry.name for entry in tmp_path.iterdir()] == ["model_weighted"]
+
+
+def test_fast_predictor_matches_sklearn_bit_for_bit():
+    rng = np.random.default_rng(7)
+    features = rng.normal(size=(200, 3))
+    labels = np.digitize(features[:, 0], [-0.5, 0.5])
+    for model in (
+        LogisticRegression().fit(features, labels > 0),
+        LogisticRegression().fit(features, labels),
+    ):
+        predictor = compile_predictor(model)
+        assert isinstance(predictor, LinearPredictor)
+        assert np.array_equal(
+            predictor.decision_function(features), model.decision_function(features)
+        )
+        assert np.array_equal(predictor.predict(features[:1]), model.predict(features[:1]))
+    assert compile_predictor({"weights": [1, 2, 3]}) is None
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.engines import model_signer
+from backend.engines.model_signer import DigestCache, ModelSigner
+from backend.utils.hash_utils import MMAP_THRESHOLD, sha256_file
+
+WRITERS = 4
+FILES_PER_WRITER = 30
+
+
+def test_sha256_file_matches_hashlib_for_buffered_and_mmap_paths(tmp_path):
+    for size in (10, MMAP_THRESHOLD + 1):
+        artifact = tmp_path / f"artifact_{size}.bin"
+        content = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+        artifact.write_bytes(content)
+        assert sha256_file(artifact) == hashlib.sha256(content).hexdigest()
+
+
+def test_digest_cache_persists_and_detects_rewrites(tmp_path):
+    cache_file = tmp_path / "digests.json"
+    artifact = tmp_path / "model.joblib"
+    artifact.write_bytes(b"model-v1")
+    signer = ModelSigner(DigestCache(cache_file))
+    signature = signer.sign_model(artifact)
+
+    restarted = ModelSigner(DigestCache(cache_file))
+    assert restarted.verify_model(artifact, signature)
+    assert restarted.digest_cache.hits == 1
+
+    artifact.write_bytes(b"model-v2")
+    assert restarted.verify_many([(artifact, signature), (tmp_path / "gone", signature)]) == [
+        False,
+        False,
+    ]
+
+
+def test_digest_cache_drops_forged_entries(tmp_path):
+    cache_file = tmp_path / "digests.json"
+    artifact = tmp_path / "model.joblib"
+    artifact.write_bytes(b"model-v1")
+    signer = ModelSigner(DigestCache(cache_file))
+    signature = signer.sign_model(artifact)
+    signed_digest = json.loads(cache_file.read_text())[DigestCache.key(artifact)][0]
+
+    # Tamper with the artifact, then map its new identity to the signed digest.
+    artifact.write_bytes(b"tampered")
+    forged_key = DigestCache.key(artifact)
+    forged = {forged_key: [signed_digest, "0" * len(signed_digest)]}
+    cache_file.write_text(json.dumps(forged))
+    restarted = ModelSigner(DigestCache(cache_file))
+    assert restarted.digest_cache.rejected == 1
+    assert not restarted.verify_model(artifact, signature)
+
+    cache_file.write_text(json.dumps({forged_key: signed_digest}))
+    assert not ModelSigner(DigestCache(cache_file)).verify_model(artifact, signature)
+
+
+def test_digest_cache_writes_once_per_artifact_and_merges_writers(tmp_path, monkeypatch):
+    cache_file = tmp_path / "digests.json"
+    artifact = tmp_path / "model_dir"
+    artifact.mkdir()
+    for index in range(FILES_PER_WRITER):
+        (artifact / f"part{index}.npy").write_bytes(bytes([index]))
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(
+        model_signer.os, "replace", lambda src, dst: replaced.append(dst) or real_replace(src, dst)
+    )
+    DigestCache(cache_file).digest(artifact)
+    assert len(replaced) == 1
+
+    def writer(index):
+        directory = tmp_path / f"writer{index}"
+        directory.mkdir()
+        cache = DigestCache(cache_file)
+        for part in range(FILES_PER_WRITER):
+            (directory / f"{part}.bin").write_bytes(f"{index}-{part}".encode())
+            cache.digest(directory / f"{part}.bin")
+
+    with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+        list(pool.map(writer, range(WRITERS)))
+    stored = json.loads(cache_file.read_text())
+    assert len(stored) == FILES_PER_WRITER * (WRITERS + 1)
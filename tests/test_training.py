@@ -1,6 +1,11 @@
+import json
+
+import numpy as np
 import pandas as pd
 
+from backend.engines.adversarial_tests import DEFAULT_EPSILONS, AdversarialTester
 from backend.engines.model_registry import ModelRegistry
+from backend.engines.model_search import SearchSpace, run_search
 from backend.engines.trainer import Trainer
 
 
@@ -21,3 +26,87 @@ def test_training_pipeline():
     df = sample_df()
     output = trainer.train(df, run_id="test123")
     assert output.metrics["accuracy"] >= 0
+
+
+def test_incremental_training_links_parent_and_merges_baseline():
+    registry = ModelRegistry()
+    trainer = Trainer(registry)
+    trainer.train(sample_df(), run_id="parent123")
+
+    child = trainer.train_incremental(sample_df(), "child123", parent_run_id="parent123")
+    record = registry.get_model("child123")
+    assert child.metadata["parent_run_id"] == "parent123"
+    assert child.metadata["training_mode"] == "incremental"
+    assert record.baseline_profile["count"] == 2 * len(sample_df())
+
+    single_class = sample_df().assign(label=1)
+    grandchild = trainer.train_incremental(single_class, "grandchild123", parent_run_id="child123")
+    assert grandchild.metadata["parent_model"] == "SGDClassifier"
+    assert grandchild.metadata["rows_trained"] == str(len(sample_df()) - 1)
+
+
+WARM_START_BATCHES = (10, 20, 50)
+WARM_START_ACCURACY_TOLERANCE = 0.02
+
+
+def _separable_df(rng, rows):
+    features = rng.normal(size=(rows, 3))
+    df = pd.DataFrame(features, columns=["feature1", "feature2", "feature3"])
+    df["label"] = (features @ np.array([2.0, -1.0, 0.5]) + 0.3 > 0).astype(int)
+    return df
+
+
+def test_incremental_training_keeps_parent_accuracy_on_small_batches():
+    rng = np.random.default_rng(7)
+    registry = ModelRegistry()
+    trainer = Trainer(registry)
+    trainer.train(_separable_df(rng, 1000), run_id="warmparent")
+    holdout = _separable_df(rng, 2000)
+    X, y = holdout[["feature1", "feature2", "feature3"]].values, holdout["label"].values
+    parent_accuracy = registry.load_run("warmparent").score(X, y)
+
+    for rows in WARM_START_BATCHES:
+        run_id = f"warmchild{rows}"
+        trainer.train_incremental(_separable_df(rng, rows), run_id, parent_run_id="warmparent")
+        child_accuracy = registry.load_run(run_id).score(X, y)
+        assert child_accuracy >= parent_accuracy - WARM_START_ACCURACY_TOLERANCE, rows
+
+
+def test_search_registers_winner_with_leaderboard():
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(40, 3))
+    df = pd.DataFrame(features, columns=["feature1", "feature2", "feature3"])
+    df["label"] = (features[:, 0] > 0).astype(int)
+    space = SearchSpace(params={"C": [0.01, 1.0], "solver": ["lbfgs"]}, cv_folds=2, n_jobs=2)
+
+    output = Trainer(ModelRegistry()).train(df, run_id="search123", search=space)
+    search = json.loads(output.metadata["search"])
+    assert len(search["leaderboard"]) == len(space.candidates())
+    assert search["best_params"] == search["leaderboard"][0]["params"]
+    assert all(row["fit_seconds"] > 0 for row in search["leaderboard"])
+
+
+def test_search_holdout_keeps_both_classes_in_training_rows():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(12, 3))
+    y = np.array([1, 1] + [0] * 10)
+    for seed in range(20):
+        space = SearchSpace(params={"C": [1.0]}, n_jobs=1, random_state=seed)
+        result = run_search(space, X, y)
+        assert result.leaderboard[0]["error"] is None
+
+
+def test_adversarial_report_is_seeded_and_timings_recorded():
+    registry = ModelRegistry()
+    output = Trainer(registry).train(sample_df(), run_id="adv123")
+    report = json.loads(output.metadata["adversarial"])
+    assert set(report["per_epsilon"]) == {str(eps) for eps in DEFAULT_EPSILONS}
+    assert all(stats["min"] <= stats["mean"] for stats in report["per_epsilon"].values())
+    timings = json.loads(output.metadata["stage_timings"])
+    assert {"fit", "evaluate", "adversarial", "fairness", "save", "sign"} <= set(timings)
+
+    tester = AdversarialTester()
+    model = registry.load_model(output.model_path)
+    features = sample_df()[["feature1", "feature2", "feature3"]].to_numpy()
+    labels = sample_df()["label"].to_numpy()
+    assert tester.evaluate(model, features, labels) == tester.evaluate(model, features, labels)
@@ -1,6 +1,13 @@
+import numpy as np
 import pandas as pd
 
 from backend.engines.data_validator import DataValidator
+from backend.engines.pii_scanner import PIIScanner
+from backend.utils.hash_utils import (
+    FINGERPRINT_SCHEME,
+    DatasetFingerprinter,
+    fingerprint_dataframe,
+)
 
 
 def test_validator_returns_fingerprint_and_quality():
@@ -14,3 +21,95 @@ def test_validator_returns_fingerprint_and_quality():
     result = validator.validate(df)
     assert result.dataset_fingerprint
     assert 0 <= result.data_quality_score <= 1
+
+
+def test_columnar_schema_reports_offending_rows():
+    validator = DataValidator()
+    df = pd.DataFrame(
+        {
+            "feature1": [0.1, float("nan"), 0.3, 0.4],
+            "feature2": [0.2, 0.1, "oops", 0.2],
+            "feature3": [0.3, 0.2, 0.1, float("inf")],
+            "label": [0, 1, 2, 1],
+        }
+    )
+    result = validator.validate(df)
+    assert not result.is_valid
+    issues = "\n".join(result.issues)
+    assert "column 'feature1' has missing or non-finite values in 1 rows (first rows [1])" in issues
+    assert "column 'feature2' has non-numeric values in 1 rows (first rows [2])" in issues
+    assert "column 'feature3' has missing or non-finite values in 1 rows (first rows [3])" in issues
+    assert "label must be 0 or 1 in 1 rows (first rows [2])" in issues
+
+
+def test_columnar_fingerprint_is_chunk_invariant_and_sensitive():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "feature1": rng.normal(size=1000),
+            "note": [f"row-{i}" for i in range(1000)],
+            "label": rng.integers(0, 2, size=1000),
+        }
+    )
+    chunked = DatasetFingerprinter(chunk_rows=64)
+    for start in range(0, len(df), 300):
+        chunked.update(df.iloc[start : start + 300])
+    assert chunked.hexdigest() == fingerprint_dataframe(df)
+
+    changed = df.copy()
+    changed.loc[10, "feature1"] += 1e-9
+    assert fingerprint_dataframe(changed) != fingerprint_dataframe(df)
+    assert DataValidator().validate(df).fingerprint_scheme == FINGERPRINT_SCHEME
+
+
+def test_pii_scanner_skips_numeric_columns_and_counts_patterns():
+    validator = DataValidator(pii_scanner=PIIScanner(sample_rows=50))
+    df = pd.DataFrame(
+        {
+            "feature1": np.arange(200, dtype=float),
+            "contact": ["alice@example.com", "call +1 555-123-4567", "n/a", None] * 50,
+        }
+    )
+    result = validator.validate(df)
+    report = result.pii_report
+    assert "Possible PII detected in columns: ['contact']" in result.issues
+    assert report["skipped_columns"] == ["feature1"]
+    assert report["sampled"] is True
+    assert report["hits"]["contact"]["email"] > 0
+    assert report["hits"]["contact"]["phone"] > 0
+
+
+def test_validate_path_streams_chunks_with_in_memory_results(tmp_path):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(
+        {
+            "feature1": rng.normal(size=500).round(3),
+            "feature2": rng.normal(size=500).round(3),
+            "feature3": rng.normal(size=500).round(3),
+            "label": rng.integers(0, 2, size=500),
+        }
+    )
+    df.loc[42, "feature2"] = 25.0
+    path = tmp_path / "dataset.csv"
+    df.to_csv(path, index=False)
+
+    validator = DataValidator()
+    streamed = validator.validate_path(path, chunk_rows=37)
+    in_memory = validator.validate(df)
+    assert streamed.issues == in_memory.issues
+    assert streamed.data_quality_score == in_memory.data_quality_score
+    assert streamed.dataset_fingerprint == validator.validate_path(path).dataset_fingerprint
+
+
+def test_validate_path_reports_bad_values_in_later_chunks(tmp_path):
+    rows = [f"{i / 100},{i / 50},{i / 25},{i % 2}" for i in range(50)]
+    rows += ["0.1,0.2,0.3,", "0.1,oops,0.3,1"]
+    path = tmp_path / "dataset.csv"
+    path.write_text("feature1,feature2,feature3,label\n" + "\n".join(rows) + "\n")
+
+    validator = DataValidator()
+    streamed = validator.validate_path(path, chunk_rows=10)
+    in_memory = validator.validate(pd.read_csv(path))
+    assert streamed.issues == in_memory.issues
+    assert any("'feature2' has non-numeric values" in issue for issue in streamed.issues)
+    assert streamed.dataset_fingerprint == in_memory.dataset_fingerprint